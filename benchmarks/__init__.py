@@ -0,0 +1 @@
+# turns current folder into module
\ No newline at end of file
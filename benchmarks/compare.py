@@ -0,0 +1,70 @@
+"""
+Compare two result files of the benchmark suite (e.g. of two releases).
+
+Prints the median time of every measurement in both files, and the ratio
+of the new median to the base median (below 1 is faster).
+
+Run with: python -m benchmarks.compare base.json new.json
+"""
+
+import argparse
+
+from benchmarks.harness import read_results, result_key
+
+
+def compare(base, new):
+    """
+    Match the measurements of two result files.
+
+    Parameters
+    ----------
+    base: dict
+        base results (see `benchmarks.harness.read_results`)
+    new: dict
+        new results
+
+    Returns
+    -------
+    list of tuple
+        (base result, new result, new median / base median) of every
+        measurement found in both files
+    """
+    base_results = {result_key(r): r for r in base["results"]}
+    rows = []
+    for result in new["results"]:
+        base_result = base_results.get(result_key(result))
+        if base_result is None:
+            continue
+        ratio = (
+            result["median"] / base_result["median"]
+            if base_result["median"] > 0
+            else float("inf")
+        )
+        rows.append((base_result, result, ratio))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("base", help="JSON results of the base version")
+    parser.add_argument("new", help="JSON results of the new version")
+    args = parser.parse_args(argv)
+
+    base, new = read_results(args.base), read_results(args.new)
+    for label, data in [("base", base), ("new", new)]:
+        env = data["environment"]
+        print(
+            f"{label}: eckity {env['eckity']} ({env['commit']}), "
+            f"python {env['python']}, {env['processor']}"
+        )
+    for base_result, result, ratio in compare(base, new):
+        params = ", ".join(f"{k}={v}" for k, v in result["params"].items())
+        print(
+            f"{result['case']:<16} {result['name']:<32} {params:<60} "
+            f"{base_result['median'] * 1e3:>10.3f}ms "
+            f"{result['median'] * 1e3:>10.3f}ms {ratio:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
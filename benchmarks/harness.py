@@ -0,0 +1,150 @@
+"""
+Timing and result-file utilities of the benchmark suite.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+import eckity
+
+RESULTS_VERSION = 1
+
+
+def measure(
+    case: str,
+    name: str,
+    params: Dict[str, Any],
+    setup: Callable[[], Any],
+    run: Callable[[Any], Any],
+    n_items: int,
+    repeats: int = 5,
+) -> Dict[str, Any]:
+    """
+    Time a benchmark case.
+
+    `setup` is called before every repeat (untimed), and its result is
+    passed to `run`, which is timed. Setting up every repeat keeps
+    in-place operators from running on the output of the previous repeat.
+
+    Parameters
+    ----------
+    case: str
+        benchmark case (e.g. "selection")
+    name: str
+        measured object within the case (e.g. "TournamentSelection")
+    params: Dict[str, Any]
+        parameters of the measurement (population size, depth, ...)
+    setup: Callable[[], Any]
+        creates the input of a repeat
+    run: Callable[[Any], Any]
+        the measured code
+    n_items: int
+        number of items (individuals, trees, ...) processed by a run,
+        for the throughput
+    repeats: int, default=5
+        number of timed runs
+
+    Returns
+    -------
+    Dict[str, Any]
+        result record, with the run times (in seconds), their minimum and
+        median, and the throughput (items per second, by the median)
+    """
+    times = []
+    for _ in range(repeats):
+        state = setup()
+        start = perf_counter()
+        run(state)
+        times.append(perf_counter() - start)
+
+    median_time = median(times)
+    return {
+        "case": case,
+        "name": name,
+        "params": params,
+        "repeats": repeats,
+        "times": times,
+        "min": min(times),
+        "median": median_time,
+        "items": n_items,
+        "throughput": n_items / median_time if median_time > 0 else None,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Describe the environment of a benchmark run, to compare results
+    of the same machine and library versions.
+    """
+    return {
+        "eckity": eckity.__version__,
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def write_results(path: str, results: List[Dict[str, Any]]) -> None:
+    """
+    Write benchmark results to a JSON file, with the environment.
+    """
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "version": RESULTS_VERSION,
+                "environment": environment(),
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+
+
+def read_results(path: str) -> Dict[str, Any]:
+    """
+    Read a JSON file written by `write_results`.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            f"Unsupported results version {data.get('version')} in {path}"
+        )
+    return data
+
+
+def result_key(result: Dict[str, Any]) -> tuple:
+    """
+    Return a key that identifies a measurement across result files.
+    """
+    return (
+        result["case"],
+        result["name"],
+        tuple(sorted(result["params"].items())),
+    )
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
@@ -0,0 +1,440 @@
+"""
+Throughput benchmarks of the core hot paths: tree creation, tree
+operators, selection, tree execution, vector operators, NSGA-II front
+sorting, and end-to-end evolution with thread and process executors.
+
+Every case is parameterized by population size, and by tree depth or
+vector length where relevant. The results are written to a JSON file
+(see `benchmarks.harness`), to compare releases with
+`python -m benchmarks.compare`.
+
+Run with: python -m benchmarks.suite --output results.json
+(see --help for the parameters)
+"""
+
+import argparse
+import logging
+import os
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from benchmarks.harness import measure, write_results
+from eckity.algorithms import SimpleEvolution
+from eckity.algorithms.executor_manager import executor_manager
+from eckity.base.untyped_functions import f_add, f_div, f_mul, f_sub
+from eckity.creators import (
+    FullCreator,
+    GABitStringVectorCreator,
+    GAFloatVectorCreator,
+    GAVectorCreator,
+    GrowCreator,
+    HalfCreator,
+)
+from eckity.evaluators import SimpleIndividualEvaluator
+from eckity.genetic_operators import (
+    BitStringVectorFlipMutation,
+    ElitismSelection,
+    ERCMutation,
+    FitnessProportionateSelection,
+    FloatVectorGaussNPointMutation,
+    FloatVectorUniformNPointMutation,
+    SubtreeCrossover,
+    SubtreeMutation,
+    TournamentSelection,
+    VectorKPointsCrossover,
+)
+from eckity.genetic_encodings.ga import FloatVector
+from eckity.genetic_encodings.gp.tree.utils import create_terminal_set
+from eckity.multi_objective_evolution.nsga2_fitness import NSGA2Fitness
+from eckity.multi_objective_evolution.nsga2_front_sorting import (
+    NSGA2FrontSorting,
+)
+from eckity.population import Population
+from eckity.random import RNG
+from eckity.subpopulation import Subpopulation
+
+FUNCTION_SET = [f_add, f_sub, f_mul, f_div]
+N_FEATURES = 3
+
+
+class BenchmarkEvaluator(SimpleIndividualEvaluator):
+    """
+    CPU-bound evaluator of bit string vectors (OneMax, computed with a
+    Python loop so the cost grows with the vector length).
+    """
+
+    def evaluate_individual(self, individual):
+        total = 0
+        for bit in individual.vector:
+            total += bit
+        return total
+
+
+def _creators(depth):
+    kwargs = dict(
+        init_depth=(depth, depth),
+        function_set=FUNCTION_SET,
+        terminal_set=create_terminal_set(np.zeros((1, N_FEATURES))),
+        erc_range=(-1.0, 1.0),
+    )
+    # GrowCreator and FullCreator are the two GPTreeCreator methods,
+    # and HalfCreator mixes them
+    return {
+        "GrowCreator": GrowCreator(**kwargs),
+        "FullCreator": FullCreator(**kwargs),
+        "HalfCreator": HalfCreator(**kwargs),
+    }
+
+
+def _trees(n, depth):
+    RNG().set_seed(0)
+    return _creators(depth)["HalfCreator"].create_individuals(
+        n, higher_is_better=False
+    )
+
+
+def _seeded(setup: Callable[[], Any]) -> Callable[[], Any]:
+    # every repeat draws the same random numbers
+    def seeded_setup():
+        state = setup()
+        RNG().set_seed(1)
+        return state
+
+    return seeded_setup
+
+
+def bench_tree_creation(population_sizes, depths, repeats):
+    results = []
+    for n in population_sizes:
+        for depth in depths:
+            for name, creator in _creators(depth).items():
+                results.append(
+                    measure(
+                        "tree_creation",
+                        name,
+                        {"population_size": n, "depth": depth},
+                        _seeded(lambda: None),
+                        lambda _, c=creator, n=n: c.create_individuals(
+                            n, higher_is_better=False
+                        ),
+                        n_items=n,
+                        repeats=repeats,
+                    )
+                )
+    return results
+
+
+def bench_tree_operators(population_sizes, depths, repeats):
+    results = []
+    for n in population_sizes:
+        for depth in depths:
+            trees = _trees(n, depth)
+            operators = [
+                SubtreeCrossover(probability=1.0),
+                SubtreeMutation(probability=1.0, init_depth=(2, depth)),
+                ERCMutation(probability=1.0),
+            ]
+            for operator in operators:
+                results.append(
+                    measure(
+                        "tree_operators",
+                        type(operator).__name__,
+                        {"population_size": n, "depth": depth},
+                        _seeded(lambda: [tree.clone() for tree in trees]),
+                        operator.apply_operator_batch,
+                        n_items=n,
+                        repeats=repeats,
+                    )
+                )
+    return results
+
+
+def bench_selection(population_sizes, repeats):
+    results = []
+    for n in population_sizes:
+        individuals = GABitStringVectorCreator(length=8).create_individuals(
+            n, higher_is_better=True
+        )
+        scores = np.random.default_rng(0).uniform(1, 100, n)
+        for ind, score in zip(individuals, scores):
+            ind.fitness.set_fitness(float(score))
+
+        methods = [
+            TournamentSelection(tournament_size=4, higher_is_better=True),
+            FitnessProportionateSelection(higher_is_better=True),
+            ElitismSelection(num_elites=n // 10, higher_is_better=True),
+        ]
+        for method in methods:
+            results.append(
+                measure(
+                    "selection",
+                    type(method).__name__,
+                    {"population_size": n},
+                    _seeded(list),
+                    lambda dest, m=method: m.select(individuals, dest),
+                    n_items=n,
+                    repeats=repeats,
+                )
+            )
+    return results
+
+
+def bench_tree_execution(population_sizes, depths, repeats, n_samples=200):
+    results = []
+    X = np.random.default_rng(0).uniform(-100, 100, (n_samples, N_FEATURES))
+    for n in population_sizes:
+        for depth in depths:
+            trees = _trees(n, depth)
+            compiled = [tree.clone() for tree in trees]
+            for tree in compiled:
+                tree.compile()
+
+            def run(trees):
+                for tree in trees:
+                    tree.execute(X)
+
+            for name, population in [
+                ("Tree.execute", trees),
+                ("Tree.execute (compiled)", compiled),
+            ]:
+                results.append(
+                    measure(
+                        "tree_execution",
+                        name,
+                        {
+                            "population_size": n,
+                            "depth": depth,
+                            "n_samples": n_samples,
+                        },
+                        lambda population=population: population,
+                        run,
+                        n_items=n,
+                        repeats=repeats,
+                    )
+                )
+    return results
+
+
+def bench_vector_operators(population_sizes, vector_lengths, repeats):
+    results = []
+    for n in population_sizes:
+        for length in vector_lengths:
+            for as_matrix in [False, True]:
+                bit_vectors = GABitStringVectorCreator(
+                    length=length, as_matrix=as_matrix
+                ).create_individuals(n, higher_is_better=True)
+                float_vectors = GAFloatVectorCreator(
+                    length=length, bounds=(-1.0, 1.0), as_matrix=as_matrix
+                ).create_individuals(n, higher_is_better=True)
+                cases = [
+                    (VectorKPointsCrossover(k=2), bit_vectors),
+                    (BitStringVectorFlipMutation(1.0), bit_vectors),
+                    (
+                        FloatVectorUniformNPointMutation(n=3, probability=1.0),
+                        float_vectors,
+                    ),
+                    (
+                        FloatVectorGaussNPointMutation(
+                            n=3, probability=1.0, sigma=0.1
+                        ),
+                        float_vectors,
+                    ),
+                ]
+                for operator, vectors in cases:
+                    results.append(
+                        measure(
+                            "vector_operators",
+                            type(operator).__name__,
+                            {
+                                "population_size": n,
+                                "vector_length": length,
+                                "as_matrix": as_matrix,
+                            },
+                            # the operators are applied in-place, and
+                            # their input does not affect the cost
+                            _seeded(lambda vectors=vectors: vectors),
+                            operator.apply_operator_batch,
+                            n_items=n,
+                            repeats=repeats,
+                        )
+                    )
+    return results
+
+
+def bench_nsga2_sorting(population_sizes, repeats, objectives=(2, 3)):
+    results = []
+    sorting = NSGA2FrontSorting()
+    for n in population_sizes:
+        for n_objectives in objectives:
+            # the (mu + lambda) pool of the parents and the offspring
+            pool = GAVectorCreator(
+                length=1, vector_type=FloatVector, fitness_type=NSGA2Fitness
+            ).create_individuals(2 * n, higher_is_better=False)
+            values = np.random.default_rng(0).random((2 * n, n_objectives))
+            for ind, row in zip(pool, values.tolist()):
+                ind.fitness.set_fitness(row)
+
+            sub_population = Subpopulation(
+                BenchmarkEvaluator(),
+                creators=GABitStringVectorCreator(length=1),
+                operators_sequence=[BitStringVectorFlipMutation()],
+            )
+            population = Population([sub_population])
+
+            def setup(pool=pool, population=population):
+                population.sub_populations[0].individuals = list(pool)
+                return population
+
+            results.append(
+                measure(
+                    "nsga2_sorting",
+                    "NSGA2FrontSorting",
+                    {"population_size": n, "n_objectives": n_objectives},
+                    setup,
+                    lambda population, n=n: sorting.select_for_population(
+                        population, n
+                    ),
+                    n_items=2 * n,
+                    repeats=repeats,
+                )
+            )
+    return results
+
+
+def bench_evolution(
+    population_sizes, vector_lengths, workers, repeats, generations=5
+):
+    results = []
+    for n in population_sizes:
+        for length in vector_lengths:
+            for executor in ["thread", "process"]:
+                for max_workers in workers:
+
+                    def setup(n=n, length=length, executor=executor,
+                              max_workers=max_workers):
+                        return SimpleEvolution(
+                            Subpopulation(
+                                BenchmarkEvaluator(),
+                                creators=GABitStringVectorCreator(
+                                    length=length
+                                ),
+                                operators_sequence=[
+                                    VectorKPointsCrossover(probability=0.7),
+                                    BitStringVectorFlipMutation(
+                                        probability=0.3
+                                    ),
+                                ],
+                                selection_methods=[
+                                    (
+                                        TournamentSelection(
+                                            tournament_size=4,
+                                            higher_is_better=True,
+                                        ),
+                                        1,
+                                    )
+                                ],
+                                population_size=n,
+                                higher_is_better=True,
+                            ),
+                            max_generation=generations,
+                            executor=executor,
+                            max_workers=max_workers,
+                            random_seed=0,
+                        )
+
+                    results.append(
+                        measure(
+                            "evolution",
+                            "SimpleEvolution",
+                            {
+                                "population_size": n,
+                                "vector_length": length,
+                                "executor": executor,
+                                "max_workers": max_workers,
+                                "generations": generations,
+                            },
+                            setup,
+                            lambda algo: algo.evolve(),
+                            # evaluations (including the initial population)
+                            n_items=n * (generations + 1),
+                            repeats=repeats,
+                        )
+                    )
+    executor_manager.shutdown()
+    return results
+
+
+CASES: Dict[str, Callable[[argparse.Namespace], List[Dict[str, Any]]]] = {
+    "tree_creation": lambda args: bench_tree_creation(
+        args.population_sizes, args.depths, args.repeats
+    ),
+    "tree_operators": lambda args: bench_tree_operators(
+        args.population_sizes, args.depths, args.repeats
+    ),
+    "selection": lambda args: bench_selection(
+        args.population_sizes, args.repeats
+    ),
+    "tree_execution": lambda args: bench_tree_execution(
+        args.population_sizes, args.depths, args.repeats
+    ),
+    "vector_operators": lambda args: bench_vector_operators(
+        args.population_sizes, args.vector_lengths, args.repeats
+    ),
+    "nsga2_sorting": lambda args: bench_nsga2_sorting(
+        args.population_sizes, args.repeats
+    ),
+    "evolution": lambda args: bench_evolution(
+        args.population_sizes, args.vector_lengths, args.workers, args.repeats
+    ),
+}
+
+
+def parse_args(argv=None):
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-o", "--output", default="benchmark_results.json",
+        help="JSON file of the results",
+    )
+    parser.add_argument(
+        "--cases", nargs="+", choices=list(CASES), default=list(CASES),
+        help="cases to run (all by default)",
+    )
+    parser.add_argument(
+        "--population-sizes", nargs="+", type=int, default=[100, 1000]
+    )
+    parser.add_argument("--depths", nargs="+", type=int, default=[4, 6])
+    parser.add_argument(
+        "--vector-lengths", nargs="+", type=int, default=[100, 1000]
+    )
+    parser.add_argument(
+        "--workers", nargs="+", type=int,
+        default=sorted({1, cpu_count}),
+        help="numbers of workers of the end-to-end evolution executors",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # the algorithms log their random seed on every run
+    logging.getLogger("eckity").setLevel(logging.WARNING)
+    results = []
+    for case in args.cases:
+        case_results = CASES[case](args)
+        for result in case_results:
+            params = ", ".join(f"{k}={v}" for k, v in result["params"].items())
+            print(
+                f"{case:<16} {result['name']:<32} {params:<60} "
+                f"{result['median'] * 1e3:>10.3f}ms "
+                f"{result['throughput']:>12.1f}/s"
+            )
+        results.extend(case_results)
+    write_results(args.output, results)
+    print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark the per-tree speedup of compiled tree execution
+(`Tree.compile`) over the recursive `Tree.execute`
+on a symbolic regression problem.
+
+Run with: python -m benchmarks.tree_execution
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from eckity.base.untyped_functions import f_add, f_div, f_mul, f_sub
+from eckity.creators import FullCreator
+from eckity.genetic_encodings.gp.tree.utils import create_terminal_set
+from eckity.random import RNG
+
+
+def time_trees(trees, X, repeats):
+    """
+    Return the average execution time (in seconds) of a single tree.
+    """
+    start = perf_counter()
+    for _ in range(repeats):
+        for tree in trees:
+            tree.execute(X)
+    return (perf_counter() - start) / (repeats * len(trees))
+
+
+def main(depths=range(4, 11), n_trees=50, n_samples=200, repeats=5):
+    RNG().set_seed(0)
+    X = np.random.uniform(-100, 100, size=(n_samples, 3))
+    terminal_set = create_terminal_set(X)
+
+    print(f"{'depth':>5} {'size':>6} {'recursive':>12} "
+          f"{'compile+run':>12} {'compiled':>12} {'speedup':>8}")
+    for depth in depths:
+        creator = FullCreator(
+            init_depth=(depth, depth),
+            function_set=[f_add, f_sub, f_mul, f_div],
+            terminal_set=terminal_set,
+            erc_range=(-1.0, 1.0),
+        )
+        trees = creator.create_individuals(n_trees, higher_is_better=False)
+
+        recursive = time_trees(trees, X, repeats)
+
+        # first execution pays for compilation
+        start = perf_counter()
+        for tree in trees:
+            tree.compile()
+            tree.execute(X)
+        first_run = (perf_counter() - start) / n_trees
+
+        compiled = time_trees(trees, X, repeats)
+
+        avg_size = np.mean([tree.size() for tree in trees])
+        print(
+            f"{depth:>5} {avg_size:>6.0f} {recursive * 1e3:>10.3f}ms "
+            f"{first_run * 1e3:>10.3f}ms {compiled * 1e3:>10.3f}ms "
+            f"{recursive / compiled:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
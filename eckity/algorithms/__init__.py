@@ -1,2 +1,7 @@
+from .executor_manager import ExecutorManager, executor_manager
+from .checkpointer import Checkpointer
+from .profiler import Profiler
 from .algorithm import Algorithm
 from .simple_evolution import SimpleEvolution
+from .steady_state_evolution import SteadyStateEvolution
+from .island_evolution import IslandEvolution
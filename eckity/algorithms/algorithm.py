@@ -5,13 +5,14 @@ This module implements the Algorithm class.
 import logging
 import sys
 from abc import ABC, abstractmethod
-from concurrent.futures.process import ProcessPoolExecutor
-from concurrent.futures.thread import ThreadPoolExecutor
 from time import time
 from typing import Any, Callable, Dict, List, Union
 
 from overrides import overrides
 
+from eckity.algorithms.checkpointer import Checkpointer
+from eckity.algorithms.executor_manager import executor_manager
+from eckity.algorithms.profiler import Profiler
 from eckity.population import Population
 from eckity.subpopulation import Subpopulation
 from eckity.breeders import Breeder
@@ -91,6 +92,13 @@ class Algorithm(Operator, ABC):
     generation_num: int, default=0
         Current generation number
 
+    checkpointer: Checkpointer, default=None
+        Writes periodic checkpoints of the evolution,
+        and resumes the evolution from the latest one.
+
+    profiler: Profiler, default=None
+        Records the time of every phase of each generation.
+
     Attributes
     ----------
     final_generation_: int
@@ -115,12 +123,21 @@ class Algorithm(Operator, ABC):
         executor: str = "process",
         max_workers: int = None,
         generation_num: int = 0,
+        checkpointer: Checkpointer = None,
+        profiler: Profiler = None,
     ):
 
         ext_event_names = event_names.copy() if event_names is not None else []
 
         ext_event_names.extend(
-            ["init", "evolution_finished", "after_generation"]
+            [
+                "init",
+                "evolution_finished",
+                "before_generation",
+                "after_generation",
+                "before_termination_check",
+                "after_termination_check",
+            ]
         )
         super().__init__(events=events, event_names=ext_event_names)
 
@@ -152,16 +169,22 @@ class Algorithm(Operator, ABC):
 
         self.max_workers = max_workers
 
-        if executor == "thread":
-            self.executor = ThreadPoolExecutor(max_workers=max_workers)
-        elif executor == "process":
-            self.executor = ProcessPoolExecutor(max_workers=max_workers)
-        else:
+        if executor not in ["thread", "process"]:
             raise ValueError('Executor must be either "thread" or "process"')
         self._executor_type = executor
+        # borrowed from the executor manager during the evolution
+        self.executor = None
 
         self.final_generation_ = 0
 
+        self.checkpointer = checkpointer
+        # first generation of the main loop (after the one resumed from)
+        self._first_generation = 1
+        if checkpointer is not None:
+            self.register("after_generation", checkpointer.write_checkpoint)
+            self.register("evolution_finished", checkpointer.flush)
+        self.profiler = profiler
+
     @overrides
     def apply_operator(self, payload):
         """
@@ -215,14 +238,39 @@ class Algorithm(Operator, ABC):
         """
         self.set_random_seed(self.random_seed)
         logger.info("random seed = %d", self.random_seed)
+
+        worker_init = self.population_evaluator.worker_initializer(
+            self.population
+        )
+        if worker_init is None:
+            worker_init = ()
+        if self.executor is not None:
+            # evolve was called again without finishing
+            executor_manager.release(self.executor)
+        self.executor = executor_manager.acquire(
+            self._executor_type, self.max_workers, *worker_init
+        )
         self.population_evaluator.set_executor(self.executor)
 
         for field in self.__dict__.values():
             if isinstance(field, Operator):
                 field.initialize()
 
+        if self.profiler is not None:
+            self.profiler.attach(self)
+
         self.create_population()
-        self.best_of_run_ = self.population_evaluator.act(self.population)
+        self._first_generation = 1
+        if self.checkpointer is not None and self.checkpointer.restore_latest(
+            self
+        ):
+            # the population is evaluated in the checkpoint
+            self._first_generation = self.generation_num + 1
+        else:
+            # individuals kept from a previous run (e.g. a second call to
+            # evolve) may hold fitness scores of a different evaluator
+            self.population.set_fitness_not_evaluated()
+            self.best_of_run_ = self.population_evaluator.act(self.population)
         self.publish("init")
 
     def _validate_population_type(self, population: Any) -> None:
@@ -279,13 +327,21 @@ class Algorithm(Operator, ABC):
         """
         # there was already "preprocessing" generation created - gen #0
         # now create another self.max_generation generations, starting gen #1
-        for gen in range(1, self.max_generation + 1):
+        # (or after the generation resumed from a checkpoint)
+        for gen in range(self._first_generation, self.max_generation + 1):
             self.generation_num = gen
+            self.publish("before_generation")
             self.update_gen(gen)
 
             self.set_generation_seed(self.next_seed())
             self.generation_iteration(gen)
-            if self.should_terminate(self.population, self.best_of_run_, gen):
+
+            self.publish("before_termination_check")
+            terminate = self.should_terminate(
+                self.population, self.best_of_run_, gen
+            )
+            self.publish("after_termination_check")
+            if terminate:
                 self.final_generation_ = gen
                 self.publish("after_generation")
                 break
@@ -327,7 +383,13 @@ class Algorithm(Operator, ABC):
         """
         Finish the evolutionary run
         """
-        self.executor.shutdown()
+        if self.profiler is not None:
+            self.profiler.detach()
+
+        # the executor is kept alive by the executor manager for reuse
+        if self.executor is not None:
+            executor_manager.release(self.executor)
+            self.executor = None
 
     def create_population(self) -> None:
         """
@@ -424,7 +486,7 @@ class Algorithm(Operator, ABC):
         """
         Return a dictionary of the Algorithm's fields and values.
         It is mainly used for serialization.
-        We remove executor field since it cannot be pickled.
+        We clear the executor field since it cannot be pickled.
 
         Returns
         -------
@@ -432,14 +494,14 @@ class Algorithm(Operator, ABC):
             Dictionary of {field name: field value} for the Algorithm object.
         """
         state = self.__dict__.copy()
-        del state["executor"]
+        state["executor"] = None
         return state
 
     def __setstate__(self, state: Dict[str, object]) -> None:
         """
         Set the __dict__ of the algorithm upon deserialization.
-        We update executor field according to the _executor_type field,
-        since the executor was removed in the serialization process.
+        The executor is borrowed from the executor manager when the
+        evolution starts, according to the _executor_type field.
 
         Parameters
         ----------
@@ -447,7 +509,4 @@ class Algorithm(Operator, ABC):
             Dictionary of {field name: field value} for the Algorithm object.
         """
         self.__dict__.update(state)
-        if self._executor_type == "thread":
-            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
-        else:
-            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self.executor = None
@@ -0,0 +1,432 @@
+"""
+This module implements the Checkpointer class.
+"""
+
+import logging
+import os
+import pickle
+import random
+import re
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from eckity.background_writer import BackgroundWriter, atomic_write
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+class Checkpointer:
+    """
+    Periodic checkpoints of an evolutionary run, to resume it after
+    the process stops.
+
+    Every `interval` generations (or `seconds` seconds) a snapshot of the
+    algorithm is written to `directory`: the genomes of every
+    sub-population (see `Individual.get_genome`) as arrays, their fitness
+    scores as columns, the best individual of the run, the generation
+    number and seed, and the state of the random generators.
+    Genomes and fitness scores that are not numeric (such as GP trees)
+    are pickled as a whole, without the rest of the individuals.
+
+    Snapshots are taken between generations, and written to disk by a
+    background thread while the next generation runs (unless
+    `asynchronous` is False). A snapshot is written to a temporary file
+    and then renamed, so a run that is stopped mid-write leaves the
+    previous snapshot intact. Only the last `keep` snapshots written
+    (or resumed from) by the checkpointer are kept.
+
+    An algorithm with a checkpointer resumes from the latest snapshot in
+    `directory` when it evolves (see `restore_latest`), instead of
+    evaluating a new initial population. The algorithm must be
+    configured as in the checkpointed run: the individuals are rebuilt
+    from the genomes, using the newly created individuals as templates.
+
+    Parameters
+    ----------
+    directory: str
+        directory of the checkpoint files (created if missing)
+
+    interval: int, default=1
+        number of generations between snapshots.
+        None to take snapshots by time only.
+
+    seconds: float, default=None
+        maximal time (in seconds) between snapshots.
+        None to take snapshots by generations only.
+
+    keep: int, default=3
+        number of snapshots to keep
+
+    resume: bool, default=True
+        resume from the latest snapshot in `directory` when evolving
+
+    asynchronous: bool, default=True
+        write the snapshots in a background thread
+
+    prefix: str, default="checkpoint"
+        prefix of the checkpoint file names
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        interval: Optional[int] = 1,
+        seconds: Optional[float] = None,
+        keep: int = 3,
+        resume: bool = True,
+        asynchronous: bool = True,
+        prefix: str = "checkpoint",
+    ):
+        if interval is None and seconds is None:
+            raise ValueError("Either interval or seconds must be set")
+        if interval is not None and interval < 1:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if seconds is not None and seconds <= 0:
+            raise ValueError(f"seconds must be positive, got {seconds}")
+        if keep < 1:
+            raise ValueError(f"keep must be positive, got {keep}")
+
+        self.directory = directory
+        self.interval = interval
+        self.seconds = seconds
+        self.keep = keep
+        self.resume = resume
+        self.prefix = prefix
+
+        # checkpoint files of this run, oldest first
+        self._written: List[str] = []
+        self._last_time = monotonic()
+        self._writer = BackgroundWriter(asynchronous)
+
+    def write_checkpoint(self, sender, data_dict) -> None:
+        """
+        Take a snapshot of the algorithm if one is due.
+        Registered to the `after_generation` event of the algorithm.
+
+        Parameters
+        ----------
+        sender: Algorithm
+            the algorithm that published the event
+
+        data_dict: dict(str, object)
+            event data (unused)
+        """
+        gen = sender.generation_num
+        due = self.interval is not None and gen % self.interval == 0
+        if self.seconds is not None:
+            due = due or monotonic() - self._last_time >= self.seconds
+        if due:
+            self.save(sender)
+
+    def save(self, algorithm) -> str:
+        """
+        Take a snapshot of the algorithm and write it to a checkpoint file.
+
+        Parameters
+        ----------
+        algorithm: Algorithm
+            the algorithm to checkpoint (between generations)
+
+        Returns
+        -------
+        str
+            path of the checkpoint file
+        """
+        self._last_time = monotonic()
+        arrays = _snapshot(algorithm)
+        path = self.checkpoint_path(algorithm.generation_num)
+
+        self._writer.submit(self._write, path, arrays)
+        return path
+
+    def flush(self, sender=None, data_dict=None) -> None:
+        """
+        Wait for the snapshot being written, if any.
+        Registered to the `evolution_finished` event of the algorithm.
+
+        Raises
+        ------
+        OSError
+            if writing the last snapshot failed
+        """
+        self._writer.join()
+
+    def checkpoint_path(self, generation_num: int) -> str:
+        """
+        Return the path of the checkpoint file of a generation.
+        """
+        return os.path.join(
+            self.directory, f"{self.prefix}-{generation_num:08d}.npz"
+        )
+
+    def list_checkpoints(self) -> List[str]:
+        """
+        Return the paths of the checkpoint files in the directory,
+        ordered by generation.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        pattern = re.compile(rf"{re.escape(self.prefix)}-(\d+)\.npz")
+        found = []
+        for name in os.listdir(self.directory):
+            match = pattern.fullmatch(name)
+            if match:
+                found.append((int(match.group(1)), name))
+        return [
+            os.path.join(self.directory, name) for _, name in sorted(found)
+        ]
+
+    def restore_latest(self, algorithm) -> bool:
+        """
+        Restore the algorithm from the latest checkpoint file,
+        if `resume` is set and there is one.
+
+        Parameters
+        ----------
+        algorithm: Algorithm
+            the algorithm to restore, with a newly created population
+
+        Returns
+        -------
+        bool
+            True if the algorithm was restored, False otherwise
+        """
+        if not self.resume:
+            return False
+        checkpoints = self.list_checkpoints()
+        if not checkpoints:
+            return False
+        self.restore(algorithm, checkpoints[-1])
+        self._written = checkpoints[-self.keep:]
+        return True
+
+    def restore(self, algorithm, path: str) -> None:
+        """
+        Restore the algorithm from a checkpoint file.
+
+        Parameters
+        ----------
+        algorithm: Algorithm
+            the algorithm to restore, with a newly created population
+            (its individuals serve as templates)
+
+        path: str
+            path of the checkpoint file
+        """
+        with np.load(path) as data:
+            meta = pickle.loads(data["meta"].tobytes())
+            if meta["version"] != CHECKPOINT_VERSION:
+                raise ValueError(
+                    f"Unsupported checkpoint version {meta['version']}"
+                )
+            sub_populations = algorithm.population.sub_populations
+            if meta["n_sub_populations"] != len(sub_populations):
+                raise ValueError(
+                    f"Checkpoint has {meta['n_sub_populations']} "
+                    f"sub-populations, but the algorithm has "
+                    f"{len(sub_populations)}"
+                )
+
+            gen = meta["generation_num"]
+            kinds = meta["kinds"]
+            for i, sub_population in enumerate(sub_populations):
+                key = f"sub{i}"
+                template = sub_population.individuals[0]
+                sub_population.individuals = _decode_individuals(
+                    data, key, kinds[key], template, gen
+                )
+
+            best_of_run = None
+            if meta["best_sub_population"] is not None:
+                sub_population = sub_populations[meta["best_sub_population"]]
+                best_of_run = _decode_individuals(
+                    data,
+                    "best",
+                    kinds["best"],
+                    sub_population.individuals[0],
+                    gen,
+                )[0]
+
+        algorithm.generation_num = gen
+        algorithm.generation_seed = meta["generation_seed"]
+        algorithm.random_seed = meta["random_seed"]
+        algorithm.best_of_run_ = best_of_run
+        random.setstate(meta["random_state"])
+        np.random.set_state(meta["np_random_state"])
+        self._last_time = monotonic()
+        logger.info("resumed from %s (generation %d)", path, gen)
+
+    def _write(self, path: str, arrays: Dict[str, np.ndarray]) -> None:
+        atomic_write(
+            path, lambda f: np.savez(f, **arrays), prefix=f".{self.prefix}-"
+        )
+
+        if path in self._written:
+            self._written.remove(path)
+        self._written.append(path)
+        while len(self._written) > self.keep:
+            old_path = self._written.pop(0)
+            if os.path.exists(old_path):
+                os.remove(old_path)
+
+
+def _snapshot(algorithm) -> Dict[str, np.ndarray]:
+    """
+    Encode the state of the algorithm as arrays.
+    The arrays are copies, so the snapshot is not affected by the
+    following generations.
+    """
+    arrays = {}
+    kinds = {}
+    sub_populations = algorithm.population.sub_populations
+    for i, sub_population in enumerate(sub_populations):
+        key = f"sub{i}"
+        kinds[key] = _encode_individuals(
+            arrays, key, sub_population.individuals
+        )
+
+    best = algorithm.best_of_run_
+    best_sub_population = None
+    if best is not None:
+        best_sub_population = next(
+            (
+                i
+                for i, sub_population in enumerate(sub_populations)
+                if type(sub_population.individuals[0]) is type(best)
+            ),
+            None,
+        )
+    if best_sub_population is not None:
+        kinds["best"] = _encode_individuals(arrays, "best", [best])
+
+    meta = {
+        "version": CHECKPOINT_VERSION,
+        "generation_num": algorithm.generation_num,
+        "generation_seed": algorithm.generation_seed,
+        "random_seed": algorithm.random_seed,
+        "n_sub_populations": len(sub_populations),
+        "kinds": kinds,
+        "best_sub_population": best_sub_population,
+        "random_state": random.getstate(),
+        "np_random_state": np.random.get_state(),
+    }
+    arrays["meta"] = _to_bytes(meta)
+    return arrays
+
+
+def _encode_individuals(arrays, key, individuals) -> Tuple[str, str]:
+    """
+    Encode the genomes and fitness scores of individuals as arrays
+    (or pickled bytes, if they are not numeric).
+
+    Returns
+    -------
+    Tuple[str, str]
+        kinds of the encoded genomes and fitness scores: "list" for lists
+        stored as an array, "array" for NumPy arrays, or "pickle"
+    """
+    genomes = [ind.get_genome() for ind in individuals]
+    genome_array = _to_array(genomes)
+    if genome_array is None:
+        arrays[f"{key}_genomes"] = _to_bytes(genomes)
+        genome_kind = "pickle"
+    else:
+        genome_kind = _array_kind(genomes)
+        if genome_kind == "list":
+            genome_array = _narrow(genome_array)
+        arrays[f"{key}_genomes"] = genome_array
+
+    evaluated = np.array(
+        [ind.fitness.is_fitness_evaluated() for ind in individuals],
+        dtype=bool,
+    )
+    scores = [
+        ind.get_pure_fitness()
+        for ind, is_evaluated in zip(individuals, evaluated)
+        if is_evaluated
+    ]
+    score_array = _to_array(scores)
+    arrays[f"{key}_evaluated"] = evaluated
+    if score_array is None:
+        arrays[f"{key}_fitness"] = _to_bytes(scores)
+        fitness_kind = "pickle"
+    else:
+        arrays[f"{key}_fitness"] = score_array
+        fitness_kind = _array_kind(scores)
+    return genome_kind, fitness_kind
+
+
+def _decode_individuals(data, key, kinds, template, gen) -> List:
+    """
+    Rebuild individuals from their encoded genomes and fitness scores,
+    as clones of a template individual.
+    """
+    genome_kind, fitness_kind = kinds
+    genomes = _from_array(data[f"{key}_genomes"], genome_kind)
+    evaluated = data[f"{key}_evaluated"]
+    scores = iter(_from_array(data[f"{key}_fitness"], fitness_kind))
+
+    individuals = []
+    for genome, is_evaluated in zip(genomes, evaluated.tolist()):
+        ind = template.clone()
+        ind.set_genome(genome)
+        ind.invalidate_cache()
+        ind.gen = gen
+        if is_evaluated:
+            ind.fitness.set_fitness(next(scores))
+        individuals.append(ind)
+    return individuals
+
+
+def _to_array(values) -> Optional[np.ndarray]:
+    """
+    Convert values to a numeric (or string) array,
+    or return None if they are not of a fixed shape.
+    """
+    if not values:
+        return np.array(values)
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        # ragged values
+        return None
+    if array.dtype == object:
+        return None
+    return array
+
+
+def _narrow(array: np.ndarray) -> np.ndarray:
+    """
+    Store integers (such as bits) in the smallest type that holds them.
+    Only used for lists, which are restored as Python integers.
+    """
+    if array.dtype.kind not in "iu" or not array.size:
+        return array
+    dtype = np.promote_types(
+        np.min_scalar_type(array.min()), np.min_scalar_type(array.max())
+    )
+    return array.astype(dtype)
+
+
+def _array_kind(values) -> str:
+    if values and isinstance(values[0], np.ndarray):
+        return "array"
+    return "list"
+
+
+def _from_array(array: np.ndarray, kind: str):
+    if kind == "pickle":
+        return pickle.loads(array.tobytes())
+    if kind == "list":
+        return array.tolist()
+    return list(array)
+
+
+def _to_bytes(value) -> np.ndarray:
+    return np.frombuffer(
+        pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8
+    )
@@ -0,0 +1,153 @@
+"""
+This module implements the ExecutorManager class.
+"""
+
+import atexit
+from concurrent.futures import Executor
+from concurrent.futures.process import ProcessPoolExecutor
+from concurrent.futures.thread import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+
+class ExecutorManager:
+    """
+    Process-wide registry of executors, shared by algorithms.
+
+    Algorithms borrow an executor with `acquire` when the evolution starts
+    and return it with `release` when it ends. Executors of the same type
+    and number of workers are shared, and reference counted. By default,
+    an executor is kept alive when it is no longer borrowed, so later
+    evolutions (e.g. repeated `fit` calls in a grid search) do not pay
+    for starting new worker processes.
+
+    Executors with a worker initializer (see
+    `PopulationEvaluator.worker_initializer`) hold the state of a
+    specific evaluator, so they are never shared, and are shut down
+    when released.
+
+    Parameters
+    ----------
+    keep_alive: bool, default=True
+        Keep shared executors alive when no algorithm borrows them.
+        Idle executors are shut down by `shutdown`, which is called
+        at interpreter exit for the default manager.
+    """
+
+    def __init__(self, keep_alive: bool = True):
+        self.keep_alive = keep_alive
+        self._lock = Lock()
+        # (executor type, max workers) -> [executor, reference count]
+        self._shared: Dict[Tuple[str, Optional[int]], list] = {}
+        # executors that were created for a single borrower
+        self._private = set()
+
+    def acquire(
+        self,
+        executor_type: str,
+        max_workers: int = None,
+        initializer: Callable = None,
+        initargs: tuple = (),
+    ) -> Executor:
+        """
+        Borrow an executor.
+
+        Parameters
+        ----------
+        executor_type: str
+            Either "thread" or "process".
+
+        max_workers: int, default=None
+            Maximal number of workers of the executor.
+
+        initializer: Callable, default=None
+            Function called at the start of each worker process.
+            Ignored for thread executors.
+
+        initargs: tuple, default=()
+            Arguments passed to the initializer.
+
+        Returns
+        -------
+        Executor
+            An executor, that must be returned with `release`.
+        """
+        if executor_type not in ["thread", "process"]:
+            raise ValueError('Executor must be either "thread" or "process"')
+
+        if initializer is not None and executor_type == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=initializer,
+                initargs=initargs,
+            )
+            with self._lock:
+                self._private.add(executor)
+            return executor
+
+        key = (executor_type, max_workers)
+        with self._lock:
+            entry = self._shared.get(key)
+            # a process pool breaks if one of its workers dies abruptly
+            if entry is not None and getattr(entry[0], "_broken", False):
+                if entry[1] == 0:
+                    entry[0].shutdown(wait=False)
+                entry = None
+            if entry is None:
+                entry = [self._create_executor(executor_type, max_workers), 0]
+                self._shared[key] = entry
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, executor: Executor) -> None:
+        """
+        Return a borrowed executor.
+
+        Parameters
+        ----------
+        executor: Executor
+            An executor returned by `acquire`.
+        """
+        with self._lock:
+            if executor in self._private:
+                self._private.remove(executor)
+                executor.shutdown()
+                return
+
+            for key, entry in self._shared.items():
+                if entry[0] is executor:
+                    entry[1] -= 1
+                    if entry[1] == 0 and not self.keep_alive:
+                        del self._shared[key]
+                        executor.shutdown()
+                    return
+
+        # replaced after it broke (or already shut down), no longer shared
+        executor.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shut down all executors that are not borrowed.
+
+        Parameters
+        ----------
+        wait: bool, default=True
+            Wait for pending tasks and worker termination.
+        """
+        with self._lock:
+            idle = [
+                key for key, entry in self._shared.items() if entry[1] == 0
+            ]
+            executors = [self._shared.pop(key)[0] for key in idle]
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _create_executor(executor_type, max_workers) -> Executor:
+        if executor_type == "thread":
+            return ThreadPoolExecutor(max_workers=max_workers)
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+
+executor_manager = ExecutorManager()
+atexit.register(executor_manager.shutdown)
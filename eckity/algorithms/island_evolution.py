@@ -0,0 +1,543 @@
+"""
+This module implements the IslandEvolution class.
+"""
+
+import logging
+import multiprocessing
+import random
+import traceback
+from concurrent.futures import Executor, Future
+from copy import deepcopy
+
+import numpy as np
+from overrides import overrides
+
+from eckity.algorithms.algorithm import Algorithm
+from eckity.breeders.simple_breeder import SimpleBreeder
+from eckity.evaluators import SimplePopulationEvaluator
+from eckity.population import Population
+from eckity.random import RNG
+
+logger = logging.getLogger(__name__)
+
+TOPOLOGIES = ["ring", "full", "random"]
+
+
+class IslandEvolution(Algorithm):
+    """
+    Island-model evolutionary algorithm.
+
+    Every subpopulation of the population is an island, that evolves
+    independently (with its own copy of the breeder and population
+    evaluator, and its own random seed) in its own worker process.
+    Every `migration_interval` generations, each island sends copies of
+    its `n_migrants` best individuals to other islands, according to the
+    migration topology, where they replace the worst individuals.
+    Migrants are sent as genomes (see `Individual.get_genome`) with their
+    fitness scores, so the islands must share the same encoding.
+
+    Between migrations, the islands do not communicate with the main
+    process, so the algorithm scales with the number of islands even when
+    evaluating an individual is cheaper than sending it to an executor.
+    Individuals are evaluated by the island that holds them, in its
+    worker process.
+
+    The main process only sees the best individual of each island:
+    between migrations, each subpopulation of `population` holds the
+    best individual of its island, so the statistics, termination
+    checker and "after_generation" event (which are applied once per
+    migration interval) see these individuals. When the evolution ends,
+    the subpopulations hold the final individuals of the islands.
+
+    Parameters
+    ----------
+    population: Population
+        The population to be evolved, one subpopulation per island.
+
+    migration_interval: int, default=10
+        Number of generations between migrations.
+
+    n_migrants: int, default=1
+        Number of best individuals each island sends to each of its
+        destinations.
+
+    topology: str, default="ring"
+        Migration topology: "ring" (island i sends migrants to island
+        i + 1), "full" (every island sends migrants to all other islands)
+        or "random" (every island sends migrants to another island,
+        drawn at each migration).
+
+    breeder: SimpleBreeder, default=None
+        Breeder of the islands (each island uses a copy).
+        By default, SimpleBreeder.
+
+    population_evaluator: SimplePopulationEvaluator, default=None
+        Population evaluator of the islands (each island uses a copy).
+        By default, SimplePopulationEvaluator. Individuals are evaluated
+        one after the other in the island's process, regardless of
+        the executor method.
+
+    executor: str, default="process"
+        "process" evolves every island in its own worker process.
+        "thread" evolves the islands in the calling process, one after
+        the other (with the same results as "process"), which is useful
+        for debugging.
+
+    Other parameters are the same as in SimpleEvolution.
+    The seed of each island is derived from `random_seed`.
+
+    Attributes
+    ----------
+    island_bests: list of Individuals
+        The best individual of each island in the last migration.
+    """
+
+    def __init__(
+        self,
+        population,
+        statistics=None,
+        breeder: SimpleBreeder = None,
+        population_evaluator: SimplePopulationEvaluator = None,
+        migration_interval=10,
+        n_migrants=1,
+        topology="ring",
+        max_generation=500,
+        events=None,
+        event_names=None,
+        termination_checker=None,
+        executor="process",
+        random_generator: RNG = RNG(),
+        random_seed=None,
+        generation_seed=None,
+        generation_num=0,
+    ):
+        if migration_interval < 1:
+            raise ValueError(
+                "migration_interval must be positive, "
+                f"got {migration_interval}"
+            )
+        if n_migrants < 0:
+            raise ValueError(
+                f"n_migrants must be non-negative, got {n_migrants}"
+            )
+        if topology not in TOPOLOGIES:
+            raise ValueError(
+                f"topology must be one of {TOPOLOGIES}, got {topology}"
+            )
+        if statistics is None:
+            statistics = []
+        if breeder is None:
+            breeder = SimpleBreeder()
+        if population_evaluator is None:
+            population_evaluator = SimplePopulationEvaluator()
+
+        super().__init__(
+            population,
+            statistics=statistics,
+            breeder=breeder,
+            population_evaluator=population_evaluator,
+            max_generation=max_generation,
+            events=events,
+            event_names=event_names,
+            termination_checker=termination_checker,
+            executor=executor,
+            random_generator=random_generator,
+            random_seed=random_seed,
+            generation_seed=generation_seed,
+            generation_num=generation_num,
+        )
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.topology = topology
+
+        self.best_of_gen = None
+        self.island_bests = []
+        self._islands = []
+        # migrants sent by each island in the last migration
+        self._emigrants = []
+        # draws the destinations of the "random" topology
+        self._topology_random = None
+
+    @overrides
+    def initialize(self):
+        """
+        Start the islands, which create and evaluate their individuals
+        """
+        self.set_random_seed(self.random_seed)
+        logger.info("random seed = %d", self.random_seed)
+        self._topology_random = random.Random(self.random_seed)
+        for stat in self.statistics:
+            self.register("after_generation", stat.write_statistics)
+            self.register("evolution_finished", stat.flush_statistics)
+
+        sub_populations = self.population.sub_populations
+        seeds = np.random.SeedSequence(self.random_seed).spawn(
+            len(sub_populations)
+        )
+        islands = [
+            _Island(
+                deepcopy(sub_population),
+                deepcopy(self.breeder),
+                deepcopy(self.population_evaluator),
+                deepcopy(self.random_generator),
+                int(seed.generate_state(1)[0]),
+                self.n_migrants,
+            )
+            for sub_population, seed in zip(sub_populations, seeds)
+        ]
+        self._finish_islands()
+        if self._executor_type == "process":
+            self._islands = [_RemoteIsland(island) for island in islands]
+        else:
+            self._islands = islands
+
+        for island in self._islands:
+            island.start("initialize")
+        self._collect_reports()
+        self.publish("init")
+
+    @overrides
+    def evolve_main_loop(self):
+        gen = self.generation_num
+        while gen < self.max_generation:
+            gen = min(gen + self.migration_interval, self.max_generation)
+            self.generation_iteration(gen)
+            if self.should_terminate(self.population, self.best_of_run_, gen):
+                self.final_generation_ = gen
+                self.publish("after_generation")
+                break
+            self.publish("after_generation")
+        else:
+            self.final_generation_ = gen
+
+    @overrides
+    def generation_iteration(self, gen: int) -> bool:
+        """
+        Migrate the best individuals of the islands, then evolve the
+        islands until the given generation (or the next migration)
+
+        Parameters
+        ----------
+        gen:
+                generation number to evolve the islands to
+
+        Returns
+        -------
+        None.
+        """
+        immigrants = self._route_migrants()
+        n_generations = gen - self.generation_num
+        for island, island_immigrants in zip(self._islands, immigrants):
+            island.start("evolve", n_generations, island_immigrants)
+        self.generation_num = gen
+        self._collect_reports()
+
+    @overrides
+    def finish(self):
+        """
+        Collect the final individuals of the islands into the population
+        and stop the worker processes
+        """
+        for island in self._islands:
+            island.start("finish")
+        for sub_population, island in zip(
+            self.population.sub_populations, self._islands
+        ):
+            sub_population.individuals = _unpack_scored(island.result())
+        self._finish_islands()
+        super().finish()
+
+    def execute(self, **kwargs):
+        """
+        Compute output using best evolved individual.
+        Use `execute` in a non-sklearn setting.
+
+        Parameters
+        ----------
+        **kwargs : keyword arguments
+                The input to the program (tree).
+
+        Returns
+        -------
+        object
+                Output as computed by the best individual of the evolution.
+        """
+        return self.best_of_run_.execute(**kwargs)
+
+    def event_name_to_data(self, event_name):
+        data = super().event_name_to_data(event_name)
+        if event_name == "init":
+            return data
+        return {
+            "population": self.population,
+            "best_of_run_": self.best_of_run_,
+            "best_of_gen": self.best_of_gen,
+            "island_bests": self.island_bests,
+            "generation_num": self.generation_num,
+        }
+
+    def _collect_reports(self):
+        """
+        Receive the best individual and emigrants of every island
+        """
+        self.island_bests = []
+        self._emigrants = []
+        for sub_population, island in zip(
+            self.population.sub_populations, self._islands
+        ):
+            best, emigrants = island.result()
+            best = _unpack_scored([best])[0]
+            sub_population.individuals = [best]
+            self.island_bests.append(best)
+            self._emigrants.append(emigrants)
+
+        self.best_of_gen = self.island_bests[0]
+        for best in self.island_bests[1:]:
+            if best.better_than(self.best_of_gen):
+                self.best_of_gen = best
+        if self.best_of_gen.better_than(self.best_of_run_):
+            self.best_of_run_ = self.best_of_gen
+
+    def _route_migrants(self):
+        """
+        Compute the immigrants of every island, according to the topology
+
+        Returns
+        -------
+        list of lists
+            the migrants sent to each island
+        """
+        n_islands = len(self._islands)
+        immigrants = [[] for _ in range(n_islands)]
+        if n_islands < 2 or self.n_migrants == 0:
+            return immigrants
+        for source, emigrants in enumerate(self._emigrants):
+            if self.topology == "ring":
+                destinations = [(source + 1) % n_islands]
+            elif self.topology == "full":
+                destinations = [i for i in range(n_islands) if i != source]
+            else:
+                destination = self._topology_random.randrange(n_islands - 1)
+                destinations = [destination + (destination >= source)]
+            for destination in destinations:
+                immigrants[destination].extend(emigrants)
+        return immigrants
+
+    def _finish_islands(self):
+        for island in self._islands:
+            island.close()
+        self._islands = []
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_islands"] = []
+        return state
+
+
+class _Island:
+    """
+    A subpopulation that evolves independently, with its own breeder,
+    population evaluator and random seed.
+
+    Commands ("initialize", "evolve", "finish") are run by `start`,
+    and their results are returned by `result`.
+    """
+
+    def __init__(
+        self,
+        sub_population,
+        breeder,
+        population_evaluator,
+        random_generator,
+        seed,
+        n_migrants,
+    ):
+        self.population = Population([sub_population])
+        self.breeder = breeder
+        self.population_evaluator = population_evaluator
+        self.random_generator = random_generator
+        self.generation_seed = seed
+        self.n_migrants = n_migrants
+        self.generation_num = 0
+        self._result = None
+
+    @property
+    def sub_population(self):
+        return self.population.sub_populations[0]
+
+    def start(self, command, *args):
+        self._result = getattr(self, command)(*args)
+
+    def result(self):
+        return self._result
+
+    def close(self):
+        pass
+
+    def initialize(self):
+        self.random_generator.set_seed(self.generation_seed)
+        self.population_evaluator.set_executor(_SerialExecutor())
+        self.breeder.initialize()
+        self.population_evaluator.initialize()
+        self.population.create_population_individuals()
+        self.population.set_fitness_not_evaluated()
+        self.population_evaluator.act(self.population)
+        return self._report()
+
+    def evolve(self, n_generations, immigrants):
+        self._receive(immigrants)
+        for _ in range(n_generations):
+            self.generation_num += 1
+            for ind in self.sub_population.individuals:
+                ind.gen = self.generation_num
+            self.generation_seed = (self.generation_seed + 1) % (2**32)
+            self.random_generator.set_seed(self.generation_seed)
+            self.breeder.breed(self.population)
+            self.population_evaluator.act(self.population)
+        return self._report()
+
+    def finish(self):
+        return _pack_scored(self.sub_population.individuals)
+
+    def _report(self):
+        """
+        Return the best individual and the emigrants of the island
+        """
+        summary = self.sub_population.get_fitness_summary()
+        emigrants = [
+            _pack_migrant(summary.individuals[i])
+            for i in summary.top_indices(self.n_migrants)
+        ]
+        # a copy, as the island keeps evolving its individuals
+        best = summary.best.clone(), summary.best.get_pure_fitness()
+        return best, emigrants
+
+    def _receive(self, immigrants):
+        """
+        Replace the worst individuals of the island with immigrants
+        """
+        individuals = self.sub_population.individuals
+        immigrants = immigrants[: len(individuals)]
+        if not immigrants:
+            return
+        summary = self.sub_population.get_fitness_summary()
+        worst = summary.bottom_indices(len(immigrants))
+        for i, migrant in zip(worst, immigrants):
+            individuals[i] = _unpack_migrant(migrant, individuals[i])
+        self.sub_population.invalidate_fitness_summary()
+
+
+class _RemoteIsland:
+    """
+    An island that runs in its own worker process
+    """
+
+    def __init__(self, island):
+        context = multiprocessing.get_context()
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_run_island, args=(island, child_conn), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+
+    def start(self, command, *args):
+        self._conn.send((command, args))
+
+    def result(self):
+        try:
+            status, result = self._conn.recv()
+        except EOFError:
+            raise RuntimeError("Island worker process exited unexpectedly")
+        if status == "error":
+            raise RuntimeError(f"Island worker process failed:\n{result}")
+        return result
+
+    def close(self):
+        self._conn.close()
+        self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.terminate()
+
+
+def _run_island(island, conn):
+    """
+    Run the commands of the main process on an island,
+    until the island finishes
+    """
+    while True:
+        try:
+            command, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            island.start(command, *args)
+            conn.send(("ok", island.result()))
+        except Exception:
+            conn.send(("error", traceback.format_exc()))
+            return
+        if command == "finish":
+            return
+
+
+class _SerialExecutor(Executor):
+    """
+    Executor that runs every task immediately in the calling thread
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def map(self, fn, *iterables, timeout=None, chunksize=1):
+        return map(fn, *iterables)
+
+
+def _pack_scored(individuals):
+    """
+    Pair individuals with their fitness scores,
+    which are not pickled unless the fitness is cached
+    """
+    return [(ind, ind.fitness.get_pure_fitness()) for ind in individuals]
+
+
+def _unpack_scored(scored):
+    individuals = []
+    for ind, fitness_score in scored:
+        if not ind.fitness.is_fitness_evaluated():
+            ind.fitness.set_fitness(fitness_score)
+        individuals.append(ind)
+    return individuals
+
+
+def _pack_migrant(individual):
+    """
+    Serialize a migrant as its genome (if the encoding supports it)
+    and fitness score
+    """
+    migrant = individual.clone()
+    fitness_score = individual.fitness.get_pure_fitness()
+    try:
+        return migrant.get_genome(), None, fitness_score
+    except ValueError:
+        # no compact genome, send the whole individual
+        return None, migrant, fitness_score
+
+
+def _unpack_migrant(migrant, template):
+    """
+    Build an immigrant from a migrant, using an individual of the
+    destination island as a template
+    """
+    genome, individual, fitness_score = migrant
+    if individual is None:
+        individual = template.clone()
+        individual.set_genome(genome)
+    if individual.fitness.is_fitness_evaluated():
+        individual.fitness.set_not_evaluated()
+    individual.fitness.set_fitness(fitness_score)
+    return individual
@@ -0,0 +1,257 @@
+"""
+This module implements the Profiler class.
+"""
+
+import csv
+from functools import partial
+from time import perf_counter, process_time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# (event name before, event name after) of the phases of a generation,
+# published by the algorithm (or its breeder, for selection)
+PHASE_EVENTS = {
+    "breed": ("before_breeding", "after_breeding"),
+    "select": ("before_selection", "after_selection"),
+    "evaluate": ("before_eval", "after_eval"),
+    "termination": ("before_termination_check", "after_termination_check"),
+}
+
+
+class Profiler:
+    """
+    Per-generation timing of an evolutionary run.
+
+    The profiler subscribes to the events of the algorithm, its breeder
+    and the genetic operators of its sub-populations, and records the
+    wall-clock and CPU time (of the main process) of every phase of each
+    generation: breeding, selection, each genetic operator, evaluation,
+    termination check, and statistics (the `after_generation`
+    subscribers, up to the next generation).
+
+    It also records how many times each operator was applied, the
+    attempts and failures of failable operators, and the number of
+    evaluated individuals per second.
+
+    The profiler is attached to the algorithm when the evolution starts
+    (see the `profiler` parameter of the algorithm), and detached when it
+    finishes. Phases that the algorithm does not publish events for
+    are not recorded.
+
+    Attributes
+    ----------
+    rows: list of dict
+        one row per generation, mapping column names to values
+        (see `columns`)
+    """
+
+    def __init__(self):
+        self.rows: List[Dict[str, float]] = []
+        self._row: Optional[Dict[str, float]] = None
+        self._starts: Dict[str, Tuple[float, float]] = {}
+        self._counts: Dict[str, Tuple[int, int, int]] = {}
+        self._registrations = []
+
+    def attach(self, algorithm) -> None:
+        """
+        Subscribe to the events of an algorithm and its operators.
+
+        Parameters
+        ----------
+        algorithm: Algorithm
+            the algorithm to profile
+        """
+        self.detach()
+
+        self._subscribe(
+            algorithm, "before_generation", self._start_generation
+        )
+        self._subscribe(
+            algorithm, "evolution_finished", self._finish_generations
+        )
+        for phase, (before, after) in PHASE_EVENTS.items():
+            publisher = algorithm.breeder if phase == "select" else algorithm
+            self._subscribe(publisher, before, partial(self._on_start, phase))
+            self._subscribe(publisher, after, partial(self._on_stop, phase))
+        self._subscribe(algorithm, "after_eval", self._count_evaluations)
+        self._subscribe(
+            algorithm,
+            "after_termination_check",
+            partial(self._on_start, "statistics"),
+        )
+
+        names = set()
+        for sub_population in algorithm.population.sub_populations:
+            for operator in sub_population.get_operators_sequence():
+                name = type(operator).__name__
+                # operators of the same type are numbered
+                i = 2
+                while name in names:
+                    name = f"{type(operator).__name__}_{i}"
+                    i += 1
+                names.add(name)
+                self._subscribe(
+                    operator,
+                    "before_operator",
+                    partial(self._on_operator_start, name),
+                )
+                self._subscribe(
+                    operator,
+                    "after_operator",
+                    partial(self._on_operator_stop, name),
+                )
+
+    def detach(self) -> None:
+        """
+        Unsubscribe from the events of the profiled algorithm.
+        """
+        for publisher, event_name, customer_id in self._registrations:
+            publisher.unregister(event_name, customer_id)
+        self._registrations = []
+        self._row = None
+
+    def columns(self) -> List[str]:
+        """
+        Return the column names of the rows, in order of appearance.
+
+        The columns are "generation", "wall" and "cpu" (total time of the
+        generation), "<phase>_wall" and "<phase>_cpu" for every phase and
+        operator, "<operator>_calls" (and "<operator>_attempts",
+        "<operator>_failures" for failable operators), "evaluated" and
+        "evals_per_sec".
+        """
+        columns = {}
+        for row in self.rows:
+            columns.update(dict.fromkeys(row))
+        return list(columns)
+
+    def table(self) -> Tuple[List[str], List[List[float]]]:
+        """
+        Return the rows as a table, with 0 for missing values.
+
+        Returns
+        -------
+        Tuple[List[str], List[List[float]]]
+            the column names, and a list of values of every generation
+        """
+        columns = self.columns()
+        return columns, [
+            [row.get(column, 0) for column in columns] for row in self.rows
+        ]
+
+    def write_csv(self, path: str) -> None:
+        """
+        Write the rows to a CSV file.
+
+        Parameters
+        ----------
+        path: str
+            path of the CSV file
+        """
+        columns, values = self.table()
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(values)
+
+    def to_dataframe(self):
+        """
+        Return the rows as a pandas DataFrame, indexed by generation.
+        """
+        import pandas as pd
+
+        columns, values = self.table()
+        return pd.DataFrame(values, columns=columns).set_index("generation")
+
+    def _subscribe(self, publisher, event_name: str, callback: Callable):
+        if event_name not in publisher.events:
+            return
+        customer_id = publisher.register(event_name, callback)
+        self._registrations.append((publisher, event_name, customer_id))
+
+    def _start_generation(self, sender, data_dict) -> None:
+        self._end_generation()
+        self._row = {"generation": sender.generation_num}
+        self._start("generation")
+
+    def _finish_generations(self, sender, data_dict) -> None:
+        self._end_generation()
+
+    def _end_generation(self) -> None:
+        if self._row is None:
+            return
+        if "statistics" in self._starts:
+            self._stop("statistics")
+        wall, cpu = self._elapsed("generation")
+        self._row["wall"] = wall
+        self._row["cpu"] = cpu
+        self.rows.append(self._row)
+        self._row = None
+        self._starts.clear()
+
+    def _count_evaluations(self, sender, data_dict) -> None:
+        if self._row is None:
+            return
+        n_evaluated = getattr(sender.population_evaluator, "n_evaluated", 0)
+        wall = self._row.get("evaluate_wall", 0)
+        self._row["evaluated"] = n_evaluated
+        self._row["evals_per_sec"] = n_evaluated / wall if wall > 0 else 0
+
+    def _on_start(self, key: str, sender, data_dict) -> None:
+        self._start(key)
+
+    def _on_stop(self, key: str, sender, data_dict) -> None:
+        self._stop(key)
+
+    def _on_operator_start(self, name: str, operator, data_dict) -> None:
+        if self._row is None:
+            return
+        self._counts[name] = _operator_counts(operator)
+        self._start(name)
+
+    def _on_operator_stop(self, name: str, operator, data_dict) -> None:
+        if self._row is None or name not in self._counts:
+            return
+        self._stop(name)
+        applied, attempts, failures = self._counts.pop(name)
+        n_applied, n_attempts, n_failures = _operator_counts(operator)
+        self._add(f"{name}_calls", n_applied - applied)
+        if hasattr(operator, "n_attempts"):
+            self._add(f"{name}_attempts", n_attempts - attempts)
+            self._add(f"{name}_failures", n_failures - failures)
+
+    def _start(self, key: str) -> None:
+        if self._row is not None:
+            self._starts[key] = (perf_counter(), process_time())
+
+    def _stop(self, key: str) -> None:
+        if self._row is None or key not in self._starts:
+            return
+        wall, cpu = self._elapsed(key)
+        del self._starts[key]
+        # phases may run several times in a generation
+        self._add(f"{key}_wall", wall)
+        self._add(f"{key}_cpu", cpu)
+
+    def _elapsed(self, key: str) -> Tuple[float, float]:
+        wall, cpu = self._starts[key]
+        return perf_counter() - wall, process_time() - cpu
+
+    def _add(self, column: str, value: float) -> None:
+        self._row[column] = self._row.get(column, 0) + value
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # subscriptions are renewed when the evolution starts
+        state["_registrations"] = []
+        state["_row"] = None
+        state["_starts"] = {}
+        state["_counts"] = {}
+        return state
+
+
+def _operator_counts(operator) -> Tuple[int, int, int]:
+    return (
+        getattr(operator, "n_applied", 0),
+        getattr(operator, "n_attempts", 0),
+        getattr(operator, "n_failures", 0),
+    )
@@ -79,6 +79,15 @@ class SimpleEvolution(Algorithm):
 
     generation_num: int, default=0
             Current generation number
+
+    checkpointer: Checkpointer, default=None
+            Writes periodic checkpoints of the evolution,
+            and resumes the evolution from the latest one.
+
+    profiler: Profiler, default=None
+            Records the time of every phase of each generation
+            (see the `before_breeding`, `after_breeding`, `before_eval`
+            and `after_eval` events).
     """
 
     def __init__(
@@ -100,17 +109,21 @@ class SimpleEvolution(Algorithm):
         best_of_gen=None,
         worst_of_gen=None,
         generation_num=0,
+        checkpointer=None,
+        profiler=None,
     ):
 
-        if event_names is None:
-            _event_names = [
-                "before_eval",
-                "after_eval",
-                "before_breeding",
-                "after_breeding",
+        _event_names = [
+            "before_eval",
+            "after_eval",
+            "before_breeding",
+            "after_breeding",
+        ]
+        if event_names is not None:
+            # the events above are always published
+            _event_names = event_names + [
+                name for name in _event_names if name not in event_names
             ]
-        else:
-            _event_names = event_names
 
         if statistics is None:
             statistics = []
@@ -146,6 +159,8 @@ class SimpleEvolution(Algorithm):
             generation_seed=generation_seed,
             termination_checker=termination_checker,
             generation_num=generation_num,
+            checkpointer=checkpointer,
+            profiler=profiler,
         )
 
         self.termination_checker = termination_checker
@@ -160,11 +175,13 @@ class SimpleEvolution(Algorithm):
         """
         Initialize the evolutionary algorithm
 
-        Register statistics to `after_generation` event
+        Register statistics to `after_generation` and `evolution_finished`
+        events
         """
         super().initialize()
         for stat in self.statistics:
             self.register("after_generation", stat.write_statistics)
+            self.register("evolution_finished", stat.flush_statistics)
 
     @overrides
     def generation_iteration(self, gen: int) -> bool:
@@ -183,10 +200,14 @@ class SimpleEvolution(Algorithm):
         """
 
         # breed population
+        self.publish("before_breeding")
         self.breeder.breed(self.population)
+        self.publish("after_breeding")
 
         # Evaluate the entire population and get the best individual
+        self.publish("before_eval")
         self.best_of_gen = self.population_evaluator.act(self.population)
+        self.publish("after_eval")
 
         if self.best_of_gen.better_than(self.best_of_run_):
             self.best_of_run_ = self.best_of_gen
@@ -0,0 +1,280 @@
+"""
+This module implements the SteadyStateEvolution class.
+"""
+
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, wait
+from functools import reduce
+
+from overrides import overrides
+
+from eckity.algorithms.simple_evolution import SimpleEvolution
+from eckity.breeders.simple_breeder import SimpleBreeder
+from eckity.evaluators import SimplePopulationEvaluator
+from eckity.random import RNG
+
+_MISSING = object()
+
+
+class SteadyStateEvolution(SimpleEvolution):
+    """
+    Steady-state (asynchronous) evolutionary algorithm.
+
+    Instead of breeding and evaluating whole generations, the algorithm
+    keeps `n_in_flight` offspring under evaluation in the executor.
+    As soon as the evaluation of an offspring completes, the offspring is
+    inserted into the population according to the replacement policy,
+    and a new offspring is bred (by the selection method and operators
+    sequence of the subpopulation) and submitted in its place.
+    Therefore, the workers never wait for the slowest individual of a
+    generation.
+
+    For compatibility with termination checkers and statistics,
+    every `population_size` evaluated offspring count as a generation.
+    Note that when evaluating with several workers, the order in which
+    evaluations complete (and therefore the evolution) is not
+    deterministic.
+
+    Contains only one subpopulation, and does not support relative
+    fitness. Elitism is implicit when the replacement policy is "worst".
+
+    Parameters
+    ----------
+    population: Population
+        The population to be evolved.
+        Contains only one subpopulation.
+
+    replacement: str, default="worst"
+        Replacement policy of inserted offspring:
+        "worst" replaces the worst individual of the population,
+        unless the offspring is worse than it.
+        "oldest" replaces the individual that was inserted first.
+
+    n_in_flight: int, default=None
+        Number of offspring that are evaluated concurrently.
+        By default, `max_workers` (or the number of CPUs if not set).
+
+    The breeder is not used, and the population evaluator only evaluates
+    the initial population. Other parameters are the same as in
+    SimpleEvolution.
+
+    Attributes
+    ----------
+    n_evaluations: int
+        Number of offspring evaluated so far (including offspring whose
+        fitness was found in the fitness cache, and offspring rejected by
+        the "worst" replacement policy).
+    """
+
+    def __init__(
+        self,
+        population,
+        statistics=None,
+        breeder: SimpleBreeder = None,
+        population_evaluator: SimplePopulationEvaluator = None,
+        replacement="worst",
+        n_in_flight=None,
+        max_generation=500,
+        events=None,
+        event_names=None,
+        termination_checker=None,
+        executor="thread",
+        max_workers=None,
+        random_generator: RNG = RNG(),
+        random_seed=None,
+        generation_seed=None,
+        generation_num=0,
+    ):
+        if replacement not in ["worst", "oldest"]:
+            raise ValueError(
+                'replacement must be either "worst" or "oldest", '
+                f"got {replacement}"
+            )
+        if n_in_flight is not None and n_in_flight < 1:
+            raise ValueError(
+                f"n_in_flight must be positive, got {n_in_flight}"
+            )
+        super().__init__(
+            population,
+            statistics=statistics,
+            breeder=breeder,
+            population_evaluator=population_evaluator,
+            max_generation=max_generation,
+            events=events,
+            event_names=event_names,
+            termination_checker=termination_checker,
+            executor=executor,
+            max_workers=max_workers,
+            random_generator=random_generator,
+            random_seed=random_seed,
+            generation_seed=generation_seed,
+            generation_num=generation_num,
+        )
+        self.replacement = replacement
+        self.n_in_flight = n_in_flight
+        self.n_evaluations = 0
+
+        # futures of offspring under evaluation -> (offspring, genome key)
+        self._pending = {}
+        # offspring bred but not yet submitted
+        self._offspring = []
+        # position of the next individual to replace by "oldest" policy
+        self._oldest = 0
+
+    @overrides
+    def initialize(self):
+        if len(self.population.sub_populations) != 1:
+            raise ValueError(
+                "SteadyStateEvolution can only handle one subpopulation. "
+                f"Got: {len(self.population.sub_populations)}"
+            )
+        sub_population = self.population.sub_populations[0]
+        group_size = _group_size(sub_population)
+        if group_size > sub_population.population_size:
+            raise ValueError(
+                "The least common multiple of the selection and operator "
+                f"arities ({group_size}) is larger than the subpopulation "
+                f"({sub_population.population_size})"
+            )
+        self.n_evaluations = 0
+        self._pending = {}
+        self._offspring = []
+        self._oldest = 0
+        super().initialize()
+
+    @overrides
+    def generation_iteration(self, gen: int) -> bool:
+        """
+        Keep breeding, evaluating and inserting offspring until
+        `population_size` offspring were evaluated in this generation
+
+        Parameters
+        ----------
+        gen:
+                current generation number (for example, generation #100)
+
+        Returns
+        -------
+        None.
+        """
+        sub_population = self.population.sub_populations[0]
+        n_in_flight = self.n_in_flight or self.max_workers or os.cpu_count()
+        end = gen * sub_population.population_size
+
+        while self.n_evaluations < end:
+            # offspring may be inserted without evaluation (if cached)
+            while (
+                len(self._pending) < n_in_flight and self.n_evaluations < end
+            ):
+                self._submit_offspring(sub_population)
+            if not self._pending:
+                break
+
+            done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if self.n_evaluations >= end:
+                    # inserted in the next generation
+                    break
+                offspring, key = self._pending.pop(future)
+                fitness_score = future.result()
+                if key is not None:
+                    sub_population.evaluator.fitness_cache.put(
+                        key, fitness_score
+                    )
+                offspring.fitness.set_fitness(fitness_score)
+                self._insert(sub_population, offspring)
+
+        self.best_of_gen = sub_population.get_best_individual()
+        self.worst_of_gen = sub_population.get_worst_individual()
+
+    @overrides
+    def finish(self):
+        # offspring still under evaluation are discarded
+        for future in self._pending:
+            future.cancel()
+        self._pending = {}
+        self._offspring = []
+        super().finish()
+
+    def _submit_offspring(self, sub_population):
+        if not self._offspring:
+            self._offspring = self._breed(sub_population)
+        offspring = self._offspring.pop()
+        offspring.gen = self.generation_num
+
+        sp_eval = sub_population.evaluator
+        fitness_cache = getattr(sp_eval, "fitness_cache", None)
+        key = offspring.genome_key() if fitness_cache is not None else None
+        fitness = offspring.fitness
+
+        if not fitness.needs_evaluation():
+            # unchanged by the operators, no need to evaluate
+            self._insert(sub_population, offspring)
+            return
+        if key is not None:
+            fitness_score = fitness_cache.get(key, _MISSING)
+            if fitness_score is not _MISSING:
+                fitness.set_fitness(fitness_score)
+                self._insert(sub_population, offspring)
+                return
+
+        future = self.executor.submit(sp_eval.evaluate_individual, offspring)
+        self._pending[future] = (offspring, key)
+
+    def _breed(self, sub_population):
+        """
+        Breed a group of offspring, by selecting parents from the
+        subpopulation and applying the operators sequence on them.
+        The group size is the least common multiple of the operator
+        arities (e.g. two offspring for a crossover of two individuals).
+        """
+        operators = sub_population.get_operators_sequence()
+        selection = sub_population.get_selection_methods()[0][0]
+        n_offspring = _group_size(sub_population)
+
+        offspring = selection.select_n(sub_population.individuals, n_offspring)
+
+        for operator in operators:
+            arity = operator.get_operator_arity()
+            for i in range(0, n_offspring, arity):
+                offspring[i: i + arity] = operator.apply_operator(
+                    offspring[i: i + arity]
+                )
+        return offspring
+
+    def _insert(self, sub_population, offspring):
+        """
+        Insert an evaluated offspring into the subpopulation,
+        according to the replacement policy.
+        """
+        self.n_evaluations += 1
+        individuals = sub_population.individuals
+        if self.replacement == "oldest":
+            individuals[self._oldest] = offspring
+            self._oldest = (self._oldest + 1) % len(individuals)
+        else:
+            worst = 0
+            for i in range(1, len(individuals)):
+                if individuals[worst].better_than(individuals[i]):
+                    worst = i
+            if individuals[worst].better_than(offspring):
+                return
+            individuals[worst] = offspring
+        sub_population.invalidate_fitness_summary()
+
+        if offspring.better_than(self.best_of_run_):
+            self.best_of_run_ = offspring
+
+
+def _group_size(sub_population):
+    """
+    Return the least common multiple of the selection and operator
+    arities of the subpopulation.
+    """
+    selection = sub_population.get_selection_methods()[0][0]
+    arities = [selection.arity] + [
+        op.get_operator_arity()
+        for op in sub_population.get_operators_sequence()
+    ]
+    return reduce(lambda a, b: a * b // math.gcd(a, b), arities, 1)
@@ -0,0 +1,149 @@
+import os
+
+import pytest
+
+from eckity.base.untyped_functions import f_add, f_mul
+from eckity.creators import FullCreator, GABitStringVectorCreator
+from eckity.evaluators import SimpleIndividualEvaluator
+from eckity.genetic_operators import (
+    BitStringVectorFlipMutation,
+    SubtreeMutation,
+    TournamentSelection,
+    VectorKPointsCrossover,
+)
+from eckity.subpopulation import Subpopulation
+
+from ..checkpointer import Checkpointer
+from ..simple_evolution import SimpleEvolution
+
+
+class OneMaxEvaluator(SimpleIndividualEvaluator):
+    def evaluate_individual(self, individual):
+        return sum(individual.vector)
+
+
+class TreeSizeEvaluator(SimpleIndividualEvaluator):
+    def evaluate_individual(self, individual):
+        return individual.size()
+
+
+def make_ga_algorithm(max_generation, checkpointer=None):
+    return SimpleEvolution(
+        Subpopulation(
+            OneMaxEvaluator(),
+            creators=GABitStringVectorCreator(length=20),
+            operators_sequence=[
+                VectorKPointsCrossover(probability=0.7, k=1),
+                BitStringVectorFlipMutation(probability=0.2),
+            ],
+            selection_methods=[
+                (
+                    TournamentSelection(
+                        tournament_size=3, higher_is_better=True
+                    ),
+                    1,
+                )
+            ],
+            population_size=20,
+            higher_is_better=True,
+            elitism_rate=0.1,
+        ),
+        max_generation=max_generation,
+        random_seed=0,
+        checkpointer=checkpointer,
+    )
+
+
+def vectors(algo):
+    return [
+        ind.vector for ind in algo.population.sub_populations[0].individuals
+    ]
+
+
+def fitness_scores(algo):
+    return [
+        ind.get_pure_fitness()
+        for ind in algo.population.sub_populations[0].individuals
+    ]
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    uninterrupted = make_ga_algorithm(8)
+    uninterrupted.evolve()
+
+    first = make_ga_algorithm(5, Checkpointer(str(tmp_path), keep=2))
+    first.evolve()
+    assert sorted(os.listdir(tmp_path)) == [
+        "checkpoint-00000004.npz",
+        "checkpoint-00000005.npz",
+    ]
+
+    resumed = make_ga_algorithm(8, Checkpointer(str(tmp_path), keep=2))
+    resumed.initialize()
+    assert resumed.generation_num == 5
+    assert vectors(resumed) == vectors(first)
+    assert fitness_scores(resumed) == fitness_scores(first)
+    assert (
+        resumed.best_of_run_.vector == first.best_of_run_.vector
+        and resumed.best_of_run_.get_pure_fitness()
+        == first.best_of_run_.get_pure_fitness()
+    )
+
+    resumed.evolve()
+    assert resumed.generation_num == 8
+    assert vectors(resumed) == vectors(uninterrupted)
+    assert fitness_scores(resumed) == fitness_scores(uninterrupted)
+    assert sorted(os.listdir(tmp_path)) == [
+        "checkpoint-00000007.npz",
+        "checkpoint-00000008.npz",
+    ]
+
+
+def test_tree_checkpoint(tmp_path):
+    def make_algorithm(checkpointer):
+        return SimpleEvolution(
+            Subpopulation(
+                TreeSizeEvaluator(),
+                creators=FullCreator(
+                    init_depth=(2, 3),
+                    function_set=[f_add, f_mul],
+                    terminal_set=["x", "y"],
+                ),
+                operators_sequence=[SubtreeMutation(probability=0.5)],
+                population_size=10,
+            ),
+            max_generation=2,
+            random_seed=1,
+            checkpointer=checkpointer,
+        )
+
+    first = make_algorithm(
+        Checkpointer(str(tmp_path), interval=2, asynchronous=False)
+    )
+    first.evolve()
+    resumed = make_algorithm(Checkpointer(str(tmp_path)))
+    resumed.initialize()
+
+    individuals = resumed.population.sub_populations[0].individuals
+    expected = first.population.sub_populations[0].individuals
+    assert [str(ind.tree) for ind in individuals] == [
+        str(ind.tree) for ind in expected
+    ]
+    assert [ind.get_pure_fitness() for ind in individuals] == [
+        ind.get_pure_fitness() for ind in expected
+    ]
+
+
+def test_no_resume(tmp_path):
+    make_ga_algorithm(2, Checkpointer(str(tmp_path))).evolve()
+
+    algo = make_ga_algorithm(2, Checkpointer(str(tmp_path), resume=False))
+    algo.initialize()
+    assert algo.generation_num == 0
+
+
+def test_invalid_parameters(tmp_path):
+    with pytest.raises(ValueError):
+        Checkpointer(str(tmp_path), interval=None)
+    with pytest.raises(ValueError):
+        Checkpointer(str(tmp_path), keep=0)
@@ -0,0 +1,77 @@
+import pytest
+
+from eckity.creators import FullCreator
+from eckity.genetic_operators.mutations.identity_transformation import (
+    IdentityTransformation,
+)
+from eckity.subpopulation import Subpopulation
+
+from ..executor_manager import ExecutorManager, executor_manager
+from ..simple_evolution import SimpleEvolution
+from .test_simple_evolution import DummyIndividualEvaluator
+
+
+def _square(x):
+    return x * x
+
+
+def test_shared_executor():
+    manager = ExecutorManager()
+    executor = manager.acquire("thread", 2)
+    assert manager.acquire("thread", 2) is executor
+    assert manager.acquire("thread", 3) is not executor
+
+    manager.release(executor)
+    manager.release(executor)
+    # idle executors are kept alive for reuse
+    assert manager.acquire("thread", 2) is executor
+    manager.release(executor)
+    manager.shutdown()
+    assert manager.acquire("thread", 2) is not executor
+
+
+def test_no_keep_alive():
+    manager = ExecutorManager(keep_alive=False)
+    executor = manager.acquire("thread")
+    manager.release(executor)
+    with pytest.raises(RuntimeError):
+        executor.submit(_square, 2)
+
+
+def test_private_executor():
+    manager = ExecutorManager()
+    executor = manager.acquire("process", 1, _square, (2,))
+    assert manager.acquire("process", 1) is not executor
+    assert executor.submit(_square, 3).result() == 9
+    manager.release(executor)
+    with pytest.raises(RuntimeError):
+        executor.submit(_square, 2)
+
+
+def test_invalid_executor_type():
+    with pytest.raises(ValueError):
+        ExecutorManager().acquire("fiber")
+
+
+def test_algorithm_reuses_executor():
+    algo = SimpleEvolution(
+        Subpopulation(
+            DummyIndividualEvaluator(),
+            creators=FullCreator(
+                function_set=[lambda x: x], terminal_set=["x"]
+            ),
+            operators_sequence=[IdentityTransformation()],
+            population_size=4,
+        ),
+        executor="thread",
+        max_workers=1,
+        max_generation=1,
+    )
+    algo.evolve()
+    assert algo.executor is None
+
+    executor = executor_manager.acquire("thread", 1)
+    algo.initialize()
+    assert algo.executor is executor
+    algo.finish()
+    executor_manager.release(executor)
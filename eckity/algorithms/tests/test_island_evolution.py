@@ -0,0 +1,98 @@
+import pytest
+
+from eckity.creators import GABitStringVectorCreator
+from eckity.evaluators import SimpleIndividualEvaluator
+from eckity.genetic_operators import (
+    BitStringVectorFlipMutation,
+    TournamentSelection,
+    VectorKPointsCrossover,
+)
+from eckity.subpopulation import Subpopulation
+
+from ..island_evolution import IslandEvolution
+
+
+class OneMaxEvaluator(SimpleIndividualEvaluator):
+    def evaluate_individual(self, individual):
+        return sum(individual.vector)
+
+
+def make_island():
+    return Subpopulation(
+        OneMaxEvaluator(),
+        creators=GABitStringVectorCreator(length=20),
+        operators_sequence=[
+            VectorKPointsCrossover(probability=0.7, k=1),
+            BitStringVectorFlipMutation(probability=0.2),
+        ],
+        selection_methods=[
+            (TournamentSelection(tournament_size=3, higher_is_better=True), 1)
+        ],
+        population_size=20,
+        higher_is_better=True,
+        elitism_rate=0.1,
+    )
+
+
+def make_algorithm(executor, topology="ring", n_islands=3):
+    return IslandEvolution(
+        [make_island() for _ in range(n_islands)],
+        migration_interval=2,
+        n_migrants=2,
+        topology=topology,
+        max_generation=7,
+        executor=executor,
+        random_seed=0,
+    )
+
+
+@pytest.mark.parametrize("topology", ["ring", "full", "random"])
+def test_evolve(topology):
+    algo = make_algorithm("thread", topology)
+    algo.evolve()
+
+    assert algo.final_generation_ == 7
+    assert len(algo.island_bests) == 3
+    assert algo.best_of_run_.get_pure_fitness() > 15
+    for sub_population in algo.population.sub_populations:
+        assert len(sub_population.individuals) == 20
+
+
+def test_processes_match_serial_islands():
+    serial = make_algorithm("thread")
+    serial.evolve()
+    remote = make_algorithm("process")
+    remote.evolve()
+
+    assert [ind.vector for ind in remote.island_bests] == [
+        ind.vector for ind in serial.island_bests
+    ]
+    assert [
+        ind.get_pure_fitness()
+        for ind in remote.population.sub_populations[0].individuals
+    ] == [
+        ind.get_pure_fitness()
+        for ind in serial.population.sub_populations[0].individuals
+    ]
+
+
+def test_migration_replaces_worst():
+    algo = make_algorithm("thread", n_islands=2)
+    algo.initialize()
+    source, destination = [
+        island.sub_population.individuals for island in algo._islands
+    ]
+    best = max(source, key=lambda ind: ind.get_pure_fitness())
+    worst = min(destination, key=lambda ind: ind.get_pure_fitness())
+
+    # migrate without evolving
+    algo.generation_iteration(0)
+    destination = algo._islands[1].sub_population.individuals
+    assert worst not in destination
+    assert best.vector in [ind.vector for ind in destination]
+    algo.finish()
+
+
+def test_invalid_topology():
+    with pytest.raises(ValueError):
+        IslandEvolution([make_island()], topology="star")
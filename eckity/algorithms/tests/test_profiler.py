@@ -0,0 +1,96 @@
+import csv
+
+from eckity.creators import GABitStringVectorCreator
+from eckity.evaluators import SimpleIndividualEvaluator
+from eckity.genetic_operators import (
+    BitStringVectorFlipMutation,
+    BitStringVectorNFlipMutation,
+    TournamentSelection,
+    VectorKPointsCrossover,
+)
+from eckity.statistics.statistics import Statistics
+from eckity.subpopulation import Subpopulation
+
+from ..profiler import Profiler
+from ..simple_evolution import SimpleEvolution
+
+
+class OneMaxEvaluator(SimpleIndividualEvaluator):
+    def evaluate_individual(self, individual):
+        return sum(individual.vector)
+
+
+class CountingStatistics(Statistics):
+    def __init__(self):
+        super().__init__(format_string="")
+        self.calls = 0
+
+    def write_statistics(self, sender, data_dict):
+        self.calls += 1
+
+
+def make_algorithm(profiler, statistics=None):
+    return SimpleEvolution(
+        Subpopulation(
+            OneMaxEvaluator(),
+            creators=GABitStringVectorCreator(length=20),
+            operators_sequence=[
+                VectorKPointsCrossover(probability=0.5, k=1),
+                BitStringVectorFlipMutation(probability=0.5),
+                BitStringVectorNFlipMutation(probability=1, n=2),
+            ],
+            selection_methods=[
+                (
+                    TournamentSelection(
+                        tournament_size=3, higher_is_better=True
+                    ),
+                    1,
+                )
+            ],
+            population_size=20,
+            higher_is_better=True,
+        ),
+        max_generation=4,
+        random_seed=0,
+        statistics=statistics,
+        profiler=profiler,
+    )
+
+
+def test_profile_generations(tmp_path):
+    profiler = Profiler()
+    algo = make_algorithm(profiler, statistics=[CountingStatistics()])
+    algo.evolve()
+
+    assert [row["generation"] for row in profiler.rows] == [1, 2, 3, 4]
+    columns = profiler.columns()
+    for phase in ["breed", "select", "evaluate", "termination", "statistics"]:
+        assert f"{phase}_wall" in columns and f"{phase}_cpu" in columns
+    for row in profiler.rows:
+        assert row["wall"] >= row["breed_wall"] >= row["select_wall"]
+        assert row["breed_wall"] >= row["VectorKPointsCrossover_wall"]
+        # the flip mutations are applied on each of the 20 individuals
+        assert row["BitStringVectorNFlipMutation_calls"] == 20
+        assert row["BitStringVectorNFlipMutation_attempts"] >= 20
+        assert row["BitStringVectorNFlipMutation_failures"] == 0
+        assert 0 < row["evaluated"] <= 20
+        assert row["evals_per_sec"] > 0
+
+    path = tmp_path / "profile.csv"
+    profiler.write_csv(str(path))
+    with open(path) as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == columns
+    assert len(rows) == 5
+
+
+def test_detached_after_evolution():
+    profiler = Profiler()
+    algo = make_algorithm(profiler)
+    algo.evolve()
+    n_rows = len(profiler.rows)
+
+    assert all(not subscribers for subscribers in algo.breeder.events.values())
+    # profiling continues when the evolution runs again
+    algo.evolve()
+    assert len(profiler.rows) == 2 * n_rows
@@ -25,3 +25,37 @@ def test_initialize():
         )
     )
     algo.initialize()
+
+
+class ConstantIndividualEvaluator(SimpleIndividualEvaluator):
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    def evaluate_individual(self, ind):
+        return self.value
+
+
+def test_initialize_reevaluates_population():
+    evaluator = ConstantIndividualEvaluator(1)
+    algo = SimpleEvolution(
+        Subpopulation(
+            evaluator,
+            creators=FullCreator(
+                function_set=[lambda x: x], terminal_set=["x"]
+            ),
+            population_size=10,
+            operators_sequence=[IdentityTransformation()],
+        )
+    )
+    algo.initialize()
+    individuals = algo.population.sub_populations[0].individuals
+    for ind in individuals:
+        ind.fitness.cache = True
+
+    # the individuals are kept, but not their (cached) fitness scores
+    evaluator.value = 2
+    algo.initialize()
+    assert algo.population.sub_populations[0].individuals is individuals
+    assert all(ind.get_pure_fitness() == 2 for ind in individuals)
+    algo.finish()
@@ -0,0 +1,84 @@
+import pytest
+
+from eckity.creators import GABitStringVectorCreator
+from eckity.evaluators import FitnessCache, SimpleIndividualEvaluator
+from eckity.genetic_operators import (
+    BitStringVectorFlipMutation,
+    TournamentSelection,
+    VectorKPointsCrossover,
+)
+from eckity.subpopulation import Subpopulation
+
+from ..steady_state_evolution import SteadyStateEvolution
+
+
+class OneMaxEvaluator(SimpleIndividualEvaluator):
+    def evaluate_individual(self, individual):
+        return sum(individual.vector)
+
+
+def make_algorithm(
+    replacement="worst", fitness_cache=None, population_size=20
+):
+    return SteadyStateEvolution(
+        Subpopulation(
+            OneMaxEvaluator(fitness_cache=fitness_cache),
+            creators=GABitStringVectorCreator(length=20),
+            operators_sequence=[
+                VectorKPointsCrossover(probability=0.7, k=1),
+                BitStringVectorFlipMutation(probability=0.2),
+            ],
+            selection_methods=[
+                (
+                    TournamentSelection(
+                        tournament_size=3, higher_is_better=True
+                    ),
+                    1,
+                )
+            ],
+            population_size=population_size,
+            higher_is_better=True,
+        ),
+        replacement=replacement,
+        max_workers=2,
+        max_generation=10,
+        random_seed=0,
+    )
+
+
+@pytest.mark.parametrize("replacement", ["worst", "oldest"])
+def test_evolve(replacement):
+    algo = make_algorithm(replacement)
+    algo.evolve()
+    assert algo.n_evaluations == 10 * 20
+    assert algo.best_of_run_.get_pure_fitness() > 15
+    assert len(algo.population.sub_populations[0].individuals) == 20
+
+
+def test_worst_replacement_keeps_best():
+    algo = make_algorithm("worst")
+    algo.max_generation = 1
+    algo.evolve()
+    best = algo.best_of_run_
+    # the best individual is never replaced by a worse one
+    assert best in algo.population.sub_populations[0].individuals
+
+
+def test_fitness_cache():
+    algo = make_algorithm(fitness_cache=FitnessCache())
+    algo.evolve()
+    cache = algo.population.sub_populations[0].evaluator.fitness_cache
+    assert cache.hits > 0
+    assert algo.n_evaluations == 10 * 20
+
+
+def test_invalid_replacement():
+    with pytest.raises(ValueError):
+        make_algorithm("random")
+
+
+def test_group_larger_than_population():
+    # the crossover requires groups of two offspring
+    algo = make_algorithm(population_size=1)
+    with pytest.raises(ValueError):
+        algo.initialize()
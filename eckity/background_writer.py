@@ -0,0 +1,116 @@
+"""
+This module implements the BackgroundWriter class and the atomic_write
+function, used to write files during the evolution without waiting for
+the file system.
+"""
+
+import os
+import tempfile
+from threading import Thread
+from typing import BinaryIO, Callable, Optional
+
+
+class BackgroundWriter:
+    """
+    Runs write functions in a background thread, one at a time and in
+    order of submission.
+
+    An exception raised by a write function is raised again by the next
+    `submit` or `join`.
+
+    Parameters
+    ----------
+    asynchronous: bool, default=True
+        run the write functions in a background thread.
+        If False, they run (and raise) in the calling thread.
+    """
+
+    def __init__(self, asynchronous: bool = True):
+        self.asynchronous = asynchronous
+        self._thread: Optional[Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def submit(self, write: Callable, *args) -> None:
+        """
+        Run a write function, after the previous one finished.
+
+        Parameters
+        ----------
+        write: Callable
+            the write function
+        args:
+            arguments of the write function
+        """
+        self.join()
+        if self.asynchronous:
+            self._thread = Thread(
+                target=self._run, args=(write, args), daemon=True
+            )
+            self._thread.start()
+        else:
+            self._run(write, args)
+            self._raise_error()
+
+    def join(self) -> None:
+        """
+        Wait for the running write function, if any.
+
+        Raises
+        ------
+        Exception
+            the exception raised by the last write function, if any
+        """
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+
+    def _run(self, write: Callable, args) -> None:
+        try:
+            write(*args)
+        except BaseException as e:
+            self._error = e
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_thread"] = None
+        state["_error"] = None
+        return state
+
+
+def atomic_write(
+    path: str, write: Callable[[BinaryIO], None], prefix: str = ""
+) -> None:
+    """
+    Write a file through a temporary file in the same directory, which
+    replaces `path` once it is written and synced to disk. If the write
+    is interrupted, the previous file (if any) is left intact.
+
+    Parameters
+    ----------
+    path: str
+        path of the file
+    write: Callable[[BinaryIO], None]
+        writes the content to the given binary file object
+    prefix: str, default=""
+        prefix of the temporary file name
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=prefix, suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -18,7 +18,9 @@ class Breeder(Operator, ABC):
     """
 
     def __init__(self, events=None):
-        super().__init__(events=events)
+        super().__init__(
+            events=events, event_names=["before_selection", "after_selection"]
+        )
 
     def breed(self, population):
         """
@@ -1,3 +1,5 @@
+from functools import partial
+
 from eckity.breeders.breeder import Breeder
 from eckity.genetic_operators.selections.elitism_selection import (
     ElitismSelection,
@@ -50,6 +52,7 @@ class SimpleBreeder(Breeder):
 
             nextgen_population = []
 
+            self.publish("before_selection")
             num_elites = subpopulation.n_elite
             if num_elites > 0:
                 elitism_sel = ElitismSelection(
@@ -57,12 +60,17 @@ class SimpleBreeder(Breeder):
                     higher_is_better=subpopulation.higher_is_better,
                 )
                 elitism_sel.apply_operator(
-                    (subpopulation.individuals, nextgen_population)
+                    (
+                        subpopulation.individuals,
+                        nextgen_population,
+                        subpopulation.get_fitness_summary(),
+                    )
                 )
 
             self.selected_individuals = subpopulation.get_selection_methods()[
                 0
             ][0].select(subpopulation.individuals, nextgen_population)
+            self.publish("after_selection")
 
             # then runs all operators on next_gen
             nextgen_population = self._apply_operators(
@@ -90,12 +98,11 @@ class SimpleBreeder(Breeder):
                 The individuals list after the operators were applied on them.
         """
         for operator in operator_seq:
-            operator_arity = operator.get_operator_arity()
-            for i in range(0, len(individuals_to_apply_on), operator_arity):
-                op_res = operator.apply_operator(
-                    individuals_to_apply_on[i: i + operator_arity]
-                )
-                individuals_to_apply_on[i: i + operator_arity] = op_res
+            # applied on consecutive groups of `arity` individuals,
+            # publishing the operator events once for all groups
+            individuals_to_apply_on = operator.act_and_publish_before_after(
+                partial(operator.apply_operator_batch, individuals_to_apply_on)
+            )
         return individuals_to_apply_on
 
     def event_name_to_data(self, event_name):
@@ -1,5 +1,10 @@
+import numpy as np
+
 from eckity.creators.ga_creators.simple_vector_creator import GAVectorCreator
 from eckity.genetic_encodings.ga.bit_string_vector import BitStringVector
+from eckity.genetic_encodings.ga.packed_bit_string_vector import (
+    PackedBitStringVector,
+)
 
 
 class GABitStringVectorCreator(GAVectorCreator):
@@ -10,12 +15,27 @@ class GABitStringVectorCreator(GAVectorCreator):
         gene_creator=None,
         events=None,
         update_parents=False,
+        as_matrix=False,
+        packed=False,
     ):
+        if packed and as_matrix:
+            raise ValueError(
+                "Packed bit vectors cannot be stored in a population matrix"
+            )
         super().__init__(
             length=length,
             bounds=bounds,
             gene_creator=gene_creator,
-            vector_type=BitStringVector,
+            vector_type=PackedBitStringVector if packed else BitStringVector,
             events=events,
             update_parents=update_parents,
+            as_matrix=as_matrix,
         )
+        self.packed = packed
+
+    def create_vector(self, individual):
+        if self.packed and self.gene_creator == self.default_gene_creator:
+            # draw all bits at once, instead of one gene at a time
+            individual.set_vector(np.random.randint(0, 2, size=self.length))
+        else:
+            super().create_vector(individual)
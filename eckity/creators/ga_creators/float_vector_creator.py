@@ -10,6 +10,7 @@ class GAFloatVectorCreator(GAVectorCreator):
         bounds=(0.0, 1.0),
         events=None,
         update_parents=False,
+        as_matrix=False,
     ):
         super().__init__(
             length=length,
@@ -18,4 +19,5 @@ class GAFloatVectorCreator(GAVectorCreator):
             vector_type=FloatVector,
             events=events,
             update_parents=update_parents,
+            as_matrix=as_matrix,
         )
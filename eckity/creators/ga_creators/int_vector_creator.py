@@ -10,6 +10,7 @@ class GAIntVectorCreator(GAVectorCreator):
         bounds=(0, 1),
         events=None,
         update_parents=False,
+        as_matrix=False,
     ):
         super().__init__(
             length=length,
@@ -18,4 +19,5 @@ class GAIntVectorCreator(GAVectorCreator):
             vector_type=IntVector,
             events=events,
             update_parents=update_parents,
+            as_matrix=as_matrix,
         )
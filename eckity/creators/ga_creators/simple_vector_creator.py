@@ -1,6 +1,7 @@
 from eckity.creators.creator import Creator
 from eckity.fitness.simple_fitness import SimpleFitness
 from eckity.genetic_encodings.ga.bit_string_vector import BitStringVector
+from eckity.genetic_encodings.ga.vector_matrix import stack_vectors
 
 
 class GAVectorCreator(Creator):
@@ -13,6 +14,7 @@ class GAVectorCreator(Creator):
         fitness_type=SimpleFitness,
         events=None,
         update_parents=False,
+        as_matrix=False,
     ):
         if events is None:
             events = ["after_creation"]
@@ -26,6 +28,9 @@ class GAVectorCreator(Creator):
         self.length = length
         self.bounds = bounds
         self.update_parents = update_parents
+        # store the created vectors as rows of a NumPy population matrix,
+        # which enables batched genetic operators
+        self.as_matrix = as_matrix
 
     def create_individuals(self, n_individuals, higher_is_better):
         individuals = [
@@ -39,6 +44,8 @@ class GAVectorCreator(Creator):
         ]
         for ind in individuals:
             self.create_vector(ind)
+        if self.as_matrix and individuals:
+            stack_vectors(individuals)
         self.created_individuals = individuals
 
         return individuals
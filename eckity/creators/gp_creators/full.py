@@ -7,7 +7,7 @@ from eckity.genetic_encodings.gp import (
     TerminalNode,
     FunctionNode,
 )
-from eckity.genetic_encodings.gp.tree.utils import get_func_types
+from eckity.genetic_encodings.gp.tree.utils import get_signature
 
 
 class FullCreator(GPTreeCreator):
@@ -91,7 +91,7 @@ class FullCreator(GPTreeCreator):
             tree.append(node)
 
             # recursively add argument nodes to the tree
-            func_types = get_func_types(node.function)[:-1]
+            func_types = get_signature(node.function).func_types[:-1]
             for t in func_types:
                 self.create_tree(
                     tree,
@@ -2,7 +2,6 @@ from typing import Any, Callable, Dict, List, Tuple, Union, Optional
 
 from overrides import override
 
-from eckity.base.utils import arity
 from eckity.creators.creator import Creator
 from eckity.fitness.gp_fitness import GPFitness
 from eckity.fitness.simple_fitness import SimpleFitness
@@ -12,7 +11,7 @@ from eckity.genetic_encodings.gp import (
     Tree,
     TreeNode,
 )
-from eckity.genetic_encodings.gp.tree.utils import get_func_types
+from eckity.genetic_encodings.gp.tree.utils import get_signature
 
 
 class GPTreeCreator(Creator):
@@ -122,8 +121,9 @@ class GPTreeCreator(Creator):
         depth : int
             current depth of the tree
         """
-        func_types = get_func_types(fn_node.function)
-        for i in range(arity(fn_node.function)):
+        signature = get_signature(fn_node.function)
+        func_types = signature.func_types
+        for i in range(signature.arity):
             self.create_tree(
                 tree,
                 random_function,
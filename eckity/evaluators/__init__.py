@@ -1,5 +1,9 @@
+from .fitness_cache import FitnessCache
+
 from .individual_evaluator import IndividualEvaluator
 from .simple_individual_evaluator import SimpleIndividualEvaluator
 
 from .population_evaluator import PopulationEvaluator
 from .simple_population_evaluator import SimplePopulationEvaluator
+from .tree_population_evaluator import TreePopulationEvaluator
+from .async_population_evaluator import AsyncPopulationEvaluator
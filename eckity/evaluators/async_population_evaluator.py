@@ -0,0 +1,125 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from overrides import overrides
+
+from eckity.evaluators.simple_population_evaluator import (
+    SimplePopulationEvaluator,
+)
+
+
+class AsyncPopulationEvaluator(SimplePopulationEvaluator):
+    """
+    Computes fitness value for the whole population using asyncio,
+    for I/O-bound fitness functions (e.g. waiting for a simulator or a
+    subprocess).
+
+    If `evaluate_individual` of the individual evaluator is a coroutine
+    function (`async def`), up to `max_concurrency` individuals are
+    awaited concurrently in an event loop. Otherwise, it is run in the
+    executor of the algorithm.
+    All simple classes assume only one sub-population.
+
+    Parameters
+    ----------
+    max_concurrency: int, default=None
+        Maximal number of concurrent evaluations (unlimited if None).
+
+    timeout: float, default=None
+        Maximal evaluation time (in seconds) of a single individual.
+        No limit if None.
+
+    timeout_fitness: float, default=None
+        Fitness score of individuals whose evaluation timed out.
+        These scores are not stored in the fitness cache.
+        If None, a timed out evaluation raises a TimeoutError.
+
+    Attributes
+    ----------
+    timed_out_individuals: list of Individuals
+        Individuals whose evaluation timed out in the last evaluation.
+    """
+
+    def __init__(
+        self, max_concurrency=None, timeout=None, timeout_fitness=None
+    ):
+        super().__init__()
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be positive, got {max_concurrency}"
+            )
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.timeout_fitness = timeout_fitness
+        self.timed_out_individuals = []
+
+    @overrides
+    def _dispatch(self, sp_eval, individuals, environment_individuals):
+        self.timed_out_individuals = []
+        if not individuals:
+            return []
+        coroutine = self._evaluate_all(sp_eval, individuals)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        # called from a running event loop (e.g. in a notebook),
+        # which cannot be blocked on, so use a new loop in another thread
+        with ThreadPoolExecutor(max_workers=1) as loop_thread:
+            return loop_thread.submit(asyncio.run, coroutine).result()
+
+    async def _evaluate_all(self, sp_eval, individuals):
+        semaphore = (
+            asyncio.Semaphore(self.max_concurrency)
+            if self.max_concurrency is not None
+            else None
+        )
+        return await asyncio.gather(
+            *[
+                self._evaluate_one(sp_eval, ind, semaphore)
+                for ind in individuals
+            ]
+        )
+
+    async def _evaluate_one(self, sp_eval, individual, semaphore):
+        # only the score is returned, the base class sets the fitness
+        if semaphore is None:
+            return await self._await_fitness(sp_eval, individual)
+        async with semaphore:
+            return await self._await_fitness(sp_eval, individual)
+
+    async def _await_fitness(self, sp_eval, individual):
+        if inspect.iscoroutinefunction(sp_eval.evaluate_individual):
+            awaitable = sp_eval.evaluate_individual(individual)
+        else:
+            # runs to completion in the executor even if it times out
+            awaitable = asyncio.get_running_loop().run_in_executor(
+                self.executor, sp_eval.evaluate_individual, individual
+            )
+        try:
+            return await asyncio.wait_for(awaitable, self.timeout)
+        except asyncio.TimeoutError:
+            if self.timeout_fitness is None:
+                raise TimeoutError(
+                    f"Evaluation of individual {individual.id} timed out "
+                    f"after {self.timeout} seconds"
+                ) from None
+            self.timed_out_individuals.append(individual)
+            return self.timeout_fitness
+
+    @overrides
+    def _cache_fitness(self, fitness_cache, individuals, keys):
+        timed_out = {id(ind) for ind in self.timed_out_individuals}
+        cached = [
+            (ind, key)
+            for ind, key in zip(individuals, keys)
+            if id(ind) not in timed_out
+        ]
+        super()._cache_fitness(
+            fitness_cache,
+            [ind for ind, _ in cached],
+            [key for _, key in cached],
+        )
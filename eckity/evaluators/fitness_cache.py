@@ -0,0 +1,102 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class FitnessCache:
+    """
+    Memoization cache of fitness scores, keyed by genome.
+
+    Maps the genome key of an individual (see `Individual.genome_key`)
+    to its fitness score, so individuals whose genome was already
+    evaluated (e.g. elites, clones, or failed crossovers) get their
+    fitness score without being evaluated again.
+
+    The cache is bounded: when it exceeds `max_size` entries,
+    the least recently used entries are evicted.
+
+    The cache is meant to be used in the main process only. A pickled
+    cache (e.g. inside an evaluator sent to a worker process) is empty.
+
+    Parameters
+    ----------
+    max_size: int, default=100000
+        Maximal number of cached fitness scores.
+
+    Attributes
+    ----------
+    hits: int
+        Number of lookups that found a cached fitness score.
+    misses: int
+        Number of lookups that did not find a cached fitness score.
+    """
+
+    def __init__(self, max_size: int = 100000):
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._scores = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached fitness score of the given genome key,
+        or `default` if it is not cached.
+
+        Parameters
+        ----------
+        key: Hashable
+            genome key of an individual
+
+        default: object, default=None
+            value to return if the key is not cached
+
+        Returns
+        -------
+        object
+            the cached fitness score, or `default`
+        """
+        try:
+            score = self._scores[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._scores.move_to_end(key)
+        return score
+
+    def put(self, key: Hashable, fitness_score: Any) -> None:
+        """
+        Cache the fitness score of the given genome key
+
+        Parameters
+        ----------
+        key: Hashable
+            genome key of an individual
+
+        fitness_score: object
+            the fitness score of the individual
+        """
+        self._scores[key] = fitness_score
+        self._scores.move_to_end(key)
+        if len(self._scores) > self.max_size:
+            self._scores.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Discard all cached fitness scores and reset the counters
+        """
+        self._scores.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._scores
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_scores"] = OrderedDict()
+        return state
@@ -4,9 +4,20 @@ from eckity.event_based_operator import Operator
 
 
 class PopulationEvaluator(Operator):
+	"""
+	Evaluates the fitness scores of a population.
+
+	Attributes
+	----------
+	n_evaluated: int
+		number of individuals evaluated by the last evaluation
+		(individuals whose fitness was still evaluated are not counted)
+	"""
+
 	def __init__(self):
 		super().__init__()
 		self.executor = None
+		self.n_evaluated = 0
 
 	def _evaluate(self, population):
 		"""
@@ -29,3 +40,20 @@ class PopulationEvaluator(Operator):
 
 	def set_executor(self, executor: Executor):
 		self.executor = executor
+
+	def worker_initializer(self, population):
+		"""
+		Return the initializer of the worker processes used by this
+		population evaluator, or None if it does not need one.
+
+		Parameters
+		----------
+		population:
+			a population instance
+
+		Returns
+		-------
+		tuple of (callable, tuple) or None
+			the initializer function and its arguments
+		"""
+		return None
@@ -0,0 +1,55 @@
+"""
+Worker-side functions for chunked evaluation in a process pool.
+
+The individual evaluator is installed once in each worker process by
+`init_worker` (the pool initializer). Afterwards, each task only holds
+a template individual and a chunk of genomes, and returns the bare
+fitness scores.
+"""
+
+_evaluator = None
+
+
+def init_worker(evaluator):
+    """
+    Install the individual evaluator in the current worker process
+
+    Parameters
+    ----------
+    evaluator: SimpleIndividualEvaluator
+        the individual evaluator of the subpopulation
+    """
+    global _evaluator
+    _evaluator = evaluator
+
+
+def evaluate_chunk(template, genomes):
+    """
+    Evaluate a chunk of genomes using the installed evaluator
+
+    Parameters
+    ----------
+    template: Individual
+        individual whose genome is replaced by each of the genomes.
+        Its own genome may be the first genome, since pickle sends
+        an object referenced twice only once.
+
+    genomes: list
+        genomes to evaluate (see `Individual.get_genome`)
+
+    Returns
+    -------
+    list
+        fitness scores of the genomes, in order
+    """
+    if _evaluator is None:
+        raise ValueError(
+            "No evaluator installed in worker process. "
+            "The process pool must be created with init_worker "
+            "as its initializer."
+        )
+    fitness_scores = []
+    for genome in genomes:
+        template.set_genome(genome)
+        fitness_scores.append(_evaluator.evaluate_individual(template))
+    return fitness_scores
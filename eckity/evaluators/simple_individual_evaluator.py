@@ -2,6 +2,7 @@ from abc import abstractmethod
 
 from overrides import overrides
 
+from eckity.evaluators.fitness_cache import FitnessCache
 from eckity.evaluators.individual_evaluator import IndividualEvaluator
 
 
@@ -11,8 +12,22 @@ class SimpleIndividualEvaluator(IndividualEvaluator):
     All simple classes assume only one sub-population.
     Evaluates each individual separately.
     You will need to extend this class with your fitness evaluation methods.
+
+    Parameters
+    ----------
+    fitness_cache: FitnessCache, default=None
+        Memoization cache of fitness scores, keyed by genome.
+        If set, SimplePopulationEvaluator looks up each individual in the
+        cache (in the main process) before dispatching it for evaluation,
+        and caches the fitness scores of the evaluated individuals.
+        Use only if the fitness score is a deterministic function
+        of the genome.
     """
 
+    def __init__(self, fitness_cache: FitnessCache = None):
+        super().__init__()
+        self.fitness_cache = fitness_cache
+
     @overrides
     def evaluate(self, individual, environment_individuals):
         """
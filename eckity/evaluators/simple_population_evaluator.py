@@ -1,7 +1,12 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 from overrides import overrides
 
 from eckity.evaluators.individual_evaluator import IndividualEvaluator
 from eckity.evaluators.population_evaluator import PopulationEvaluator
+from eckity.evaluators.process_worker import evaluate_chunk, init_worker
 from eckity.fitness.fitness import Fitness
 from eckity.individual import Individual
 
@@ -10,15 +15,45 @@ class SimplePopulationEvaluator(PopulationEvaluator):
     """
     Computes fitness value for the whole population.
     All simple classes assume only one sub-population.
+
+    Only individuals that need evaluation are sent to the executor:
+    individuals whose fitness is still evaluated and either cached
+    (`Fitness.cache`) or carried over by the breeder (`Fitness.reusable`,
+    e.g. parents in `NSGA2Breeder`) keep their fitness score.
+
+    Parameters
+    ----------
+    executor_method: str, default="map"
+        Executor method used to evaluate the individuals:
+        "map" (`evaluate_individual`), "submit" (`evaluate`) or "chunked".
+        In "chunked" mode, the individual evaluator is sent once to each
+        worker process by the pool initializer (so later changes to the
+        evaluator are not seen by the workers), and each generation only
+        the genomes are sent, in chunks (see `Individual.get_genome`).
+
+    chunksize: int, default=None
+        Number of individuals per task in "chunked" mode.
+        By default, the individuals are split into about four chunks
+        per CPU.
     """
 
-    def __init__(self, executor_method="map"):
+    def __init__(self, executor_method="map", chunksize=None):
         super().__init__()
-        if executor_method not in ["map", "submit"]:
+        if executor_method not in ["map", "submit", "chunked"]:
             raise ValueError(
-                f'executor_method must be either "map" or "submit", got {executor_method}'
+                'executor_method must be either "map", "submit" or '
+                f'"chunked", got {executor_method}'
             )
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"chunksize must be positive, got {chunksize}")
         self.executor_method = executor_method
+        self.chunksize = chunksize
+
+    @overrides
+    def worker_initializer(self, population):
+        if self.executor_method != "chunked":
+            return None
+        return init_worker, (population.sub_populations[0].evaluator,)
 
     @overrides
     def _evaluate(self, population):
@@ -45,23 +80,174 @@ class SimplePopulationEvaluator(PopulationEvaluator):
         sub_population = population.sub_populations[0]
         individuals = sub_population.individuals
         sp_eval: IndividualEvaluator = sub_population.evaluator
+        fitness_cache = getattr(sp_eval, "fitness_cache", None)
+
+        # individuals with a cached (still valid) fitness score are kept
+        to_evaluate = [
+            ind for ind in individuals if self._needs_evaluation(ind)
+        ]
+        if fitness_cache is not None:
+            to_evaluate, keys = self._lookup_fitness_cache(
+                fitness_cache, to_evaluate
+            )
+
+        eval_results = self._dispatch(sp_eval, to_evaluate, individuals)
+        for ind, fitness_score in zip(to_evaluate, eval_results):
+            ind.fitness.set_fitness(fitness_score)
+        self.n_evaluated = len(to_evaluate)
+
+        if fitness_cache is not None:
+            self._cache_fitness(fitness_cache, to_evaluate, keys)
+
+        sub_population.invalidate_fitness_summary()
+        return self._get_best_individual(individuals)
+
+    def _dispatch(self, sp_eval, individuals, environment_individuals):
+        """
+        Evaluate the given individuals using the executor
+
+        Parameters
+        ----------
+        sp_eval: IndividualEvaluator
+                the individual evaluator of the subpopulation
 
+        individuals: list of Individuals
+                the individuals to evaluate
+
+        environment_individuals: list of Individuals
+                the individuals of the subpopulation
+
+        Returns
+        -------
+        iterable
+                the fitness scores of the given individuals, in order
+        """
         if self.executor_method == "submit":
             eval_futures = [
                 self.executor.submit(
-                    sp_eval.evaluate, ind, sub_population.individuals
+                    _evaluate_fitness, sp_eval, ind, environment_individuals
                 )
-                for ind in sub_population.individuals
+                for ind in individuals
             ]
-            eval_results = [future.result() for future in eval_futures]
-        elif self.executor_method == "map":
-            eval_results = self.executor.map(
-                sp_eval.evaluate_individual, sub_population.individuals
+            return [future.result() for future in eval_futures]
+        if self.executor_method == "chunked":
+            return self._dispatch_chunks(sp_eval, individuals)
+        return self.executor.map(sp_eval.evaluate_individual, individuals)
+
+    def _dispatch_chunks(self, sp_eval, individuals):
+        if not individuals:
+            return []
+        chunksize = self.chunksize
+        if chunksize is None:
+            n_chunks = 4 * (os.cpu_count() or 1)
+            chunksize = -(-len(individuals) // n_chunks)
+        chunks = [
+            individuals[i : i + chunksize]
+            for i in range(0, len(individuals), chunksize)
+        ]
+
+        if isinstance(self.executor, ProcessPoolExecutor):
+            # the evaluator is already installed in the workers,
+            # so only the genomes are pickled (the first individual
+            # of each chunk serves as a template for the others)
+            results = self.executor.map(
+                evaluate_chunk,
+                [chunk[0] for chunk in chunks],
+                [[ind.get_genome() for ind in chunk] for chunk in chunks],
             )
-        for ind, fitness_score in zip(
-            sub_population.individuals, eval_results
-        ):
-            ind.fitness.set_fitness(fitness_score)
+        else:
+            # threads share the evaluator and individuals in memory
+            results = self.executor.map(
+                partial(_evaluate_individuals, sp_eval), chunks
+            )
+        return [score for chunk_scores in results for score in chunk_scores]
+
+    @staticmethod
+    def _needs_evaluation(individual):
+        """
+        Check if the individual should be evaluated
+        (see `Fitness.needs_evaluation`).
+
+        Parameters
+        ----------
+        individual: Individual
+                the individual to check
+
+        Returns
+        -------
+        bool
+                True if the individual should be evaluated, False otherwise
+        """
+        return individual.fitness.needs_evaluation()
+
+    @staticmethod
+    def _lookup_fitness_cache(fitness_cache, individuals):
+        """
+        Set the fitness scores of individuals whose genome is cached
+
+        Parameters
+        ----------
+        fitness_cache: FitnessCache
+                memoization cache of fitness scores
+
+        individuals: list of Individuals
+                the individuals to look up
+
+        Returns
+        -------
+        tuple of (list of Individuals, list of Hashable)
+                the individuals that were not found in the cache,
+                and their genome keys (None if they cannot be cached)
+        """
+        missing = object()
+        to_evaluate, keys = [], []
+        for ind in individuals:
+            key = None
+            if not ind.fitness.is_relative_fitness:
+                key = ind.genome_key()
+            if key is not None:
+                fitness_score = fitness_cache.get(key, missing)
+                if fitness_score is not missing:
+                    ind.fitness.set_fitness(fitness_score)
+                    continue
+            to_evaluate.append(ind)
+            keys.append(key)
+        return to_evaluate, keys
+
+    def _cache_fitness(self, fitness_cache, individuals, keys):
+        """
+        Cache the fitness scores of the evaluated individuals
+
+        Parameters
+        ----------
+        fitness_cache: FitnessCache
+                memoization cache of fitness scores
+
+        individuals: list of Individuals
+                the evaluated individuals
+
+        keys: list of Hashable
+                the genome keys of the individuals (None if not cacheable)
+        """
+        for ind, key in zip(individuals, keys):
+            if key is not None:
+                fitness_cache.put(key, ind.fitness.get_pure_fitness())
+
+    @staticmethod
+    def _get_best_individual(individuals):
+        """
+        Return the individual with the best fitness of the given individuals
+
+        Parameters
+        ----------
+        individuals: list of Individuals
+                evaluated individuals
+
+        Returns
+        -------
+        individual
+                the individual with the best fitness of the given individuals
+        """
         best_ind: Individual = individuals[0]
         best_fitness: Fitness = best_ind.fitness
 
@@ -71,3 +257,15 @@ class SimplePopulationEvaluator(PopulationEvaluator):
                 best_fitness = ind.fitness
 
         return best_ind
+
+
+def _evaluate_fitness(sp_eval, individual, environment_individuals):
+    # return the score itself, since the fitness of the returned
+    # individual is reset when pickled (unless fitness.cache is set)
+    return sp_eval.evaluate(
+        individual, environment_individuals
+    ).fitness.get_pure_fitness()
+
+
+def _evaluate_individuals(sp_eval, individuals):
+    return [sp_eval.evaluate_individual(ind) for ind in individuals]
@@ -0,0 +1,118 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from eckity.evaluators import (
+    AsyncPopulationEvaluator,
+    FitnessCache,
+    SimpleIndividualEvaluator,
+)
+from eckity.genetic_encodings.ga import BitStringVector
+from eckity.multi_objective_evolution.nsga2_fitness import NSGA2Fitness
+
+from .test_simple_population_evaluator import (
+    CountingOneMaxEvaluator,
+    make_population,
+)
+
+
+class AsyncOneMaxEvaluator(SimpleIndividualEvaluator):
+    def __init__(self, fitness_cache=None, slow_delay=0.0):
+        super().__init__(fitness_cache=fitness_cache)
+        self.slow_delay = slow_delay
+        self.running = 0
+        self.max_running = 0
+
+    async def evaluate_individual(self, individual):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # all-ones vectors take longer to simulate
+        delay = self.slow_delay if all(individual.vector) else 0.01
+        await asyncio.sleep(delay)
+        self.running -= 1
+        return sum(individual.vector)
+
+
+class AsyncTwoObjectivesEvaluator(SimpleIndividualEvaluator):
+    async def evaluate_individual(self, individual):
+        await asyncio.sleep(0.01)
+        ones = sum(individual.vector)
+        return [ones, len(individual.vector) - ones]
+
+
+VECTORS = [[0, 0, 1], [1, 1, 1], [0, 1, 1], [1, 0, 0]]
+
+
+def test_async_evaluate():
+    evaluator = AsyncOneMaxEvaluator()
+    population = make_population(evaluator, VECTORS)
+    pop_eval = AsyncPopulationEvaluator(max_concurrency=2)
+    best = pop_eval.act(population)
+
+    individuals = population.sub_populations[0].individuals
+    assert [ind.get_pure_fitness() for ind in individuals] == [1, 3, 2, 1]
+    assert best is individuals[1]
+    assert evaluator.max_running == 2
+
+
+def test_sync_evaluator_in_executor():
+    population = make_population(CountingOneMaxEvaluator(), VECTORS)
+    pop_eval = AsyncPopulationEvaluator()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pop_eval.set_executor(executor)
+        pop_eval.act(population)
+    individuals = population.sub_populations[0].individuals
+    assert [ind.get_pure_fitness() for ind in individuals] == [1, 3, 2, 1]
+
+
+def test_timeout_fitness():
+    evaluator = AsyncOneMaxEvaluator(
+        fitness_cache=FitnessCache(), slow_delay=10
+    )
+    population = make_population(evaluator, VECTORS)
+    pop_eval = AsyncPopulationEvaluator(timeout=0.2, timeout_fitness=-1)
+    best = pop_eval.act(population)
+
+    individuals = population.sub_populations[0].individuals
+    assert [ind.get_pure_fitness() for ind in individuals] == [1, -1, 2, 1]
+    assert best is individuals[2]
+    assert pop_eval.timed_out_individuals == [individuals[1]]
+    # timeout scores are not cached
+    assert len(evaluator.fitness_cache) == 3
+
+
+def test_timeout_error():
+    evaluator = AsyncOneMaxEvaluator(slow_delay=10)
+    population = make_population(evaluator, VECTORS)
+    pop_eval = AsyncPopulationEvaluator(timeout=0.2)
+    with pytest.raises(TimeoutError):
+        pop_eval.act(population)
+
+
+def test_running_event_loop():
+    population = make_population(AsyncOneMaxEvaluator(), VECTORS)
+    pop_eval = AsyncPopulationEvaluator()
+
+    async def evaluate():
+        return pop_eval.act(population)
+
+    best = asyncio.run(evaluate())
+    assert best is population.sub_populations[0].individuals[1]
+
+
+def test_multi_objective_fitness():
+    # NSGA2Fitness can only be set once per evaluation
+    population = make_population(AsyncTwoObjectivesEvaluator(), VECTORS)
+    sub_population = population.sub_populations[0]
+    sub_population.individuals = [
+        BitStringVector(NSGA2Fitness(higher_is_better=True), 3, vector=v)
+        for v in VECTORS
+    ]
+    AsyncPopulationEvaluator().act(population)
+    assert [ind.get_pure_fitness() for ind in sub_population.individuals] == [
+        [1, 2],
+        [3, 0],
+        [2, 1],
+        [1, 2],
+    ]
@@ -0,0 +1,141 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from eckity.creators import GABitStringVectorCreator
+from eckity.evaluators import (
+    FitnessCache,
+    SimpleIndividualEvaluator,
+    SimplePopulationEvaluator,
+)
+from eckity.fitness import SimpleFitness
+from eckity.genetic_encodings.ga import BitStringVector
+from eckity.genetic_operators import IdentityTransformation
+from eckity.population import Population
+from eckity.subpopulation import Subpopulation
+
+
+class CountingOneMaxEvaluator(SimpleIndividualEvaluator):
+    def __init__(self, fitness_cache=None):
+        super().__init__(fitness_cache=fitness_cache)
+        self.n_evaluations = 0
+
+    def evaluate_individual(self, individual):
+        self.n_evaluations += 1
+        return sum(individual.vector)
+
+
+def make_population(evaluator, vectors, cache=False):
+    sub_pop = Subpopulation(
+        evaluator,
+        creators=GABitStringVectorCreator(length=3),
+        operators_sequence=[IdentityTransformation()],
+        population_size=len(vectors),
+        higher_is_better=True,
+    )
+    sub_pop.individuals = [
+        BitStringVector(
+            SimpleFitness(higher_is_better=True, cache=cache), 3, vector=v
+        )
+        for v in vectors
+    ]
+    return Population([sub_pop])
+
+
+@pytest.mark.parametrize("executor_method", ["map", "submit"])
+def test_evaluate(executor_method):
+    evaluator = CountingOneMaxEvaluator()
+    population = make_population(evaluator, [[0, 1, 0], [1, 1, 0]])
+    pop_eval = SimplePopulationEvaluator(executor_method=executor_method)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pop_eval.set_executor(executor)
+        best = pop_eval.act(population)
+    individuals = population.sub_populations[0].individuals
+    assert best is individuals[1]
+    assert [ind.get_pure_fitness() for ind in individuals] == [1, 2]
+
+
+def test_skip_evaluated():
+    evaluator = CountingOneMaxEvaluator()
+    population = make_population(evaluator, [[0, 1, 0], [1, 1, 0]], True)
+    individuals = population.sub_populations[0].individuals
+    pop_eval = SimplePopulationEvaluator()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pop_eval.set_executor(executor)
+        pop_eval.act(population)
+        individuals[0].set_fitness_not_evaluated()
+        individuals[0].vector[0] = 1
+        pop_eval.act(population)
+    assert [ind.get_pure_fitness() for ind in individuals] == [2, 2]
+    assert evaluator.n_evaluations == 3
+
+
+def test_reevaluate_not_cached():
+    evaluator = CountingOneMaxEvaluator()
+    population = make_population(evaluator, [[0, 1, 0], [1, 1, 0]])
+    individuals = population.sub_populations[0].individuals
+    pop_eval = SimplePopulationEvaluator()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pop_eval.set_executor(executor)
+        pop_eval.act(population)
+        # only fitness scores carried over by the breeder are reused
+        individuals[0].fitness.reusable = True
+        pop_eval.act(population)
+    assert evaluator.n_evaluations == 3
+    assert pop_eval.n_evaluated == 1
+
+
+def test_fitness_cache():
+    evaluator = CountingOneMaxEvaluator(fitness_cache=FitnessCache())
+    pop_eval = SimplePopulationEvaluator()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pop_eval.set_executor(executor)
+        pop_eval.act(make_population(evaluator, [[0, 1, 0], [1, 1, 1]]))
+        population = make_population(evaluator, [[1, 1, 1], [0, 0, 1]])
+        pop_eval.act(population)
+
+    individuals = population.sub_populations[0].individuals
+    assert [ind.get_pure_fitness() for ind in individuals] == [3, 1]
+    assert evaluator.n_evaluations == 3
+    assert evaluator.fitness_cache.hits == 1
+    assert evaluator.fitness_cache.misses == 3
+
+
+def test_fitness_cache_eviction():
+    cache = FitnessCache(max_size=2)
+    cache.put((0,), 0)
+    cache.put((1,), 1)
+    assert cache.get((0,)) == 0
+    cache.put((2,), 2)
+    # (1,) is the least recently used key
+    assert (1,) not in cache
+    assert len(cache) == 2
+    assert cache.get((1,), "missing") == "missing"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("executor_type", ["thread", "process"])
+def test_chunked(executor_type):
+    evaluator = CountingOneMaxEvaluator()
+    vectors = [[i & 1, i >> 1 & 1, i >> 2 & 1] for i in range(8)]
+    population = make_population(evaluator, vectors)
+    pop_eval = SimplePopulationEvaluator(
+        executor_method="chunked", chunksize=3
+    )
+    if executor_type == "thread":
+        executor = ThreadPoolExecutor(max_workers=2)
+    else:
+        initializer, initargs = pop_eval.worker_initializer(population)
+        executor = ProcessPoolExecutor(
+            max_workers=2, initializer=initializer, initargs=initargs
+        )
+    with executor:
+        pop_eval.set_executor(executor)
+        best = pop_eval.act(population)
+    individuals = population.sub_populations[0].individuals
+    assert [ind.get_pure_fitness() for ind in individuals] == [
+        sum(v) for v in vectors
+    ]
+    assert best is individuals[7]
+    # individuals are not modified by the workers
+    assert [ind.vector for ind in individuals] == vectors
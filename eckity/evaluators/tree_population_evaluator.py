@@ -0,0 +1,83 @@
+from overrides import overrides
+
+from eckity.evaluators.simple_population_evaluator import (
+    SimplePopulationEvaluator,
+)
+from eckity.genetic_encodings.gp.tree.subtree_cache import SubtreeCache
+
+
+class TreePopulationEvaluator(SimplePopulationEvaluator):
+    """
+    Computes fitness value for a population of GP trees,
+    sharing the results of common subtrees between the trees.
+
+    Before evaluation, all subtrees in the population are hashed, and
+    the individual evaluator executes the trees through a SubtreeCache,
+    so a subtree that appears in several trees (or several times in the
+    same tree) is only computed once per generation.
+
+    The individual evaluator must support a `subtree_cache` attribute,
+    such as RegressionEvaluator and ClassificationEvaluator.
+    Since the cache lives in the main process, the individuals are
+    evaluated serially, and the executor is not used.
+    All simple classes assume only one sub-population.
+
+    Parameters
+    ----------
+    max_cache_bytes: int, default=2**28
+        Memory budget (in bytes) of the subtree cache.
+        When exceeded, the least recently used results are evicted.
+    """
+
+    def __init__(self, max_cache_bytes: int = 2**28):
+        super().__init__()
+        self.subtree_cache = SubtreeCache(max_bytes=max_cache_bytes)
+
+    @overrides
+    def _evaluate(self, population):
+        """
+        Updates the fitness score of the given individuals, then returns the best individual
+
+        Parameters
+        ----------
+        population:
+                the population of the evolutionary experiment
+
+        Returns
+        -------
+        individual
+                the individual with the best fitness of the given individuals
+        """
+        self.applied_individuals = population
+
+        if len(population.sub_populations) != 1:
+            raise ValueError(
+                f"TreePopulationEvaluator can only handle one subpopulation. "
+                f"Got: {len(population.sub_populations)}"
+            )
+        sub_population = population.sub_populations[0]
+        individuals = sub_population.individuals
+        sp_eval = sub_population.evaluator
+        if not hasattr(sp_eval, "subtree_cache"):
+            raise ValueError(
+                f"{type(sp_eval).__name__} does not support a subtree cache"
+            )
+
+        # results of the previous generation are computed on the same
+        # input, but most of them belong to subtrees that were discarded
+        to_evaluate = [
+            ind for ind in individuals if self._needs_evaluation(ind)
+        ]
+        self.subtree_cache.clear()
+        self.subtree_cache.prepare(to_evaluate)
+
+        sp_eval.subtree_cache = self.subtree_cache
+        try:
+            for ind in to_evaluate:
+                ind.fitness.set_fitness(sp_eval.evaluate_individual(ind))
+        finally:
+            sp_eval.subtree_cache = None
+        self.n_evaluated = len(to_evaluate)
+
+        sub_population.invalidate_fitness_summary()
+        return self._get_best_individual(individuals)
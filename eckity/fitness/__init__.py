@@ -1,3 +1,4 @@
 from .fitness import Fitness
 from .simple_fitness import SimpleFitness
 from .gp_fitness import GPFitness
+from .fitness_summary import FitnessSummary
@@ -22,6 +22,11 @@ class Fitness(ABC):
 
     is_relative_fitness: bool
         declares whether the fitness score is absolute or relative
+
+    reusable: bool
+        declares whether the fitness score was carried over unchanged by the
+        breeder (e.g. parents in `NSGA2Breeder`), and should not be evaluated
+        again until it is reset
     """
 
     def __init__(
@@ -34,6 +39,7 @@ class Fitness(ABC):
         self._is_evaluated = is_evaluated
         self.is_relative_fitness = is_relative_fitness
         self.cache = False if is_relative_fitness else cache
+        self.reusable = False
 
         if higher_is_better is None:
             raise ValueError("higher_is_better must be set to True/False")
@@ -114,6 +120,7 @@ class Fitness(ABC):
         Set this fitness score status to be not evaluated
         """
         self._is_evaluated = False
+        self.reusable = False
 
     def is_fitness_evaluated(self):
         """
@@ -127,3 +134,19 @@ class Fitness(ABC):
         if self.is_relative_fitness:
             return True
         return self._is_evaluated
+
+    def needs_evaluation(self):
+        """
+        Check if this fitness score should be evaluated.
+        An evaluated fitness score is kept only if it is cached
+        (see `cache`) or carried over by the breeder (see `reusable`).
+        Relative fitness scores are always evaluated.
+
+        Returns
+        ----------
+        bool
+            True if this fitness should be evaluated, False otherwise
+        """
+        if self.is_relative_fitness or not self.is_fitness_evaluated():
+            return True
+        return not (self.cache or self.reusable)
@@ -0,0 +1,125 @@
+"""
+This module implements the class `FitnessSummary`
+"""
+
+import heapq
+from typing import List
+
+import numpy as np
+
+
+class FitnessSummary:
+    """
+    Summary of the fitness scores of a group of evaluated individuals
+    (usually a sub-population in some generation).
+
+    The augmented fitness scores are computed in a single pass on
+    creation, and the best, worst and top individuals are found from them
+    without sorting the individuals. Individuals are compared by their
+    augmented fitness scores, and ties are broken by their order in the
+    group (the first one is taken).
+
+    Parameters
+    ----------
+    individuals: list of Individuals
+        evaluated individuals (not empty)
+
+    higher_is_better: bool, default=False
+        declares the fitness direction.
+        i.e., if it should be minimized or maximized
+
+    Attributes
+    ----------
+    scores: list
+        augmented fitness score of every individual
+
+    argmin: int
+        index of the (first) individual with the lowest score
+
+    argmax: int
+        index of the (first) individual with the highest score
+    """
+
+    def __init__(self, individuals, higher_is_better=False):
+        if not individuals:
+            raise ValueError("Cannot summarize an empty group of individuals")
+        self.individuals = individuals
+        self.higher_is_better = higher_is_better
+        self.scores = [ind.get_augmented_fitness() for ind in individuals]
+
+        indices = range(len(individuals))
+        self.argmin = min(indices, key=self.scores.__getitem__)
+        self.argmax = max(indices, key=self.scores.__getitem__)
+        self._mean = None
+
+    @property
+    def min(self):
+        return self.scores[self.argmin]
+
+    @property
+    def max(self):
+        return self.scores[self.argmax]
+
+    @property
+    def best(self):
+        """
+        The individual with the best fitness score
+        """
+        index = self.argmax if self.higher_is_better else self.argmin
+        return self.individuals[index]
+
+    @property
+    def worst(self):
+        """
+        The individual with the worst fitness score
+        """
+        index = self.argmin if self.higher_is_better else self.argmax
+        return self.individuals[index]
+
+    @property
+    def mean(self):
+        """
+        Average pure fitness score (before applying bloat control)
+        """
+        if self._mean is None:
+            self._mean = np.mean(
+                [ind.get_pure_fitness() for ind in self.individuals]
+            )
+        return self._mean
+
+    def top(self, k) -> List:
+        """
+        Return the k individuals with the best fitness scores,
+        best first (same as sorting the individuals, but in O(n log k))
+
+        Parameters
+        ----------
+        k: int
+            number of individuals
+
+        Returns
+        -------
+        list of Individuals
+            the best k individuals
+        """
+        return [self.individuals[i] for i in self.top_indices(k)]
+
+    def top_indices(self, k) -> List[int]:
+        """
+        Return the indices of the k individuals with the best fitness
+        scores, best first
+        """
+        select = heapq.nlargest if self.higher_is_better else heapq.nsmallest
+        return select(
+            k, range(len(self.individuals)), key=self.scores.__getitem__
+        )
+
+    def bottom_indices(self, k) -> List[int]:
+        """
+        Return the indices of the k individuals with the worst fitness
+        scores, worst first
+        """
+        select = heapq.nsmallest if self.higher_is_better else heapq.nlargest
+        return select(
+            k, range(len(self.individuals)), key=self.scores.__getitem__
+        )
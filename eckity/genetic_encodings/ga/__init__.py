@@ -1,4 +1,5 @@
 from .bit_string_vector import BitStringVector
 from .float_vector import FloatVector
 from .int_vector import IntVector
+from .packed_bit_string_vector import PackedBitStringVector
 from .vector_individual import Vector
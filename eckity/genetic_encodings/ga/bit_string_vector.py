@@ -4,6 +4,8 @@ This module implements the BitStringVector class.
 
 from random import randint
 
+import numpy as np
+
 from eckity.genetic_encodings.ga.vector_individual import Vector
 
 
@@ -26,6 +28,8 @@ class BitStringVector(Vector):
         or the minimum and maximum (if of length 1).
     """
 
+    dtype = np.int64
+
     def __init__(self,
                  fitness,
                  length,
@@ -62,4 +66,15 @@ class BitStringVector(Vector):
         return self.bounds[1] \
             if self.cell_value(index) == self.bounds[0] else self.bounds[0]
 
+    def count_ones(self):
+        """
+        Count the cells that are set to the upper bound (one).
+
+        Returns
+        -------
+        int
+            number of ones
+        """
+        return int(np.count_nonzero(np.asarray(self.vector) == self.bounds[1]))
+
 # end class bit string vector
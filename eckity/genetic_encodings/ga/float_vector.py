@@ -4,6 +4,8 @@ This module implements the FloatVector class.
 
 from random import uniform, gauss
 
+import numpy as np
+
 from eckity.genetic_encodings.ga.vector_individual import Vector
 
 
@@ -24,6 +26,8 @@ class FloatVector(Vector):
         Min/Max values for each vector cell (if of length n), or the minimum and maximum (if of length 1).
     """
 
+    dtype = np.float64
+
     def __init__(
         self,
         fitness,
@@ -4,6 +4,8 @@ This module implements the IntVector class.
 
 from random import randint
 
+import numpy as np
+
 from eckity.genetic_encodings.ga.vector_individual import Vector
 
 MIN_BOUND = 2**31 - 1
@@ -27,6 +29,8 @@ class IntVector(Vector):
         Min/Max values for each vector cell (if of length n), or the minimum and maximum (if of length 1).
     """
 
+    dtype = np.int64
+
     def __init__(
         self,
         fitness,
@@ -0,0 +1,287 @@
+"""
+This module implements the PackedBitStringVector class.
+"""
+
+from typing import List
+
+import numpy as np
+
+from eckity.genetic_encodings.ga.bit_string_vector import BitStringVector
+
+WORD_BITS = 64
+_FULL_WORD = (1 << WORD_BITS) - 1
+# number of ones in each byte, for NumPy versions without bitwise_count
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], np.uint8)
+
+
+class PackedBitStringVector(BitStringVector):
+    """
+    A bit vector individual representation, packed into 64-bit words.
+
+    Each bit takes a single bit of memory (instead of a Python int
+    reference), and flips, crossovers, hashing and counting of ones are
+    performed word-wise. Cell access (`cell_value`, `set_cell_value`,
+    `bit_flip`) is compatible with BitStringVector.
+
+    Bit i is stored in bit (i % 64) of word (i // 64). Bits past the
+    vector length in the last word are always zero.
+
+    Note that `vector` is a read-only, unpacked copy of the bits (a list
+    of ints): assigning it (or calling `set_vector`) packs the given bits,
+    while modifying the list in-place raises a TypeError. Use
+    `set_cell_value` (or `bit_flip`) to change single bits.
+
+    Parameters
+    ----------
+    fitness : Fitness
+        Fitness handler class.
+        Responsible of keeping the fitness value of the individual.
+
+    length : int
+        Vector length - the number of cells in the vector.
+
+    bounds : tuple, default=(0, 1)
+        Min/Max values of the cells, must be (0, 1).
+
+    vector : list or numpy.ndarray, default=None
+        Bits of the vector. All zeros by default.
+
+    Attributes
+    ----------
+    words : numpy.ndarray
+        The packed bits, of dtype uint64.
+    """
+
+    def __init__(
+        self,
+        fitness,
+        length,
+        bounds=(0, 1),
+        vector=None,
+        update_parents=False,
+    ):
+        if bounds != (0, 1):
+            raise ValueError(
+                f"Packed bit vectors must have bounds (0, 1), got {bounds}"
+            )
+        super().__init__(
+            fitness=fitness,
+            length=length,
+            bounds=bounds,
+            vector=vector,
+            update_parents=update_parents,
+        )
+        if vector is None:
+            self.words = np.zeros(n_words(length), dtype=np.uint64)
+
+    @property
+    def vector(self) -> List[int]:
+        return ReadOnlyBits(unpack_bits(self.words, self.length).tolist())
+
+    @vector.setter
+    def vector(self, vector):
+        self.words = pack_bits(vector)
+
+    def cell_value(self, index):
+        """
+        Get vector cell value in a given index.
+
+        Parameters
+        ----------
+        index : int
+            cell index
+
+        Returns
+        -------
+        int
+            the bit in the given index (0 or 1)
+        """
+        return (int(self.words[index >> 6]) >> (index & 63)) & 1
+
+    def set_cell_value(self, index, value):
+        """
+        Set vector cell value in a given index.
+
+        Parameters
+        ----------
+        index : int
+            cell index
+
+        value : int
+            new bit value (0 or 1)
+
+        Returns
+        -------
+        None
+        """
+        word = int(self.words[index >> 6])
+        if value:
+            word |= 1 << (index & 63)
+        else:
+            word &= ~(1 << (index & 63))
+        self.words[index >> 6] = word
+
+    def set_vector(self, vector):
+        self.words = pack_bits(vector)
+        self.length = len(vector)
+
+    def add_cell(self, cell):
+        self.set_vector(self.vector + [cell])
+
+    def check_if_in_bounds(self):
+        # every bit is either 0 or 1
+        return True
+
+    def flip_bits(self, indices):
+        """
+        Flip the bits in the given indices in-place.
+
+        Parameters
+        ----------
+        indices : array-like of int
+            cell indices, without repetitions
+        """
+        indices = np.asarray(indices, dtype=np.uint64)
+        np.bitwise_xor.at(
+            self.words,
+            (indices >> np.uint64(6)).astype(np.intp),
+            np.left_shift(np.uint64(1), indices & np.uint64(63)),
+        )
+
+    def swap_segments(self, other, xo_points):
+        """
+        Swap every other segment of the vector with the other vector,
+        starting with the first segment (e.g. for crossover points [2, 5],
+        the cells before index 2 and from index 5 onwards are swapped).
+
+        Parameters
+        ----------
+        other : PackedBitStringVector
+            vector of the same length
+        xo_points : List[int]
+            sorted crossover points
+        """
+        mask = np.zeros_like(self.words)
+        bounds = [0, *xo_points, self.length]
+        for start, end in zip(bounds[::2], bounds[1::2]):
+            set_bit_range(mask, start, end)
+        diff = (self.words ^ other.words) & mask
+        self.words ^= diff
+        other.words ^= diff
+
+    def count_ones(self):
+        """
+        Count the ones in the vector, word-wise.
+
+        Returns
+        -------
+        int
+            number of ones
+        """
+        return popcount(self.words)
+
+    def _copy(self):
+        result = self._shallow_copy()
+        result.words = self.words.copy()
+        return result
+
+    def genome_key(self):
+        return self.words.tobytes()
+
+    def get_genome(self):
+        return self.words.copy()
+
+    def set_genome(self, genome):
+        self.words = genome.copy()
+
+
+class ReadOnlyBits(list):
+    """
+    Unpacked bits of a PackedBitStringVector, which cannot be modified
+    in-place (the packed bits would not change). Copies of the list,
+    such as slices and concatenations, are plain lists.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            "The vector of a PackedBitStringVector is read-only, "
+            "use set_cell_value or assign the vector instead"
+        )
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = _read_only
+    sort = reverse = _read_only
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def n_words(length):
+    return (length + WORD_BITS - 1) // WORD_BITS
+
+
+def pack_bits(bits) -> np.ndarray:
+    """
+    Pack bits (zeros and ones) into 64-bit words.
+
+    Parameters
+    ----------
+    bits : array-like
+        bits to pack
+
+    Returns
+    -------
+    numpy.ndarray
+        packed bits, of dtype uint64
+    """
+    packed = np.packbits(np.asarray(bits, dtype=bool), bitorder="little")
+    padded = np.zeros(n_words(len(bits)) * 8, dtype=np.uint8)
+    padded[: len(packed)] = packed
+    return padded.view("<u8").astype(np.uint64)
+
+
+def unpack_bits(words, length) -> np.ndarray:
+    """
+    Unpack 64-bit words into bits.
+
+    Parameters
+    ----------
+    words : numpy.ndarray
+        packed bits, of dtype uint64
+    length : int
+        number of bits
+
+    Returns
+    -------
+    numpy.ndarray
+        bits, of dtype uint8
+    """
+    return np.unpackbits(
+        words.astype("<u8").view(np.uint8), count=length, bitorder="little"
+    )
+
+
+def set_bit_range(words, start, end):
+    """
+    Set the bits in the range [start, end) of packed words.
+    """
+    if start >= end:
+        return
+    first, last = start >> 6, (end - 1) >> 6
+    head = (_FULL_WORD << (start & 63)) & _FULL_WORD
+    tail = _FULL_WORD >> (63 - ((end - 1) & 63))
+    if first == last:
+        words[first] |= np.uint64(head & tail)
+    else:
+        words[first] |= np.uint64(head)
+        words[first + 1: last] = np.uint64(_FULL_WORD)
+        words[last] |= np.uint64(tail)
+
+
+def popcount(words) -> int:
+    """
+    Count the set bits of packed words.
+    """
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(words).sum(dtype=np.int64))
+    return int(_BYTE_POPCOUNT[words.view(np.uint8)].sum(dtype=np.int64))
@@ -62,3 +62,13 @@ class TestIntVector:
         # Check that fitness is evaluated and equal to original one
         assert v2.fitness.get_pure_fitness() == score
         assert v2.fitness.is_fitness_evaluated()
+
+    def test_clone_copies_vector(self):
+        v1 = IntVector(SimpleFitness(), length=2, vector=[0, 1])
+        v2 = v1.clone()
+
+        v2.set_cell_value(0, 5)
+        assert v1.vector == [0, 1]
+        assert v2.bounds is v1.bounds
+        # fitness is not evaluated, since it is not cached
+        assert not v2.fitness.is_fitness_evaluated()
@@ -0,0 +1,98 @@
+import pytest
+
+from eckity.creators.ga_creators.bit_string_vector_creator import (
+    GABitStringVectorCreator,
+)
+from eckity.fitness.simple_fitness import SimpleFitness
+from eckity.genetic_encodings.ga.packed_bit_string_vector import (
+    PackedBitStringVector,
+)
+from eckity.genetic_operators.crossovers.vector_k_point_crossover import (
+    VectorKPointsCrossover,
+)
+from eckity.genetic_operators.mutations.vector_random_mutation import (
+    BitStringVectorFlipMutation,
+)
+
+
+def make_vector(cells):
+    return PackedBitStringVector(
+        SimpleFitness(), length=len(cells), vector=cells
+    )
+
+
+class TestPackedBitStringVector:
+    def test_cells(self):
+        cells = [1, 0, 1] + [0] * 62 + [1, 1]
+        vec = make_vector(cells)
+
+        assert vec.size() == len(cells)
+        assert vec.vector == cells
+        assert vec.words.nbytes == 16
+        assert [vec.cell_value(i) for i in range(len(cells))] == cells
+        assert vec.bit_flip(0) == 0
+        assert vec.count_ones() == 4
+
+        vec.set_cell_value(64, 1)
+        vec.set_cell_value(0, 0)
+        assert vec.cell_value(64) == 1
+        assert vec.cell_value(0) == 0
+        assert vec.count_ones() == 4
+
+    def test_vector_is_read_only(self):
+        vec = make_vector([0, 1, 0])
+
+        # in-place edits would not reach the packed bits
+        with pytest.raises(TypeError):
+            vec.vector[0] = 1
+        with pytest.raises(TypeError):
+            vec.vector.append(1)
+        assert vec.vector == [0, 1, 0]
+
+        cells = vec.vector.copy()
+        cells[0] = 1
+        vec.vector = cells
+        assert vec.vector == [1, 1, 0]
+        assert vec.vector + [1] == [1, 1, 0, 1]
+
+    def test_bad_bounds(self):
+        with pytest.raises(ValueError):
+            PackedBitStringVector(SimpleFitness(), length=3, bounds=(0, 2))
+
+    def test_flip_bits(self):
+        vec = make_vector([0] * 70)
+        vec.flip_bits([0, 63, 69])
+        assert vec.count_ones() == 3
+        assert vec.cell_value(69) == 1
+
+    def test_swap_segments(self):
+        v1 = make_vector([1] * 130)
+        v2 = make_vector([0] * 130)
+
+        v1.swap_segments(v2, [3, 100])
+        assert v1.vector == [0] * 3 + [1] * 97 + [0] * 30
+        assert v2.vector == [1] * 3 + [0] * 97 + [1] * 30
+
+    def test_genome_key(self):
+        v1 = make_vector([1, 0, 1])
+        v2 = v1.clone()
+        assert v1.genome_key() == v2.genome_key()
+        v2.set_cell_value(1, 1)
+        assert v1.genome_key() != v2.genome_key()
+        assert v1.vector == [1, 0, 1]
+
+    def test_operators(self):
+        creator = GABitStringVectorCreator(length=200, packed=True)
+        v1, v2 = creator.create_individuals(2, higher_is_better=True)
+        n_ones = v1.count_ones() + v2.count_ones()
+
+        VectorKPointsCrossover(k=2).apply_operator([v1, v2])
+        assert v1.count_ones() + v2.count_ones() == n_ones
+
+        before = v1.vector
+        BitStringVectorFlipMutation().apply_operator([v1])
+        assert sum(a != b for a, b in zip(before, v1.vector)) == 1
+        assert v1.applied_operators == [
+            "VectorKPointsCrossover",
+            "BitStringVectorFlipMutation",
+        ]
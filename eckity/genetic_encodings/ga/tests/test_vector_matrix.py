@@ -0,0 +1,71 @@
+import numpy as np
+
+from eckity.creators.ga_creators.int_vector_creator import GAIntVectorCreator
+from eckity.fitness.simple_fitness import SimpleFitness
+from eckity.genetic_encodings.ga.int_vector import IntVector
+from eckity.genetic_encodings.ga.vector_matrix import (
+    get_population_matrix,
+    stack_vectors,
+    vectors_stackable,
+)
+
+
+def make_vectors(vectors):
+    return [
+        IntVector(SimpleFitness(), length=len(v), bounds=(0, 9), vector=v)
+        for v in vectors
+    ]
+
+
+class TestVectorMatrix:
+    def test_stack_vectors(self):
+        individuals = make_vectors([[1, 2, 3], [4, 5, 6]])
+        matrix = stack_vectors(individuals)
+
+        assert matrix.dtype == IntVector.dtype
+        assert matrix.tolist() == [[1, 2, 3], [4, 5, 6]]
+        # vectors are views of the matrix rows
+        individuals[1].set_cell_value(0, 7)
+        assert matrix[1, 0] == 7
+
+    def test_get_population_matrix_reuses_rows(self):
+        individuals = make_vectors([[1, 2], [3, 4], [5, 6]])
+        matrix = stack_vectors(individuals)
+
+        assert np.shares_memory(get_population_matrix(individuals), matrix)
+        sub_matrix = get_population_matrix(individuals[1:])
+        assert sub_matrix.tolist() == [[3, 4], [5, 6]]
+        assert np.shares_memory(sub_matrix, matrix)
+
+        # out of order rows are copied into a new matrix
+        reordered = [individuals[2], individuals[0]]
+        new_matrix = get_population_matrix(reordered)
+        assert new_matrix.tolist() == [[5, 6], [1, 2]]
+        assert not np.shares_memory(new_matrix, matrix)
+
+    def test_vectors_stackable(self):
+        individuals = make_vectors([[1, 2], [3, 4]])
+        assert not vectors_stackable(individuals)
+        stack_vectors(individuals)
+        assert vectors_stackable(individuals)
+
+    def test_array_vector_methods(self):
+        individuals = make_vectors([[1, 2, 3], [4, 5, 6]])
+        stack_vectors(individuals)
+        vec = individuals[0]
+
+        replaced = vec.replace_vector_part([8, 9], 1)
+        assert replaced.tolist() == [2, 3]
+        assert vec.vector.tolist() == [1, 8, 9]
+        assert vec.check_if_in_bounds()
+        vec.set_cell_value(0, 10)
+        assert not vec.check_if_in_bounds()
+        assert vec.genome_key() != individuals[1].genome_key()
+
+    def test_creator_as_matrix(self):
+        creator = GAIntVectorCreator(length=4, bounds=(0, 5), as_matrix=True)
+        individuals = creator.create_individuals(3, higher_is_better=True)
+
+        matrix = get_population_matrix(individuals)
+        assert matrix.shape == (3, 4)
+        assert all(ind.check_if_in_bounds() for ind in individuals)
@@ -6,6 +6,9 @@ from abc import abstractmethod
 from random import randint
 import logging
 
+import numpy as np
+
+from eckity.genetic_encodings.ga.vector_matrix import bounds_arrays
 from eckity.individual import Individual
 
 logger = logging.getLogger(__name__)
@@ -26,8 +29,19 @@ class Vector(Individual):
 
     bounds : list of tuples
         Min/Max values for each vector cell (if of length n), or the minimum and maximum (if of length 1).
+
+    vector : list or numpy.ndarray, default=None
+        Vector genome. A 1-D NumPy array (e.g. a row view of a population
+        matrix, see `stack_vectors`) enables batched genetic operators.
+
+    Attributes
+    ----------
+    dtype : numpy.dtype
+        Data type of the vector cells, when stored in a NumPy array.
     """
 
+    dtype = None
+
     def __init__(
         self, fitness, bounds, length, vector=None, update_parents=False
     ):
@@ -47,9 +61,9 @@ class Vector(Individual):
             self.vector = []
 
         else:
-            if not isinstance(vector, list):
+            if not isinstance(vector, (list, np.ndarray)):
                 raise ValueError(
-                    f"Expected vector argument in Vector constructor to be a list, got {type(vector)}"
+                    f"Expected vector argument in Vector constructor to be a list or a numpy array, got {type(vector)}"
                 )
             if len(vector) != length:
                 raise ValueError(
@@ -88,6 +102,12 @@ class Vector(Individual):
         bool
             True if all vector cells are in bounds, False otherwise
         """
+        if isinstance(self.vector, np.ndarray):
+            lower, upper = bounds_arrays(self.bounds, self.size())
+            return bool(
+                np.all((self.vector >= lower) & (self.vector <= upper))
+            )
+
         for i in range(self.size()):
             if len(self.bounds) == 2:
                 if (self.vector[i] < self.bounds[0]) or (
@@ -109,7 +129,10 @@ class Vector(Individual):
         -------
         None
         """
-        self.vector.append(cell)
+        if isinstance(self.vector, np.ndarray):
+            self.vector = np.append(self.vector, cell)
+        else:
+            self.vector.append(cell)
         self.length += 1
 
     def empty_vector(self):
@@ -125,18 +148,26 @@ class Vector(Individual):
 
     def set_vector(self, vector):
         """
-        Set genome to the given vector genome
+        Set genome to the given vector genome.
+        If the vector is stored in a NumPy array of the same length
+        (e.g. a row of a population matrix), it is copied into it.
 
         Parameters
         -------
-        vector: list
+        vector: list or numpy.ndarray
             `other` vector genome
 
         Returns
         -------
         None
         """
-        self.vector = vector
+        if (
+            isinstance(self.vector, np.ndarray)
+            and len(self.vector) == len(vector)
+        ):
+            self.vector[:] = vector
+        else:
+            self.vector = vector
         self.length = len(vector)
 
     def get_vector(self):
@@ -162,7 +193,7 @@ class Vector(Individual):
         # todo add tests to make sure this logic works
         rnd_i = randint(0, self.size() - 1)
         end_i = randint(rnd_i, self.size() - 1)
-        return self.vector[rnd_i : end_i + 1]
+        return self.get_vector_part(rnd_i, end_i + 1)
 
     def replace_vector_part_random(self, inserted_part):
         """
@@ -182,9 +213,7 @@ class Vector(Individual):
             0, self.size() - len(inserted_part)
         )  # select a random index
         end_i = index + len(inserted_part)
-        replaced_part = self.vector[index:end_i]
-        self.vector = self.vector[:index] + inserted_part + self.vector[end_i:]
-        return replaced_part
+        return self.replace_vector_part(inserted_part, index)
 
     def replace_vector_part(self, inserted_part, start_index):
         """
@@ -204,10 +233,15 @@ class Vector(Individual):
             previous vector part of this vector genome
         """
         end_i = start_index + len(inserted_part)
-        replaced_part = self.vector[start_index:end_i]
-        self.vector = (
-            self.vector[:start_index] + inserted_part + self.vector[end_i:]
-        )
+        replaced_part = self.get_vector_part(start_index, end_i)
+        if isinstance(self.vector, np.ndarray):
+            self.vector[start_index:end_i] = inserted_part
+        else:
+            self.vector = (
+                self.vector[:start_index]
+                + list(inserted_part)
+                + self.vector[end_i:]
+            )
         return replaced_part
 
     def get_vector_part(self, index, end_i):
@@ -224,9 +258,11 @@ class Vector(Individual):
 
         Returns
         -------
-        list
-            sub-vector genome
+        list or numpy.ndarray
+            sub-vector genome (a copy)
         """
+        if isinstance(self.vector, np.ndarray):
+            return self.vector[index:end_i].copy()
         return self.vector[index:end_i]
 
     def cell_value(self, index):
@@ -263,6 +299,48 @@ class Vector(Individual):
         """
         self.vector[index] = value
 
+    def _copy(self):
+        result = self._shallow_copy()
+        # bounds are shared with the clone
+        result.vector = self.vector.copy()
+        return result
+
+    def get_genome(self):
+        """
+        Return the vector genome (see `Individual.get_genome`)
+
+        Returns
+        -------
+        list
+            vector genome
+        """
+        return self.vector
+
+    def set_genome(self, genome):
+        """
+        Set the vector genome (see `Individual.set_genome`)
+
+        Parameters
+        -------
+        genome: list
+            vector genome
+        """
+        self.set_vector(genome)
+
+    def genome_key(self):
+        """
+        Return the vector cells as a tuple.
+
+        Returns
+        -------
+        tuple or bytes
+            hashable key of the vector genome
+            (the raw cell bytes if the vector is a NumPy array).
+        """
+        if isinstance(self.vector, np.ndarray):
+            return self.vector.tobytes()
+        return tuple(self.vector)
+
     @abstractmethod
     def get_random_number_in_bounds(self, index):
         """
@@ -0,0 +1,124 @@
+"""
+This module implements helpers for vectors that are stored as rows
+of a NumPy population matrix.
+"""
+
+import numpy as np
+
+
+def bounds_arrays(bounds, length):
+    """
+    Convert vector bounds to arrays of lower and upper bounds per cell.
+
+    Parameters
+    ----------
+    bounds : tuple or list of tuples
+        Min/Max values for each vector cell (if of length n),
+        or the minimum and maximum (if of length 1).
+
+    length : int
+        Vector length.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        lower and upper bounds, each of shape (length,)
+    """
+    if type(bounds) == tuple:
+        return np.full(length, bounds[0]), np.full(length, bounds[1])
+    bounds = np.asarray(bounds)
+    return bounds[:, 0], bounds[:, 1]
+
+
+def stack_vectors(individuals, dtype=None):
+    """
+    Copy the vectors of the given individuals into one population matrix,
+    and replace the vector of each individual with a row view of it.
+
+    Parameters
+    ----------
+    individuals : List[Vector]
+        Individuals with vectors of the same length.
+
+    dtype : numpy.dtype, default=None
+        Data type of the matrix. By default, the `dtype` of the first
+        individual (or inferred from the vectors, if it is None).
+
+    Returns
+    -------
+    numpy.ndarray
+        Population matrix of shape (len(individuals), vector length).
+    """
+    if dtype is None:
+        dtype = individuals[0].dtype
+    matrix = np.array([ind.vector for ind in individuals], dtype=dtype)
+    for ind, row in zip(individuals, matrix):
+        ind.vector = row
+    return matrix
+
+
+def get_population_matrix(individuals):
+    """
+    Return the population matrix whose rows are the vectors of the given
+    individuals (in order), stacking the vectors into a new matrix if
+    there is no such matrix.
+
+    Parameters
+    ----------
+    individuals : List[Vector]
+        Individuals with vectors of the same length.
+
+    Returns
+    -------
+    numpy.ndarray
+        Population matrix of shape (len(individuals), vector length),
+        sharing memory with the vectors of the individuals.
+    """
+    matrix = individuals[0].vector.base
+    if (
+        isinstance(matrix, np.ndarray)
+        and matrix.ndim == 2
+        and matrix.shape[0] >= len(individuals)
+    ):
+        start = individuals[0].vector.ctypes.data
+        stride = matrix.strides[0]
+        # check that the vectors are consecutive rows of the matrix
+        if all(
+            ind.vector.base is matrix
+            and ind.vector.ctypes.data == start + i * stride
+            for i, ind in enumerate(individuals)
+        ):
+            first = (start - matrix.ctypes.data) // stride
+            return matrix[first: first + len(individuals)]
+    return stack_vectors(individuals)
+
+
+def vectors_stackable(individuals):
+    """
+    Check if the vectors of the given individuals are NumPy arrays
+    of the same length and bounds, that can be rows of one population
+    matrix.
+
+    Parameters
+    ----------
+    individuals : List[Vector]
+        Individuals to check.
+
+    Returns
+    -------
+    bool
+        True if the vectors can be stacked.
+    """
+    if not individuals:
+        return False
+    first = individuals[0]
+    if not isinstance(first.vector, np.ndarray):
+        return False
+    length = len(first.vector)
+    return all(
+        isinstance(ind.vector, np.ndarray)
+        and ind.vector.ndim == 1
+        and len(ind.vector) == length
+        and (ind.bounds is first.bounds or ind.bounds == first.bounds)
+        for ind in individuals
+    )
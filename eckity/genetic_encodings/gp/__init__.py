@@ -1,2 +1,4 @@
 from .tree.tree_individual import Tree
 from .tree.tree_node import TreeNode, FunctionNode, TerminalNode
+from .tree.compact_tree import CompactTree, PrimitiveTable
+from .tree.primitive_set import PrimitiveSet
@@ -0,0 +1,291 @@
+"""
+This module implements the CompactTree and PrimitiveTable classes.
+"""
+
+from numbers import Number
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .tree_node import FunctionNode, TerminalNode, TreeNode
+
+
+class PrimitiveTable:
+    """
+    Table of the primitive nodes (functions and variables) of trees,
+    shared by their compact encodings.
+
+    A node is added to the table the first time it is encoded, and the
+    same (immutable) node object is returned for every occurrence of the
+    primitive when decoding trees. Trees share the table of their
+    primitive set (see `PrimitiveSet.table`).
+    """
+
+    def __init__(self):
+        self.nodes: List[TreeNode] = []
+        self._indices: Dict[Tuple, int] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def index(self, node: TreeNode) -> Optional[int]:
+        """
+        Return the index of a node in the table (adding it if needed),
+        or None if the node is a constant, which is not shared.
+
+        Parameters
+        ----------
+        node: TreeNode
+            node to look up
+
+        Returns
+        -------
+        Optional[int]
+            index of the node in the table
+        """
+        if isinstance(node, FunctionNode):
+            key = (FunctionNode, node.function)
+        elif isinstance(node.value, Number):
+            # ephemeral random constants are stored per tree
+            return None
+        else:
+            key = (TerminalNode, node.value, node.node_type)
+
+        try:
+            index = self._indices.get(key)
+        except TypeError:
+            # unhashable terminal value
+            return None
+        if index is None:
+            with self._lock:
+                index = self._indices.setdefault(key, len(self.nodes))
+                if index == len(self.nodes):
+                    self.nodes.append(node)
+        return index
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+
+class CompactTree:
+    """
+    Compact, array-based encoding of a tree.
+
+    A tree of n nodes (in depth-first order) is stored in parallel
+    arrays: opcodes (index of the node in the primitive table, or
+    -(k + 1) for the k-th constant of the tree), arities, and subtree
+    ends (the subtree rooted at position i spans the positions
+    [i, ends[i])). Node objects are produced on demand.
+    Only the table entries used by the tree are pickled with it.
+
+    Parameters
+    ----------
+    table: PrimitiveTable
+        table of the functions and variables of the tree
+    opcodes: np.ndarray
+        node opcodes, of dtype int32
+    arities: np.ndarray
+        node arities, of dtype uint8
+    constants: List[TerminalNode]
+        constant terminal nodes of the tree
+    ends: np.ndarray, default=None
+        subtree ends, of dtype int32. Computed from the arities if None.
+    """
+
+    __slots__ = ("table", "opcodes", "arities", "constants", "ends")
+
+    def __init__(
+        self,
+        table: PrimitiveTable,
+        opcodes: np.ndarray,
+        arities: np.ndarray,
+        constants: List[TerminalNode],
+        ends: np.ndarray = None,
+    ):
+        self.table = table
+        self.opcodes = opcodes
+        self.arities = arities
+        self.constants = constants
+        if ends is None:
+            ends = np.array(subtree_ends(arities.tolist()), dtype=np.int32)
+        self.ends = ends
+
+    @classmethod
+    def from_nodes(
+        cls, nodes: List[TreeNode], table: PrimitiveTable = None
+    ) -> "CompactTree":
+        """
+        Encode a list of tree nodes (in depth-first order).
+
+        Parameters
+        ----------
+        nodes: List[TreeNode]
+            tree nodes
+        table: PrimitiveTable, default=None
+            primitive table. By default, a new table.
+
+        Returns
+        -------
+        CompactTree
+            the encoded tree
+        """
+        if table is None:
+            table = PrimitiveTable()
+        n = len(nodes)
+        opcodes = np.empty(n, dtype=np.int32)
+        arities = np.zeros(n, dtype=np.uint8)
+        constants = []
+        for i, node in enumerate(nodes):
+            index = table.index(node)
+            if index is None:
+                constants.append(node)
+                index = -len(constants)
+            opcodes[i] = index
+            if isinstance(node, FunctionNode):
+                arities[i] = node.n_args
+        return cls(table, opcodes, arities, constants)
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def __getstate__(self):
+        # the used table entries are renumbered in a table of their own
+        is_primitive = self.opcodes >= 0
+        used, renumbered = np.unique(
+            self.opcodes[is_primitive], return_inverse=True
+        )
+        opcodes = self.opcodes.copy()
+        opcodes[is_primitive] = renumbered
+        nodes = [self.table.nodes[index] for index in used.tolist()]
+        # constant nodes are pickled by value and type
+        constants = [(node.value, node.node_type) for node in self.constants]
+        return nodes, opcodes, self.arities, constants, self.ends
+
+    def __setstate__(self, state):
+        nodes, self.opcodes, self.arities, constants, self.ends = state
+        self.table = PrimitiveTable()
+        for node in nodes:
+            self.table.index(node)
+        self.constants = [
+            TerminalNode(value, node_type) for value, node_type in constants
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory (in bytes) of the arrays of the tree.
+        """
+        return self.opcodes.nbytes + self.arities.nbytes + self.ends.nbytes
+
+    def node(self, pos: int) -> TreeNode:
+        """
+        Return the node in the given position.
+
+        Parameters
+        ----------
+        pos: int
+            node position (in depth-first order)
+
+        Returns
+        -------
+        TreeNode
+            the node
+        """
+        opcode = int(self.opcodes[pos])
+        if opcode < 0:
+            return self.constants[-opcode - 1]
+        return self.table.nodes[opcode]
+
+    def to_nodes(self, start: int = 0, end: int = None) -> List[TreeNode]:
+        """
+        Decode the nodes in the given range of positions.
+
+        Parameters
+        ----------
+        start: int, default=0
+            first position
+        end: int, default=None
+            end position (exclusive). By default, the tree size.
+
+        Returns
+        -------
+        List[TreeNode]
+            the nodes, in depth-first order
+        """
+        table_nodes = self.table.nodes
+        constants = self.constants
+        return [
+            table_nodes[opcode] if opcode >= 0 else constants[-opcode - 1]
+            for opcode in self.opcodes[start:end].tolist()
+        ]
+
+    def subtree_end(self, pos: int) -> int:
+        """
+        Return the end (exclusive) of the subtree rooted at a position.
+
+        Parameters
+        ----------
+        pos: int
+            subtree root position
+
+        Returns
+        -------
+        int
+            the position after the last node of the subtree
+        """
+        return int(self.ends[pos])
+
+    def subtree(self, pos: int) -> List[TreeNode]:
+        """
+        Decode the subtree rooted at a position.
+
+        Parameters
+        ----------
+        pos: int
+            subtree root position
+
+        Returns
+        -------
+        List[TreeNode]
+            the subtree nodes, in depth-first order
+        """
+        return self.to_nodes(pos, self.subtree_end(pos))
+
+
+def subtree_ends(arities: List[int]) -> List[int]:
+    """
+    Compute the subtree ends of a tree from its node arities.
+
+    Parameters
+    ----------
+    arities: List[int]
+        node arities, in depth-first order
+
+    Returns
+    -------
+    List[int]
+        end (exclusive) of the subtree rooted at each position
+    """
+    n = len(arities)
+    ends = [0] * n
+    # ends of the subtrees that follow the current position,
+    # the first one on top
+    stack = []
+    for i in range(n - 1, -1, -1):
+        n_args = arities[i]
+        if n_args:
+            end = stack[-n_args]
+            del stack[-n_args:]
+        else:
+            end = i + 1
+        ends[i] = end
+        stack.append(end)
+    return ends
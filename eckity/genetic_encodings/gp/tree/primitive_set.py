@@ -0,0 +1,183 @@
+"""
+This module implements the PrimitiveSet class.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .compact_tree import PrimitiveTable
+from .utils import FunctionSignature, get_signature
+
+
+class PrimitiveSet:
+    """
+    Precomputed type information of a function set and terminal set:
+    the signature (types and arity) of every function, and the functions
+    and terminals of every type.
+
+    A primitive set is built once per function set and terminal set
+    (see `PrimitiveSet.get`) and shared by the trees that use them, and
+    therefore by the creators and operators that generate nodes through
+    `Tree.random_function` and `Tree.random_terminal`.
+
+    Parameters
+    ----------
+    function_set: List[Callable]
+        List of functions used as internal nodes in the GP tree.
+    terminal_set: Union[Dict[Any, type], List[Any]]
+        Mapping of terminal nodes and their types.
+        Lists are treated as untyped, and will be assigned None.
+
+    Attributes
+    ----------
+    terminal_set: Dict[Any, type]
+        Mapping of terminal nodes and their types (None if untyped).
+    signatures: Dict[Callable, FunctionSignature]
+        Signature of every function in the function set.
+    return_types: set
+        Return types of the functions.
+    arg_types: set
+        Argument types of the functions.
+    table: PrimitiveTable
+        Table of the primitive nodes of the compact encodings of the
+        trees (see `Tree.get_genome`).
+    """
+
+    def __init__(
+        self,
+        function_set: List[Callable],
+        terminal_set: Union[Dict[Any, type], List[Any]],
+    ):
+        for t in function_set:
+            if not isinstance(t, Callable):
+                raise ValueError(
+                    f"Functions must be Callble, but {t} is of type {type(t)}"
+                )
+
+        # untyped case - convert to dictionary of Nones.
+        if isinstance(terminal_set, list):
+            # check if any function has type hints
+            if any(f.__annotations__ for f in function_set):
+                raise ValueError(
+                    "Detected typed function with untyped terminal set. \
+                    Please provide a dictionary with types for terminals."
+                )
+            source_terminal_set = list(terminal_set)
+            terminal_set = {t: None for t in terminal_set}
+        else:
+            # typed case - check every value is a type
+            for v in terminal_set.values():
+                if not isinstance(v, type):
+                    raise ValueError(
+                        "Values in terminal set dictionary must be types, "
+                        f"but {v} is of type {type(v)}."
+                    )
+            source_terminal_set = dict(terminal_set)
+
+        self.function_set = list(function_set)
+        self.terminal_set = terminal_set
+        # the sets as given, to look up the same primitive set on unpickling
+        self._source = (self.function_set, source_terminal_set)
+
+        self.signatures: Dict[Callable, FunctionSignature] = {
+            f: get_signature(f) for f in function_set
+        }
+        self.return_types = {
+            sig.return_type for sig in self.signatures.values()
+        }
+        self.arg_types = {
+            t for sig in self.signatures.values() for t in sig.func_types[:-1]
+        }
+
+        # candidates of every type, in the order of the given sets
+        self._functions: Dict[Optional[type], List[Callable]] = {}
+        for f in function_set:
+            return_type = self.signatures[f].return_type
+            self._functions.setdefault(return_type, []).append(f)
+        self._terminals: Dict[Optional[type], List[Any]] = {}
+        for term, term_type in terminal_set.items():
+            self._terminals.setdefault(term_type, []).append(term)
+
+        self.table = PrimitiveTable()
+
+    @classmethod
+    def get(
+        cls,
+        function_set: List[Callable],
+        terminal_set: Union[Dict[Any, type], List[Any]],
+    ) -> "PrimitiveSet":
+        """
+        Return the primitive set of the given function set and terminal
+        set, building it on the first call.
+
+        Parameters
+        ----------
+        function_set: List[Callable]
+            List of functions used as internal nodes in the GP tree.
+        terminal_set: Union[Dict[Any, type], List[Any]]
+            Mapping of terminal nodes and their types.
+
+        Returns
+        -------
+        PrimitiveSet
+            primitive set shared by all callers with equal sets
+        """
+        terminals = tuple(terminal_set)
+        types = (
+            tuple(terminal_set.values())
+            if isinstance(terminal_set, dict)
+            else None
+        )
+        try:
+            # the terminal classes tell apart equal terminals such as 1, 1.0
+            return _get_primitive_set(
+                cls,
+                tuple(function_set),
+                terminals,
+                tuple(map(type, terminals)),
+                types,
+            )
+        except TypeError:
+            # unhashable primitives, not shared
+            return cls(function_set, terminal_set)
+
+    def functions(self, node_type: Optional[type] = None) -> List[Callable]:
+        """
+        Return the functions of the given return type.
+        The returned list is shared, and must not be modified.
+        """
+        return self._functions.get(node_type, [])
+
+    def terminals(self, node_type: Optional[type] = None) -> List[Any]:
+        """
+        Return the terminals of the given type.
+        The returned list is shared, and must not be modified.
+        """
+        return self._terminals.get(node_type, [])
+
+    def signature(self, function: Callable) -> FunctionSignature:
+        """
+        Return the signature of a function (possibly outside of the set).
+        """
+        sig = self.signatures.get(function)
+        return sig if sig is not None else get_signature(function)
+
+    def __reduce__(self):
+        return _unpickle_primitive_set, (type(self), *self._source)
+
+
+@lru_cache(maxsize=128)
+def _get_primitive_set(
+    cls,
+    functions: Tuple[Callable, ...],
+    terminals: Tuple[Any, ...],
+    terminal_classes: Tuple[type, ...],
+    types: Optional[Tuple[type, ...]],
+) -> PrimitiveSet:
+    if types is None:
+        return cls(list(functions), list(terminals))
+    return cls(list(functions), dict(zip(terminals, types)))
+
+
+def _unpickle_primitive_set(cls, function_set, terminal_set):
+    return cls.get(function_set, terminal_set)
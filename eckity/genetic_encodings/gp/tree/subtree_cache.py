@@ -0,0 +1,208 @@
+"""
+This module implements the SubtreeCache class.
+"""
+
+from collections import OrderedDict
+from numbers import Number
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .tree_individual import CONSTANT_OP, FUNCTION_OP, VARIABLE_OP, Tree
+from .utils import generate_args
+
+_MISSING = object()
+
+
+class SubtreeCache:
+    """
+    Shared cache of subtree execution results.
+
+    Structurally identical subtrees (same functions, variables and
+    constants) are mapped to the same key, regardless of the tree they
+    belong to. When a batch of trees is executed on the same input,
+    every subtree that appears more than once in the batch is computed
+    once, and its result is reused by the other occurrences.
+
+    The stored results are bounded by a memory budget: when it is
+    exceeded, the least recently used results are evicted.
+
+    Parameters
+    ----------
+    max_bytes: int, default=2**28
+        Memory budget (in bytes) for the cached results.
+
+    Attributes
+    ----------
+    hits: int
+        Number of subtree executions that were served from the cache.
+    misses: int
+        Number of subtree executions that were computed.
+    n_bytes: int
+        Memory (in bytes) currently used by the cached results.
+    """
+
+    def __init__(self, max_bytes: int = 2**28):
+        if max_bytes < 0:
+            raise ValueError(
+                f"max_bytes must be non-negative, got {max_bytes}"
+            )
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.n_bytes = 0
+
+        # structural token of a subtree -> subtree key
+        self._keys: Dict[Tuple, int] = {}
+        # subtree key -> number of occurrences in the prepared trees
+        self._counts: Dict[int, int] = {}
+        # subtree key -> (result, result size in bytes), in LRU order
+        self._results: OrderedDict = OrderedDict()
+        # id of a hashed tree -> (program, subtree keys, subtree sizes)
+        self._trees: Dict[int, Tuple[List, List[int], List[int]]] = {}
+
+    def clear(self) -> None:
+        """
+        Discard all subtree keys and cached results.
+        The hit and miss counters are not reset.
+        """
+        self._keys.clear()
+        self._counts.clear()
+        self._results.clear()
+        self._trees.clear()
+        self.n_bytes = 0
+
+    def prepare(self, trees: List[Tree]) -> None:
+        """
+        Hash all subtrees of the given trees and count their occurrences,
+        so only subtrees that are shared are kept in the cache.
+
+        Parameters
+        ----------
+        trees: List[Tree]
+            Trees that are about to be executed on the same input.
+        """
+        counts = self._counts
+        for tree in trees:
+            keys, sizes = self._hash_tree(tree)
+            for key, size in zip(keys, sizes):
+                if size > 1:
+                    counts[key] = counts.get(key, 0) + 1
+
+    def execute(self, tree: Tree, X: np.ndarray) -> Any:
+        """
+        Execute a tree on a numpy array, reusing cached subtree results.
+
+        Parameters
+        ----------
+        tree: Tree
+            Tree to execute.
+        X: np.ndarray
+            Input of shape (n_samples, n_features).
+
+        Returns
+        -------
+        object
+            Result of tree execution, same as `tree.execute(X)`.
+        """
+        if not tree.tree:
+            raise ValueError("Tree is empty, cannot execute.")
+
+        program = tree.compile()
+        hashed = self._trees.get(id(tree))
+        if hashed is not None and hashed[0] is program:
+            _, keys, sizes = hashed
+        else:
+            # the tree was not prepared, or was modified since
+            keys, sizes = self._hash_tree(tree)
+        res = self._execute(program, keys, sizes, 0, generate_args(X))
+        if isinstance(res, Number) or res.shape == np.shape(0):
+            # sometimes a tree degenerates to a scalar value
+            res = np.full_like(X[:, 0], res)
+        return res
+
+    def _hash_tree(self, tree: Tree) -> Tuple[List[int], List[int]]:
+        """
+        Compute the key and the size of every subtree of the tree,
+        indexed by the position of the subtree root in the tree.
+        """
+        program = tree.compile()
+        n = len(program)
+        keys = [0] * n
+        sizes = [1] * n
+        key_stack = []
+        size_stack = []
+        for i, (opcode, value, n_args) in enumerate(program):
+            size = 1
+            if opcode == FUNCTION_OP:
+                # children keys, first argument first
+                token = (value, *key_stack[len(key_stack) - n_args:][::-1])
+                if n_args:
+                    size += sum(size_stack[-n_args:])
+                    del key_stack[-n_args:]
+                    del size_stack[-n_args:]
+            elif opcode == VARIABLE_OP:
+                token = (VARIABLE_OP, value)
+            else:
+                token = (CONSTANT_OP, type(value), value)
+            try:
+                key = self._keys.setdefault(token, len(self._keys))
+            except TypeError:
+                # unhashable constant, never shared with other trees
+                key = self._keys.setdefault(
+                    (CONSTANT_OP, id(value)), len(self._keys)
+                )
+            pos = n - 1 - i
+            keys[pos] = key
+            sizes[pos] = size
+            key_stack.append(key)
+            size_stack.append(size)
+        self._trees[id(tree)] = (program, keys, sizes)
+        return keys, sizes
+
+    def _execute(
+        self,
+        program: List[Tuple[int, Any, int]],
+        keys: List[int],
+        sizes: List[int],
+        pos: int,
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """
+        Recursively execute the subtree rooted at `pos` (in depth-first
+        order), skipping subtrees whose result is already cached.
+        """
+        opcode, value, n_args = program[len(program) - 1 - pos]
+        if opcode == VARIABLE_OP:
+            return kwargs[value]
+        if opcode == CONSTANT_OP:
+            return value
+
+        key = keys[pos]
+        cached = self._results.get(key, _MISSING)
+        if cached is not _MISSING:
+            self.hits += 1
+            self._results.move_to_end(key)
+            return cached[0]
+
+        self.misses += 1
+        args = []
+        child = pos + 1
+        for _ in range(n_args):
+            args.append(self._execute(program, keys, sizes, child, kwargs))
+            child += sizes[child]
+        res = value(*args)
+
+        if self._counts.get(key, 0) > 1:
+            self._store(key, res)
+        return res
+
+    def _store(self, key: int, res: Any) -> None:
+        n_bytes = getattr(res, "nbytes", 0)
+        if n_bytes > self.max_bytes:
+            return
+        self._results[key] = (res, n_bytes)
+        self.n_bytes += n_bytes
+        while self.n_bytes > self.max_bytes:
+            _, (_, evicted_bytes) = self._results.popitem(last=False)
+            self.n_bytes -= evicted_bytes
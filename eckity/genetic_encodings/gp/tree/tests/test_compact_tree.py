@@ -0,0 +1,88 @@
+import pickle
+
+from eckity.base.untyped_functions import f_add, f_mul
+from eckity.genetic_encodings.gp import (
+    CompactTree,
+    FunctionNode,
+    PrimitiveTable,
+    TerminalNode,
+    Tree,
+)
+
+
+def make_nodes():
+    # f_add(f_mul(x, 2.5), y)
+    return [
+        FunctionNode(f_add),
+        FunctionNode(f_mul),
+        TerminalNode("x"),
+        TerminalNode(2.5),
+        TerminalNode("y"),
+    ]
+
+
+class TestCompactTree:
+    def test_round_trip(self):
+        nodes = make_nodes()
+        compact = CompactTree.from_nodes(nodes, PrimitiveTable())
+
+        assert len(compact) == len(nodes)
+        assert compact.to_nodes() == nodes
+        assert compact.node(3) is nodes[3]
+        assert compact.constants == [nodes[3]]
+        assert compact.opcodes[3] == -1
+
+    def test_subtree_ends(self):
+        compact = CompactTree.from_nodes(make_nodes(), PrimitiveTable())
+
+        assert compact.ends.tolist() == [5, 4, 3, 4, 5]
+        assert compact.subtree(1) == make_nodes()[1:4]
+
+    def test_shared_primitives(self):
+        table = PrimitiveTable()
+        compact1 = CompactTree.from_nodes(make_nodes(), table)
+        compact2 = CompactTree.from_nodes(make_nodes(), table)
+
+        # f_add, f_mul, x, y
+        assert len(table) == 4
+        assert compact1.opcodes.tolist() == compact2.opcodes.tolist()
+        assert compact1.node(0) is compact2.node(0)
+
+    def test_pickle(self):
+        compact = CompactTree.from_nodes(make_nodes(), PrimitiveTable())
+        unpickled = pickle.loads(pickle.dumps(compact))
+
+        # terminal values are compared by identity, so compare strings
+        assert str(unpickled.to_nodes()) == str(compact.to_nodes())
+        assert unpickled.ends.tolist() == compact.ends.tolist()
+
+    def test_pickle_used_primitives(self):
+        table = PrimitiveTable()
+        other = [FunctionNode(f_mul), TerminalNode("z"), TerminalNode("x")]
+        CompactTree.from_nodes(other, table)
+        compact = CompactTree.from_nodes(make_nodes(), table)
+        unpickled = pickle.loads(pickle.dumps(compact))
+
+        # f_mul, z, x, f_add, y in the shared table,
+        # f_add, f_mul, x, y in the unpickled one
+        assert len(table) == 5
+        assert len(unpickled.table) == 4
+        assert str(unpickled.to_nodes()) == str(compact.to_nodes())
+
+    def test_tree_genome(self):
+        tree = Tree(
+            function_set=[f_add, f_mul],
+            terminal_set=["x", "y"],
+            tree=make_nodes(),
+        )
+        genome = tree.get_genome()
+        assert isinstance(genome, CompactTree)
+        assert genome.table is tree.primitive_set.table
+
+        other = Tree(function_set=[f_add, f_mul], terminal_set=["x", "y"])
+        other.set_genome(genome)
+        assert other.tree == tree.tree
+
+    def test_nodes_have_slots(self):
+        for node in make_nodes():
+            assert not hasattr(node, "__dict__")
@@ -0,0 +1,52 @@
+import pickle
+
+import pytest
+
+from eckity.base.typed_functions import add2floats, and2bools, mul2floats
+from eckity.base.untyped_functions import f_add, f_mul
+from eckity.genetic_encodings.gp import PrimitiveSet, Tree
+
+
+class TestPrimitiveSet:
+    def test_shared_by_equal_sets(self):
+        function_set = [f_add, f_mul]
+        first = PrimitiveSet.get(function_set, ["x", "y"])
+
+        assert PrimitiveSet.get(list(function_set), ["x", "y"]) is first
+        assert PrimitiveSet.get(function_set, ["x", "z"]) is not first
+        # equal terminals of different classes are not mixed up
+        assert PrimitiveSet.get(function_set, [1]) is not PrimitiveSet.get(
+            function_set, [1.0]
+        )
+
+    def test_candidates_by_type(self):
+        primitive_set = PrimitiveSet.get(
+            [add2floats, and2bools, mul2floats],
+            {"x": float, "b": bool, "y": float},
+        )
+
+        assert primitive_set.functions(float) == [add2floats, mul2floats]
+        assert primitive_set.functions(bool) == [and2bools]
+        assert primitive_set.functions(int) == []
+        assert primitive_set.terminals(float) == ["x", "y"]
+        assert primitive_set.return_types == {float, bool}
+        assert primitive_set.arg_types == {float, bool}
+        assert primitive_set.signature(add2floats).arity == 2
+
+    def test_trees_share_primitive_set(self):
+        trees = [
+            Tree(function_set=[f_add, f_mul], terminal_set=["x", "y"])
+            for _ in range(2)
+        ]
+
+        assert trees[0].primitive_set is trees[1].primitive_set
+        assert trees[0].terminal_set == {"x": None, "y": None}
+
+        unpickled = pickle.loads(pickle.dumps(trees[0]))
+        assert unpickled.primitive_set is trees[0].primitive_set
+
+    def test_invalid_sets(self):
+        with pytest.raises(ValueError):
+            PrimitiveSet.get([add2floats], ["x"])
+        with pytest.raises(ValueError):
+            PrimitiveSet.get([f_add, "f_mul"], ["x"])
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from eckity.base.untyped_functions import f_add, f_div, f_mul, f_sub
+from eckity.creators import FullCreator
+from eckity.evaluators import TreePopulationEvaluator
+from eckity.fitness.gp_fitness import GPFitness
+from eckity.genetic_encodings.gp import FunctionNode, TerminalNode, Tree
+from eckity.genetic_encodings.gp.tree.subtree_cache import SubtreeCache
+from eckity.genetic_operators import SubtreeMutation
+from eckity.population import Population
+from eckity.random import RNG
+from eckity.sklearn_compatible import (
+    ClassificationEvaluator,
+    RegressionEvaluator,
+)
+from eckity.subpopulation import Subpopulation
+
+
+class TestSubtreeCache:
+    X = np.arange(12, dtype=float).reshape(6, 2)
+    functions = [f_add, f_sub, f_mul, f_div]
+    terminals = ["x0", "x1"]
+
+    def make_tree(self, nodes):
+        tree = Tree(
+            fitness=GPFitness(),
+            function_set=self.functions,
+            terminal_set=self.terminals,
+        )
+        tree.tree = nodes
+        return tree
+
+    def shared_tree(self, erc):
+        # (x0 * x1) + erc
+        return self.make_tree(
+            [
+                FunctionNode(f_add),
+                FunctionNode(f_mul),
+                TerminalNode("x0"),
+                TerminalNode("x1"),
+                TerminalNode(erc),
+            ]
+        )
+
+    def test_execute_matches_tree(self):
+        RNG().set_seed(0)
+        creator = FullCreator(
+            init_depth=(4, 4),
+            function_set=self.functions,
+            terminal_set=self.terminals,
+            erc_range=(-1.0, 1.0),
+        )
+        trees = creator.create_individuals(20, higher_is_better=False)
+        cache = SubtreeCache()
+        cache.prepare(trees)
+        for tree in trees:
+            expected = tree.execute(self.X)
+            assert np.allclose(cache.execute(tree, self.X), expected)
+
+    def test_shared_subtree_hits(self):
+        trees = [self.shared_tree(1.0), self.shared_tree(2.0)]
+        cache = SubtreeCache()
+        cache.prepare(trees)
+        for tree in trees:
+            cache.execute(tree, self.X)
+        # x0 * x1 is computed once and reused by the second tree
+        assert cache.hits == 1
+        assert cache.misses == 3
+        assert np.allclose(
+            cache.execute(trees[1], self.X), self.X[:, 0] * self.X[:, 1] + 2.0
+        )
+
+    def test_modified_tree(self):
+        tree = self.shared_tree(1.0)
+        cache = SubtreeCache()
+        cache.prepare([tree, self.shared_tree(1.0)])
+        tree.tree = [FunctionNode(f_sub), TerminalNode("x0"), TerminalNode(3)]
+        assert np.allclose(cache.execute(tree, self.X), self.X[:, 0] - 3)
+
+    def test_memory_budget(self):
+        result_bytes = self.X[:, 0].nbytes
+        cache = SubtreeCache(max_bytes=result_bytes)
+        first = [self.shared_tree(1.0), self.shared_tree(2.0)]
+        second = [
+            self.make_tree(
+                [FunctionNode(f_sub), TerminalNode("x1"), TerminalNode(v)]
+            )
+            for v in (1.0, 1.0)
+        ]
+        cache.prepare(first + second)
+        for tree in first + second:
+            cache.execute(tree, self.X)
+        # the least recently used result was evicted
+        assert cache.n_bytes <= result_bytes
+        assert len(cache._results) == 1
+
+    def test_negative_budget(self):
+        with pytest.raises(ValueError):
+            SubtreeCache(max_bytes=-1)
+
+    def test_population_evaluator(self):
+        y = self.X[:, 0] * self.X[:, 1]
+        evaluator = RegressionEvaluator()
+        evaluator.set_context((self.X, y))
+        trees = [self.shared_tree(0.0), self.shared_tree(5.0)]
+        sub_pop = Subpopulation(
+            evaluator=evaluator,
+            creators=FullCreator(
+                function_set=self.functions, terminal_set=self.terminals
+            ),
+            operators_sequence=[SubtreeMutation()],
+            population_size=2,
+            higher_is_better=False,
+        )
+        sub_pop.individuals = trees
+        pop_eval = TreePopulationEvaluator()
+
+        best = pop_eval.act(Population([sub_pop]))
+
+        assert best is trees[0]
+        assert trees[0].get_pure_fitness() == pytest.approx(0.0)
+        assert trees[1].get_pure_fitness() == pytest.approx(5.0)
+        assert pop_eval.subtree_cache.hits == 1
+        assert evaluator.subtree_cache is None
+
+    @pytest.mark.parametrize("cached", [False, True])
+    def test_classification_evaluator(self, cached):
+        # x1 - x0 is positive on every row, so sigmoid classifies as 1
+        tree = self.make_tree(
+            [FunctionNode(f_sub), TerminalNode("x1"), TerminalNode("x0")]
+        )
+        y = np.array([1, 1, 1, 0, 0, 0])
+        evaluator = ClassificationEvaluator(self.X, y)
+        if cached:
+            evaluator.subtree_cache = SubtreeCache()
+            evaluator.subtree_cache.prepare([tree])
+
+        assert np.array_equal(
+            evaluator.classify_individual(tree), np.ones(6, dtype=int)
+        )
+        assert evaluator.evaluate_individual(tree) == pytest.approx(0.5)
@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+import numpy as np
 import pytest
 
 from eckity.base.typed_functions import (
@@ -440,3 +441,134 @@ class TestTree:
         with pytest.raises(ValueError) as e:
             Tree(**kwargs)
         assert error_message_substring in str(e.value)
+
+    def test_compiled_execute(self):
+        """
+        Test that a compiled tree computes the same result as the
+        recursive execution, and that modifying the tree drops the program
+        """
+        tree_ind = Tree(
+            function_set=self.untyped_functions,
+            terminal_set=["x0", "x1"],
+            tree=[
+                FunctionNode(f_add),
+                FunctionNode(f_mul),
+                TerminalNode("x0"),
+                TerminalNode(2.5),
+                FunctionNode(f_sub),
+                TerminalNode("x1"),
+                TerminalNode("x0"),
+            ],
+        )
+        X = np.array([[1.0, 2.0], [3.0, -4.0], [0.5, 0.0]])
+
+        expected = tree_ind.execute(X)
+        tree_ind.compile()
+        assert np.array_equal(tree_ind.execute(X), expected)
+        assert tree_ind.execute(x0=2.0, x1=1.0) == 2.0 * 2.5 + (1.0 - 2.0)
+
+        tree_ind.replace_subtree(
+            old_subtree=tree_ind.tree[4:], new_subtree=[TerminalNode("x1")]
+        )
+        assert tree_ind._program is None
+        assert tree_ind.execute(x0=2.0, x1=1.0) == 6.0
+
+    def test_compiled_execute_scalar(self):
+        """
+        Test that a compiled constant tree is reshaped like the original
+        """
+        tree_ind = Tree(
+            function_set=self.untyped_functions,
+            terminal_set=["x0", "x1"],
+            tree=[TerminalNode(3.0)],
+        )
+        tree_ind.compile()
+        X = np.zeros((4, 2))
+        assert np.array_equal(tree_ind.execute(X), np.full(4, 3.0))
+
+    def test_genome_key(self):
+        """
+        Test that structurally equal trees have equal genome keys
+        """
+        nodes = [FunctionNode(f_add), TerminalNode("x"), TerminalNode(1)]
+        tree1 = Tree(
+            function_set=self.untyped_functions,
+            terminal_set=self.untyped_terminals,
+            tree=nodes,
+        )
+        tree2 = tree1.clone()
+        assert tree1.genome_key() == tree2.genome_key()
+
+        tree2.tree[2] = TerminalNode(1.0)
+        assert tree1.genome_key() != tree2.genome_key()
+
+    def test_clone_shares_configuration(self):
+        """
+        Test that a clone copies the node list and shares the rest
+        """
+        nodes = [FunctionNode(f_add), TerminalNode("x"), TerminalNode(1)]
+        tree1 = Tree(
+            fitness=GPFitness(fitness=0.5, cache=True),
+            function_set=self.untyped_functions,
+            terminal_set=self.untyped_terminals,
+            tree=nodes,
+        )
+        tree2 = tree1.clone()
+
+        assert tree2.tree == tree1.tree
+        assert tree2.tree is not tree1.tree
+        assert tree2.function_set is tree1.function_set
+        assert tree2.terminal_set is tree1.terminal_set
+        assert tree2.fitness is not tree1.fitness
+        assert tree2.get_pure_fitness() == 0.5
+        assert tree2.cloned_from == [tree1.id]
+        assert tree1.cloned_from == []
+
+        tree2.replace_subtree([tree2.tree[1]], [TerminalNode("y")])
+        assert tree1.tree[1].value == "x"
+
+    def test_subtree_index(self):
+        """
+        Test that subtrees are located by position, even if the tree
+        contains equal nodes, and that the index follows modifications
+        """
+        tree_ind = Tree(
+            function_set=self.untyped_functions,
+            terminal_set=self.untyped_terminals,
+            tree=[
+                FunctionNode(f_add),
+                FunctionNode(f_add),
+                TerminalNode("x"),
+                TerminalNode("y"),
+                FunctionNode(f_add),
+                TerminalNode("x"),
+                TerminalNode("y"),
+            ],
+        )
+        assert [tree_ind.subtree_end(i) for i in range(7)] == [
+            7, 4, 3, 4, 7, 6, 7
+        ]
+        assert tree_ind.get_subtree(4) == tree_ind.tree[4:7]
+
+        tree_ind.replace_subtree_at(4, [TerminalNode(1.0)])
+        assert tree_ind.size() == 5
+        assert tree_ind.tree[1:4] == tree_ind.get_subtree(1)
+        assert tree_ind.subtree_end(0) == 5
+        assert tree_ind.subtree_end(4) == 5
+
+    def test_random_subtree_position_typed(self, setup):
+        """
+        Test that typed trees never select the root,
+        and select roots of the given type
+        """
+        self.typed_tree.tree = [
+            FunctionNode(add2floats),
+            FunctionNode(add2floats),
+            TerminalNode("x", float),
+            TerminalNode("y", float),
+            TerminalNode(1.0, float),
+        ]
+        for _ in range(20):
+            assert self.typed_tree.random_subtree_position() != 0
+            assert self.typed_tree.random_subtree_position(float) != 0
+        assert self.typed_tree.random_subtree_position(bool) is None
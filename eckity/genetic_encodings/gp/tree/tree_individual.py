@@ -10,6 +10,11 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import numpy as np
 
 from eckity.fitness import Fitness, GPFitness
+from eckity.genetic_encodings.gp.tree.compact_tree import (
+    CompactTree,
+    subtree_ends,
+)
+from eckity.genetic_encodings.gp.tree.primitive_set import PrimitiveSet
 from eckity.genetic_encodings.gp.tree.tree_node import (
     FunctionNode,
     TerminalNode,
@@ -17,10 +22,15 @@ from eckity.genetic_encodings.gp.tree.tree_node import (
 )
 from eckity.individual import Individual
 
-from .utils import generate_args, get_func_types, get_return_type
+from .utils import generate_args, get_signature
 
 logger = logging.getLogger(__name__)
 
+# instruction codes of a compiled tree program
+FUNCTION_OP = 0
+VARIABLE_OP = 1
+CONSTANT_OP = 2
+
 
 class Tree(Individual):
     """
@@ -73,12 +83,14 @@ class Tree(Individual):
 
         self.erc_range = erc_range
 
-        function_set, terminal_set = self._handle_input_types(
+        primitive_set = self._handle_input_types(
             function_set, terminal_set, root_type
         )
 
         self.function_set = function_set
-        self.terminal_set = terminal_set
+        self.terminal_set = primitive_set.terminal_set
+        # type information shared by all trees of the same sets
+        self.primitive_set = primitive_set
 
         # actual tree representation
         if tree is None:
@@ -88,6 +100,15 @@ class Tree(Individual):
         # this is the type of the execution result of the program (tree)
         self.root_type = root_type
 
+    @property
+    def tree(self) -> List[TreeNode]:
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree: List[TreeNode]) -> None:
+        self._tree = tree
+        self.invalidate_cache()
+
     @property
     def root(self) -> TreeNode:
         return self.tree[0]
@@ -113,6 +134,7 @@ class Tree(Individual):
             self.size() == 0 and node.node_type == self.root_type
         ) or self._should_add([0], node):
             self.tree.append(node)
+            self.invalidate_cache()
         else:
             raise ValueError(f"Could not add node {node} to tree {self.tree}")
 
@@ -130,7 +152,7 @@ class Tree(Individual):
         node = self.tree[pos[0]]
         res = None
         if isinstance(node, FunctionNode):
-            func_types = get_func_types(node.function)
+            func_types = get_signature(node.function).func_types
             for i in range(node.n_args):
                 pos[0] += 1
                 res = self._should_add(pos, node)
@@ -143,6 +165,99 @@ class Tree(Individual):
     def empty_tree(self) -> None:
         self.tree = []
 
+    def invalidate_cache(self) -> None:
+        """
+        Discard the compiled program and the subtree index of the tree,
+        if there are any.
+        """
+        self._program = None
+        self._subtree_index = None
+
+    def compile(self) -> List[Tuple[int, Any, int]]:
+        """
+        Compile the tree into a flat, stack-based program.
+
+        The program is cached on the individual, and is used by `execute`
+        until the tree is modified (by setting `tree` or by applying
+        a genetic operator on the individual).
+
+        Returns
+        -------
+        List[Tuple[int, Any, int]]
+            Program instructions in reversed depth-first order.
+            Each instruction is an (opcode, value, number of arguments)
+            tuple, where the opcode is one of FUNCTION_OP, VARIABLE_OP
+            or CONSTANT_OP.
+        """
+        if self._program is None or len(self._program) != self.size():
+            program = []
+            for node in reversed(self.tree):
+                if isinstance(node, FunctionNode):
+                    program.append((FUNCTION_OP, node.function, node.n_args))
+                elif node.value in self.terminal_set:
+                    program.append((VARIABLE_OP, node.value, 0))
+                else:
+                    program.append((CONSTANT_OP, node.value, 0))
+            self._program = program
+        return self._program
+
+    def _copy(self) -> "Tree":
+        result = self._shallow_copy()
+        # nodes are shared with the clone: operators replace nodes
+        # instead of modifying them (copy-on-write)
+        result._tree = self._tree.copy()
+        return result
+
+    def get_genome(self) -> CompactTree:
+        """
+        Return the tree in its compact encoding
+        (see `Individual.get_genome`)
+
+        Returns
+        -------
+        CompactTree
+            array-based encoding of the tree nodes
+        """
+        return CompactTree.from_nodes(self.tree, self.primitive_set.table)
+
+    def set_genome(self, genome: Union[CompactTree, List[TreeNode]]) -> None:
+        """
+        Set the tree nodes (see `Individual.set_genome`)
+
+        Parameters
+        ----------
+        genome : Union[CompactTree, List[TreeNode]]
+            compact encoding of the tree,
+            or the tree nodes in depth-first order
+        """
+        if isinstance(genome, CompactTree):
+            genome = genome.to_nodes()
+        self.tree = genome
+
+    def genome_key(self) -> Optional[Tuple]:
+        """
+        Return the tree nodes (in depth-first order) as a tuple.
+        Function nodes are represented by their function, and terminal
+        nodes by the type and value of their terminal.
+
+        Returns
+        -------
+        Optional[Tuple]
+            hashable key of the tree genome,
+            or None if the tree has an unhashable terminal value.
+        """
+        key = tuple(
+            node.function
+            if isinstance(node, FunctionNode)
+            else (type(node.value), node.value)
+            for node in self.tree
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def depth(self) -> int:
         """
         Compute depth of tree (maximal path length to a leaf).
@@ -175,14 +290,7 @@ class Tree(Individual):
         self,
         node_type: Optional[type] = None
     ) -> Optional[FunctionNode]:
-        functions_types = {
-            func: get_return_type(func) for func in self.function_set
-        }
-        relevant_functions = [
-            func
-            for func in self.function_set
-            if functions_types[func] == node_type
-        ]
+        relevant_functions = self.primitive_set.functions(node_type)
 
         # Return None in case there are no functions of the given type
         if not relevant_functions:
@@ -196,20 +304,16 @@ class Tree(Individual):
         node_type: Optional[type] = None
     ) -> Optional[TerminalNode]:
         """Select a random terminal, including constants from ERC range"""
-        relevant_terminals = [
-            term
-            for term, term_type in self.terminal_set.items()
-            if term_type == node_type
-        ]
+        relevant_terminals = self.primitive_set.terminals(node_type)
 
         if self.erc_range is not None and (
             node_type is None or issubclass(node_type, Number)
         ):
-            relevant_terminals.append(
+            relevant_terminals = relevant_terminals + [
                 random.uniform(*self.erc_range)
                 if type(self.erc_range[0]) is float
                 else random.randint(*self.erc_range)
-            )
+            ]
 
         # Return None in case there are no terminals of the given type
         if not relevant_terminals:
@@ -275,7 +379,10 @@ class Tree(Individual):
                 f"Missing variable terminals as execute kwargs: {missing_vars}"
             )
 
-        res = self._execute([0], **kwargs)
+        if self._program is not None:
+            res = self._execute_program(kwargs)
+        else:
+            res = self._execute([0], **kwargs)
 
         if reshape and (isinstance(res, Number) or res.shape == np.shape(0)):
             # sometimes a tree degenrates to a scalar value
@@ -305,6 +412,28 @@ class Tree(Individual):
             else:  # terminal is a constant
                 return node.value
 
+    def _execute_program(self, kwargs: Dict[str, Any]) -> object:
+        """
+        Execute the compiled program of the tree with an explicit stack.
+        The arguments of every function are on top of the stack
+        (first argument on top) by the time the function is reached.
+        """
+        program = self.compile()
+        stack = []
+        push = stack.append
+        for opcode, value, n_args in program:
+            if opcode == VARIABLE_OP:
+                push(kwargs[value])
+            elif opcode == CONSTANT_OP:
+                push(value)
+            elif n_args:
+                args = stack[-1:-n_args - 1:-1]
+                del stack[-n_args:]
+                push(value(*args))
+            else:
+                push(value())
+        return stack[0]
+
     def filter_tree(self, filter_func: Callable) -> None:
         return [node for node in self.tree if filter_func(node)]
 
@@ -332,66 +461,167 @@ class Tree(Individual):
         self,
         node_type: Optional[type] = None
     ) -> Optional[List[TreeNode]]:
-        relevant_nodes = self.filter_tree(
-            lambda node: node.node_type is None  # untyped case
-            or (
-                node_type is None and node != self.root
-            )  # typed case with first invocation
-            or (
-                node.node_type == node_type and node != self.root
-            )  # typed case with subsequent invocations
-        )
-        if not relevant_nodes:
+        """
+        Get a random subtree of the tree.
+
+        Parameters
+        ----------
+        node_type : type, default=None
+            Type of the subtree root (see `random_subtree_position`).
+
+        Returns
+        -------
+        Optional[List[TreeNode]]
+            Nodes of the subtree (a copy), or None if there is no subtree
+            of the given type.
+        """
+        pos = self.random_subtree_position(node_type)
+        if pos is None:
             return None
-        subtree_root = random.choice(relevant_nodes)
+        return self.get_subtree(pos)
 
-        return self._get_subtree_by_root(subtree_root)
+    def random_subtree_position(
+        self,
+        node_type: Optional[type] = None
+    ) -> Optional[int]:
+        """
+        Get the root position of a random subtree of the tree.
+        In typed trees, the root of the tree is never selected, and
+        the subtree root must be of the given type (if not None).
 
-    def _get_subtree_by_root(self, subtree_root: TreeNode) -> List[TreeNode]:
-        start_i = self.tree.index(subtree_root)
+        Parameters
+        ----------
+        node_type : type, default=None
+            Type of the subtree root.
+
+        Returns
+        -------
+        Optional[int]
+            Position of the subtree root, or None if there is no subtree
+            of the given type.
+        """
+        _, untyped, typed, by_type = self._get_subtree_index()
+        candidates = typed if node_type is None else by_type.get(node_type)
+        if candidates is None:
+            candidates = []
+        n_candidates = len(untyped) + len(candidates)
+        if n_candidates == 0:
+            return None
+        i = random.randrange(n_candidates)
+        return untyped[i] if i < len(untyped) else candidates[i - len(untyped)]
 
-        if start_i == 0:
-            return self.tree
+    def subtree_end(self, pos: int) -> int:
+        """
+        Get the end of the subtree rooted at a given position.
 
-        end_i = self._find_subtree_end([start_i])
-        return self.tree[start_i: end_i + 1]
+        Parameters
+        ----------
+        pos : int
+            Position of the subtree root.
+
+        Returns
+        -------
+        int
+            Position after the last node of the subtree.
+        """
+        return self._get_subtree_index()[0][pos]
+
+    def get_subtree(self, pos: int) -> List[TreeNode]:
+        """
+        Get the subtree rooted at a given position.
+
+        Parameters
+        ----------
+        pos : int
+            Position of the subtree root.
+
+        Returns
+        -------
+        List[TreeNode]
+            Nodes of the subtree (a copy).
+        """
+        return self.tree[pos: self.subtree_end(pos)]
+
+    def _get_subtree_by_root(self, subtree_root: TreeNode) -> List[TreeNode]:
+        return self.get_subtree(self._position(subtree_root))
 
     def replace_subtree(
         self, old_subtree: List[TreeNode], new_subtree: List[TreeNode]
     ) -> None:
         """
-        Replace the subtree starting at `index` with `subtree`
+        Replace an existing subtree of the tree with a new subtree.
+        Prefer `replace_subtree_at` when the subtree position is known.
 
         Parameters
         ----------
-        subtree - new subtree to replace the existing subtree in the tree
+        old_subtree - existing subtree of the tree
+        new_subtree - new subtree to replace the existing subtree in the tree
 
         Returns
         -------
         None
         """
-        start_i = self.tree.index(old_subtree[0])
+        start_i = self._position(old_subtree[0])
         end_i = start_i + len(old_subtree)
-        left_part = self.tree[:start_i]
-        right_part = self.tree[end_i:]
-        self.tree = left_part + new_subtree + right_part
+        self.tree[start_i:end_i] = new_subtree
+        self.invalidate_cache()
 
-    def _find_subtree_end(self, pos):
-        """find index of final node of subtree that starts at `pos`
-        (pos is a size-1 list so as to pass "by reference" on successive recursive calls).
+    def replace_subtree_at(
+        self, pos: int, new_subtree: List[TreeNode]
+    ) -> None:
         """
+        Replace the subtree rooted at a given position with a new subtree.
 
-        node = self.tree[pos[0]]
+        Parameters
+        ----------
+        pos : int
+            Position of the root of the replaced subtree.
+        new_subtree : List[TreeNode]
+            New subtree.
 
-        if (
-            isinstance(node, FunctionNode)
-            and node.function in self.function_set
-        ):
-            for _ in range(node.n_args):
-                pos[0] += 1
-                self._find_subtree_end(pos)
+        Returns
+        -------
+        None
+        """
+        self.tree[pos: self.subtree_end(pos)] = new_subtree
+        self.invalidate_cache()
 
-        return pos[0]
+    def _position(self, node: TreeNode) -> int:
+        """
+        Find the position of a node in the tree, preferring the node
+        itself over equal nodes.
+        """
+        for i, tree_node in enumerate(self.tree):
+            if tree_node is node:
+                return i
+        return self.tree.index(node)
+
+    def _get_subtree_index(self) -> Tuple:
+        """
+        Compute the subtree index of the tree, if it is not computed
+        since the last modification of the tree.
+        The index contains the end of each subtree, and the positions of
+        the subtree roots that `random_subtree_position` may select:
+        untyped roots, typed roots (except the tree root) and typed roots
+        by their type.
+        """
+        if self._subtree_index is None:
+            tree = self.tree
+            ends = subtree_ends(
+                [
+                    node.n_args if isinstance(node, FunctionNode) else 0
+                    for node in tree
+                ]
+            )
+            untyped, typed, by_type = [], [], {}
+            for i, node in enumerate(tree):
+                if node.node_type is None:
+                    untyped.append(i)
+                elif i > 0:
+                    typed.append(i)
+                    by_type.setdefault(node.node_type, []).append(i)
+            self._subtree_index = (ends, untyped, typed, by_type)
+        return self._subtree_index
 
     def _handle_input_types(
         self,
@@ -405,41 +635,17 @@ class Tree(Individual):
         if terminal_set is None:
             raise ValueError("Terminal set must be provided.")
 
-        for t in function_set:
-            if not isinstance(t, Callable):
-                raise ValueError(
-                    f"Functions must be Callble, but {t} is of type {type(t)}"
-                )
-
         if not isinstance(terminal_set, (list, dict)):
             raise ValueError(
                 "Terminal set must be a list or a dictionary, "
                 f"got {type(terminal_set)}."
             )
 
-        # untyped case - convert to dictionary of Nones.
+        primitive_set = PrimitiveSet.get(function_set, terminal_set)
         if isinstance(terminal_set, list):
-            # check if any function has type hints
-            if any(f.__annotations__ for f in function_set):
-                raise ValueError(
-                    "Detected typed function with untyped terminal set. \
-                    Please provide a dictionary with types for terminals."
-                )
-
-            terminal_set = {t: None for t in terminal_set}
-            return function_set, terminal_set
-
-        # typed case - check every value is a type
-        for v in terminal_set.values():
-            if not isinstance(v, type):
-                raise ValueError(
-                    "Values in terminal set dictionary must be types, "
-                    f"but {v} is of type {type(v)}."
-                )
+            return primitive_set
 
-        function_return_types = {
-            get_return_type(f) for f in function_set
-        }
+        function_return_types = primitive_set.return_types
         if root_type not in function_return_types:
             raise ValueError(
                 f"Detected a mismatch between root_type ({root_type}) "
@@ -454,9 +660,7 @@ class Tree(Individual):
             )
 
         # check terminals and functions type intersection
-        function_arg_types = {
-            t for func in function_set for t in get_func_types(func)[:-1]
-        }
+        function_arg_types = primitive_set.arg_types
         terminal_types = set(terminal_set.values())
 
         if self.erc_type:
@@ -468,7 +672,7 @@ class Tree(Individual):
                 f"must match terminal types ({terminal_types})."
             )
 
-        return function_set, terminal_set
+        return primitive_set
 
     def __str__(self) -> str:
         """
@@ -3,9 +3,7 @@ from typing import Any, Callable, Optional
 
 from overrides import override
 
-from eckity.base.utils import arity
-
-from .utils import get_func_types
+from .utils import get_signature
 
 
 class TreeNode(ABC):
@@ -18,6 +16,8 @@ class TreeNode(ABC):
         node type
     """
 
+    __slots__ = ("node_type",)
+
     def __init__(self, node_type: Optional[type] = None) -> None:
         self.node_type = node_type
 
@@ -35,14 +35,17 @@ class TreeNode(ABC):
 
 
 class FunctionNode(TreeNode):
+    __slots__ = ("n_args", "function")
+
     def __init__(
         self,
         function: Callable,
     ) -> None:
         # infer the return type of the function
-        func_types = get_func_types(function)
+        signature = get_signature(function)
+        func_types = signature.func_types
         return_type = func_types[-1] if func_types else None
-        self.n_args = arity(function)
+        self.n_args = signature.arity
 
         if 0 < len(func_types) < self.n_args + 1:
             raise ValueError(
@@ -82,6 +85,8 @@ class FunctionNode(TreeNode):
 
 
 class TerminalNode(TreeNode):
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Any,
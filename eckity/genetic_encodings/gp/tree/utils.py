@@ -2,7 +2,16 @@
 This module implements some utility functions.
 """
 
-from typing import Callable, Dict, List, Union, get_type_hints
+from functools import lru_cache
+from typing import (
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Tuple,
+    Union,
+    get_type_hints,
+)
 
 import numpy as np
 
@@ -95,13 +104,55 @@ def get_func_types(f: Callable) -> List[type]:
     >>> get_func_types(f)
     [None, None, None]
     """
-    params_types: Dict = get_type_hints(f)
-    type_list = list(params_types.values())
-    if not type_list:
-        # If we don't have type hints, assign None
-        type_list = [None] * (arity(f) + 1)
-    return type_list
+    return list(get_signature(f).func_types)
 
 
 def get_return_type(func: Callable) -> type:
-    return get_type_hints(func).get("return", None)
+    return get_signature(func).return_type
+
+
+class FunctionSignature(NamedTuple):
+    """
+    Type information of a function.
+
+    Attributes
+    ----------
+    func_types : Tuple[type, ...]
+        function types, in the format of `get_func_types`
+    return_type : type
+        return type (None if not annotated)
+    arity : int
+        number of arguments
+    """
+
+    func_types: Tuple[type, ...]
+    return_type: type
+    arity: int
+
+
+@lru_cache(maxsize=1024)
+def get_signature(f: Callable) -> FunctionSignature:
+    """
+    Return the type information of a function.
+    Introspection is performed once per function, and the result is
+    cached, so this can be called for every created tree node.
+
+    Parameters
+    ----------
+    f : Callable
+        function (builtin or user-defined)
+
+    Returns
+    -------
+    FunctionSignature
+        function types, return type and arity
+    """
+    params_types: Dict = get_type_hints(f)
+    n_args = arity(f)
+    type_list = tuple(params_types.values())
+    if not type_list:
+        # If we don't have type hints, assign None
+        type_list = (None,) * (n_args + 1)
+    return FunctionSignature(
+        type_list, params_types.get("return", None), n_args
+    )
@@ -50,45 +50,51 @@ class SubtreeCrossover(FailableOperator):
 
         self.individuals = individuals
 
-        subtrees: Optional[List[List[TreeNode]]] = self._pick_subtrees(
+        positions: Optional[List[int]] = self._pick_subtree_positions(
             individuals
         )
 
-        if subtrees is None:
+        if positions is None:
             return False, individuals
 
-        self._swap_subtrees(individuals, subtrees)
+        subtrees = [
+            ind.get_subtree(pos) for ind, pos in zip(individuals, positions)
+        ]
+        self._swap_subtrees(individuals, subtrees, positions)
         self.applied_individuals = individuals
 
         return True, individuals
 
     @staticmethod
-    def _pick_subtrees(
+    def _pick_subtree_positions(
         individuals: List[Tree],
-    ) -> Optional[List[List[TreeNode]]]:
+    ) -> Optional[List[int]]:
         # select a random subtree from first individual tree
-        first_subtree: List[TreeNode] = individuals[0].random_subtree()
+        first_pos: Optional[int] = individuals[0].random_subtree_position()
 
-        if first_subtree is None:
+        if first_pos is None:
             # failed attempt
             return None
 
-        m_type: type = first_subtree[0].node_type
+        m_type: type = individuals[0].tree[first_pos].node_type
 
         # now select a random subtree from the rest of the individuals
         # with regards to the type of the first subtree
-        rest_subtrees = [ind.random_subtree(m_type) for ind in individuals[1:]]
+        rest_positions = [
+            ind.random_subtree_position(m_type) for ind in individuals[1:]
+        ]
 
         # fails if any subtree doesn't contain a node with of type `m_type`
-        if None in rest_subtrees:
+        if None in rest_positions:
             return None
 
-        subtrees = [first_subtree] + rest_subtrees
-        return subtrees
+        return [first_pos] + rest_positions
 
     @staticmethod
     def _swap_subtrees(
-        individuals: List[TreeNode], subtrees: List[List[TreeNode]]
+        individuals: List[Tree],
+        subtrees: List[List[TreeNode]],
+        positions: Optional[List[int]] = None,
     ) -> None:
         """
         Replace subtrees for all individuals in a cyclic manner
@@ -98,8 +104,15 @@ class SubtreeCrossover(FailableOperator):
         ...
         st_2 receives the subtree of st_1
         st_1 receives the subtree of st_n
+
+        The subtrees are located by their root positions, if given.
         """
         for i in range(len(individuals) - 1, -1, -1):
-            individuals[i].replace_subtree(
-                old_subtree=subtrees[i], new_subtree=subtrees[i - 1]
-            )
+            if positions is None:
+                individuals[i].replace_subtree(
+                    old_subtree=subtrees[i], new_subtree=subtrees[i - 1]
+                )
+            else:
+                individuals[i].replace_subtree_at(
+                    positions[i], subtrees[i - 1]
+                )
@@ -3,6 +3,7 @@ from eckity.genetic_operators.crossovers.vector_k_point_crossover import (
     VectorKPointsCrossover,
 )
 from eckity.fitness.simple_fitness import SimpleFitness
+from eckity.genetic_encodings.ga.vector_matrix import stack_vectors
 
 
 class TestVectorKPointCrossover:
@@ -40,4 +41,23 @@ class TestVectorKPointCrossover:
         crossover = VectorKPointsCrossover(k=1)
         crossover.apply_operator([v1, v2])
         assert v1.applied_operators == ["VectorKPointsCrossover"]
-        assert v2.applied_operators == ["VectorKPointsCrossover"]
\ No newline at end of file
+        assert v2.applied_operators == ["VectorKPointsCrossover"]
+
+    def test_batch_matches_two_point_crossover(self):
+        individuals = [
+            IntVector(SimpleFitness(), 4, bounds=(1, 10), vector=vector)
+            for vector in [[1, 2, 3, 4], [5, 6, 7, 8]] * 3
+        ]
+        stack_vectors(individuals)
+
+        crossover = VectorKPointsCrossover(k=2)
+        crossover.apply_operator_batch(individuals)
+        for i in range(0, len(individuals), 2):
+            v1, v2 = individuals[i].vector, individuals[i + 1].vector
+            # cells are swapped between the pair, never lost
+            assert sorted(v1.tolist() + v2.tolist()) == list(range(1, 9))
+            assert (v1 + v2).tolist() == [6, 8, 10, 12]
+            assert v1.tolist() != [1, 2, 3, 4]
+            assert individuals[i].applied_operators == [
+                "VectorKPointsCrossover"
+            ]
@@ -1,7 +1,13 @@
 from random import sample
 
+import numpy as np
+
 from eckity.genetic_operators.genetic_operator import GeneticOperator
-from eckity.genetic_encodings.ga import Vector
+from eckity.genetic_encodings.ga import PackedBitStringVector, Vector
+from eckity.genetic_encodings.ga.vector_matrix import (
+    get_population_matrix,
+    vectors_stackable,
+)
 
 from typing import List, Tuple
 
@@ -49,13 +55,53 @@ class VectorKPointsCrossover(GeneticOperator):
         """
         self.individuals = individuals
         xo_points = sorted(sample(range(1, individuals[0].size()), self.k))
-        self._swap_vector_parts(
-            individuals[0].vector, individuals[1].vector, xo_points
-        )
+        if isinstance(individuals[0], PackedBitStringVector) and isinstance(
+            individuals[1], PackedBitStringVector
+        ):
+            # swap the packed bits word-wise
+            individuals[0].swap_segments(individuals[1], xo_points)
+        else:
+            self._swap_vector_parts(
+                individuals[0].vector, individuals[1].vector, xo_points
+            )
 
         self.applied_individuals = individuals
         return individuals
 
+    def supports_batch(self, individuals: List[Vector]) -> bool:
+        return vectors_stackable(individuals)
+
+    def apply_batch(
+        self, individuals: List[Vector], groups: List[List[int]]
+    ) -> None:
+        """
+        Perform the crossover on several pairs of vectors at once,
+        on the rows of their population matrix.
+
+        Parameters
+        ----------
+        individuals : List[Vector]
+            individuals with stackable vectors
+        groups : List[List[int]]
+            indices of the individuals in each crossover group
+        """
+        self.individuals = individuals
+        matrix = get_population_matrix(individuals)
+        groups = np.asarray(groups)
+        length = matrix.shape[1]
+
+        # mark the crossover points of each pair
+        points = np.zeros((len(groups), length), dtype=np.int8)
+        for i in range(len(groups)):
+            points[i, sample(range(1, length), self.k)] = 1
+        # every other segment is swapped, starting with the first one
+        swap = np.cumsum(points, axis=1) % 2 == 0
+
+        first = matrix[groups[:, 0]]
+        second = matrix[groups[:, 1]]
+        matrix[groups[:, 0]] = np.where(swap, second, first)
+        matrix[groups[:, 1]] = np.where(swap, first, second)
+
     def _swap_vector_parts(
         self, vector1: List[int], vector2: List[int], xo_points: List[int]
     ) -> Tuple[List[int]]:
@@ -82,7 +128,8 @@ class VectorKPointsCrossover(GeneticOperator):
         start_idx = 0
         for i in range(0, len(xo_points), 2):
             end_idx = xo_points[i]
-            replaced_part = vector1[start_idx:end_idx]
+            # copy, since slices of numpy arrays are views
+            replaced_part = vector1[start_idx:end_idx].copy()
             vector1[start_idx:end_idx] = vector2[start_idx:end_idx]
             vector2[start_idx:end_idx] = replaced_part
-            start_idx = xo_points[i + 1] if end_idx < len(xo_points) else -1
+            start_idx = xo_points[i + 1] if i + 1 < len(xo_points) else -1
@@ -25,6 +25,14 @@ class FailableOperator(GeneticOperator):
 
     attempts: int
         number of attempts to be made during the operator execution
+
+    Attributes
+    -------
+    n_attempts: int
+        number of attempts made so far (informational, e.g. for profiling)
+
+    n_failures: int
+        number of applications that failed all attempts
     """
 
     def __init__(
@@ -38,6 +46,8 @@ class FailableOperator(GeneticOperator):
         if attempts < 1:
             raise ValueError("Number of attempts must be at least 1")
         self.attempts = attempts
+        self.n_attempts = 0
+        self.n_failures = 0
 
     # TODO add event of on fail or on fail all retries
     def apply(self, payload: object) -> object:
@@ -60,12 +70,14 @@ class FailableOperator(GeneticOperator):
         """
         for i in range(self.attempts):
             # attempt to execute the operator
+            self.n_attempts += 1
             succeeded, result = self.attempt_operator(payload, i)
 
             # return if succeeded
             if succeeded:
                 return result
         # after all attempts failed, execute the `on_fail` mechanism
+        self.n_failures += 1
         return self.on_fail(payload)
 
     @abstractmethod
@@ -20,11 +20,18 @@ class GeneticOperator(Operator, ABC):
         number of individuals required for the operator, by default 0
     events : List[str], optional
         custom events that the operator publishes, by default None
+
+    Attributes
+    ----------
+    n_applied : int
+        number of groups of individuals the operator was applied on
+        (informational, e.g. for profiling)
     """
 
     def __init__(self, probability=1.0, arity=0, events=None):
         super().__init__(events=events, arity=arity)
         self.probability = probability
+        self.n_applied = 0
 
     def apply_operator(self, individuals):
         """
@@ -43,21 +50,115 @@ class GeneticOperator(Operator, ABC):
             The individuals after applying the operator.
         """
         if random.random() <= self.probability:
-            # Fitness is irrelevant once the operator is applied
-            for individual in individuals:
-                individual.set_fitness_not_evaluated()
+            self.n_applied += 1
+            self._before_apply(individuals)
             op_res = self.apply(individuals)
-
-            # Add the operator to the applied operators list
-            for ind in op_res:
-                ind.applied_operators.append(type(self).__name__)
-                
-                if ind.update_parents:
-                    parents = [p.id for p in individuals]
-                    ind.parents.extend(parents)
+            self._after_apply(individuals, op_res)
             return op_res
         return individuals
 
+    def apply_operator_batch(self, individuals):
+        """
+        Apply the genetic operator on consecutive groups of `arity`
+        individuals, each group with a certain probability.
+        The individuals are modified in-place.
+
+        If the operator supports batches of these individuals
+        (see `supports_batch`), it is applied on all chosen groups at once
+        by `apply_batch`. Otherwise, `apply_operator` is applied on each
+        group separately.
+
+        Parameters
+        ----------
+        individuals : List[Individual]
+            Individuals to apply the operator to.
+
+        Returns
+        -------
+        List[Individual]
+            The individuals after applying the operator.
+        """
+        arity = self.get_operator_arity()
+        if len(individuals) % arity != 0 or not self.supports_batch(
+            individuals
+        ):
+            for i in range(0, len(individuals), arity):
+                individuals[i: i + arity] = self.apply_operator(
+                    individuals[i: i + arity]
+                )
+            return individuals
+
+        # a group is chosen with the same probability as in apply_operator
+        groups = [
+            list(range(i, i + arity))
+            for i in range(0, len(individuals), arity)
+            if random.random() <= self.probability
+        ]
+        if groups:
+            self.n_applied += len(groups)
+            applied = [individuals[i] for group in groups for i in group]
+            self._before_apply(applied)
+            self.apply_batch(individuals, groups)
+            for group in groups:
+                group_individuals = [individuals[i] for i in group]
+                self._after_apply(group_individuals, group_individuals)
+            self.applied_individuals = applied
+        return individuals
+
+    def supports_batch(self, individuals):
+        """
+        Check if the operator can be applied on groups of the given
+        individuals at once, by `apply_batch`.
+        By default, batches are not supported.
+
+        Parameters
+        ----------
+        individuals : List[Individual]
+            Individuals to apply the operator to.
+
+        Returns
+        -------
+        bool
+            True if `apply_batch` can be applied on the individuals.
+        """
+        return False
+
+    def apply_batch(self, individuals, groups):
+        """
+        Apply the genetic operator on several groups of individuals
+        at once, in-place.
+        This method should be implemented by subclasses that support
+        batches (see `supports_batch`).
+
+        Parameters
+        ----------
+        individuals : List[Individual]
+            Individuals to apply the operator to.
+        groups : List[List[int]]
+            Indices of the individuals in each group, each of size `arity`.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support batches"
+        )
+
+    def _before_apply(self, individuals):
+        # Fitness is irrelevant once the operator is applied
+        for individual in individuals:
+            individual.set_fitness_not_evaluated()
+
+    def _after_apply(self, individuals, op_res):
+        # Genome-derived data (e.g. compiled trees) is now stale
+        for individual in individuals:
+            individual.invalidate_cache()
+
+        # Add the operator to the applied operators list
+        for ind in op_res:
+            ind.applied_operators.append(type(self).__name__)
+
+            if ind.update_parents:
+                parents = [p.id for p in individuals]
+                ind.parents.extend(parents)
+
     @abstractmethod
     def apply(self, individuals):
         """
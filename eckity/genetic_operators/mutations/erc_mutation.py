@@ -3,7 +3,7 @@ from typing import Any, List, Tuple
 from overrides import override
 import random
 
-from eckity.genetic_encodings.gp import Tree
+from eckity.genetic_encodings.gp import TerminalNode, Tree
 from eckity.genetic_operators import FailableOperator
 
 
@@ -40,8 +40,14 @@ class ERCMutation(FailableOperator):
             return False, individuals
 
         mu, sigma = self.mu, self.sigma
-        for terminal in leaves:
-            terminal.value = terminal.value + random.gauss(mu, sigma)
+        for ind, terminal in zip(individuals, leaves):
+            # nodes may be shared with clones, so the node is replaced
+            # instead of modified
+            tree = ind.tree
+            pos = next(i for i, node in enumerate(tree) if node is terminal)
+            tree[pos] = TerminalNode(
+                terminal.value + random.gauss(mu, sigma), terminal.node_type
+            )
 
         self.applied_individuals = individuals
         return True, individuals
@@ -3,7 +3,7 @@ from typing import Any, List, Optional, Tuple
 from overrides import override
 
 from eckity.creators.gp_creators.grow import GrowCreator
-from eckity.genetic_encodings.gp import Tree, TreeNode
+from eckity.genetic_encodings.gp import Tree
 from eckity.genetic_operators import FailableOperator
 
 
@@ -38,20 +38,20 @@ class SubtreeMutation(FailableOperator):
         """
         individuals: List[Tree] = payload
 
-        old_subtrees: List[Optional[List[TreeNode]]] = [
-            ind.random_subtree() for ind in individuals
+        positions: List[Optional[int]] = [
+            ind.random_subtree_position() for ind in individuals
         ]
 
-        if None in old_subtrees:
+        if None in positions:
             return False, individuals
 
-        self._swap_subtrees(individuals, old_subtrees)
+        self._swap_subtrees(individuals, positions)
 
         self.applied_individuals = individuals
         return True, individuals
 
     def _swap_subtrees(
-        self, individuals: List[Tree], old_subtrees: List[List[TreeNode]]
+        self, individuals: List[Tree], positions: List[int]
     ) -> None:
 
         if self.tree_creator is None:
@@ -61,7 +61,7 @@ class SubtreeMutation(FailableOperator):
                 terminal_set=individuals[0].terminal_set,
             )
 
-        for ind, old_subtree in zip(individuals, old_subtrees):
+        for ind, pos in zip(individuals, positions):
             # generate a random tree with the same root type
             # of the old subtree to not cause type errors
 
@@ -71,10 +71,8 @@ class SubtreeMutation(FailableOperator):
                 ind.random_function,
                 ind.random_terminal,
                 depth=0,
-                node_type=old_subtree[0].node_type,
+                node_type=ind.tree[pos].node_type,
             )
 
             # replace the old subtree with the newly generated one
-            ind.replace_subtree(
-                old_subtree=old_subtree, new_subtree=new_subtree
-            )
+            ind.replace_subtree_at(pos, new_subtree)
@@ -0,0 +1,17 @@
+from eckity.base.untyped_functions import f_add
+from eckity.genetic_encodings.gp import FunctionNode, TerminalNode, Tree
+from eckity.genetic_operators.mutations.erc_mutation import ERCMutation
+
+
+def test_erc_mutation_does_not_modify_clones():
+    tree = Tree(
+        function_set=[f_add],
+        terminal_set=["x"],
+        tree=[FunctionNode(f_add), TerminalNode("x"), TerminalNode(1.0)],
+    )
+    clone = tree.clone()
+
+    ERCMutation().apply_operator([clone])
+    assert tree.tree[2].value == 1.0
+    assert clone.tree[2].value != 1.0
+    assert clone.applied_operators == ["ERCMutation"]
@@ -1,8 +1,18 @@
+import numpy as np
+
+from eckity.genetic_encodings.ga.bit_string_vector import BitStringVector
 from eckity.genetic_encodings.ga.float_vector import FloatVector
+from eckity.genetic_encodings.ga.int_vector import IntVector
+from eckity.genetic_encodings.ga.vector_matrix import stack_vectors
+from eckity.genetic_operators.mutations.vector_n_point_mutation import (
+    VectorNPointMutation,
+)
 from eckity.genetic_operators.mutations.vector_random_mutation import (
+    BitStringVectorFlipMutation,
     FloatVectorUniformNPointMutation,
     FloatVectorGaussNPointMutation,
     FloatVectorGaussOnePointMutation,
+    IntVectorOnePointMutation,
 )
 
 from eckity.fitness.simple_fitness import SimpleFitness
@@ -89,3 +99,91 @@ class TestMutations:
             "FloatVectorUniformOnePointMutation",
             "FloatVectorGaussOnePointMutation",
         ]
+
+    def test_uniform_float_n_point_mut_batch(self):
+        length = 5
+        n_points = 3
+        individuals = [
+            FloatVector(
+                SimpleFitness(0.0), length=length, bounds=(-100.0, 100.0)
+            )
+            for _ in range(4)
+        ]
+        for ind in individuals:
+            ind.vector = [0.0] * length
+        stack_vectors(individuals)
+        mut = FloatVectorUniformNPointMutation(n=n_points, probability=1.0)
+
+        mut.apply_operator_batch(individuals)
+        for ind in individuals:
+            assert np.count_nonzero(ind.vector) == n_points
+            assert ind.check_if_in_bounds()
+            assert not ind.fitness.is_fitness_evaluated()
+            assert ind.applied_operators == [
+                "FloatVectorUniformNPointMutation"
+            ]
+
+    def test_gauss_mutation_fail_batch(self):
+        length = 4
+        individuals = [
+            FloatVector(SimpleFitness(0.0), length=length, bounds=(-1.0, 1.0))
+            for _ in range(3)
+        ]
+        for ind in individuals:
+            ind.vector = [1.0] * length
+        stack_vectors(individuals)
+        mut = FloatVectorGaussOnePointMutation(mu=1000, probability=1.0)
+
+        mut.apply_operator_batch(individuals)
+        for ind in individuals:
+            # falls back to a uniform mutation of a single cell
+            cnt = Counter(ind.vector.tolist())
+            assert cnt[1.0] == length - 1
+            assert ind.check_if_in_bounds()
+
+    def test_bit_flip_mutation_batch(self):
+        individuals = [
+            BitStringVector(SimpleFitness(), length=6, vector=[0] * 6)
+            for _ in range(5)
+        ]
+        matrix = stack_vectors(individuals)
+        mut = BitStringVectorFlipMutation(probability=1.0)
+
+        mut.apply_operator_batch(individuals)
+        assert matrix.sum(axis=1).tolist() == [1] * 5
+
+    def test_custom_cell_selector_batch(self):
+        # every cell is mutated with probability_for_each, in both paths
+        def mutated_cells(as_matrix):
+            np.random.seed(0)
+            individuals = [
+                IntVector(
+                    SimpleFitness(), length=100, bounds=(0, 100),
+                    vector=[0] * 100,
+                )
+                for _ in range(50)
+            ]
+            if as_matrix:
+                stack_vectors(individuals)
+            mut = IntVectorOnePointMutation(
+                probability=1.0, probability_for_each=0.5
+            )
+            assert mut.supports_batch(individuals) == as_matrix
+
+            mut.apply_operator_batch(individuals)
+            return sum(np.count_nonzero(ind.vector) for ind in individuals)
+
+        n_list, n_matrix = mutated_cells(False), mutated_cells(True)
+        assert 2200 < n_list < 2800
+        assert 2200 < n_matrix < 2800
+
+    def test_custom_cell_selector_without_batch_selector(self):
+        individuals = [
+            FloatVector(SimpleFitness(0.0), length=4, vector=[0.0] * 4)
+            for _ in range(3)
+        ]
+        stack_vectors(individuals)
+        mut = VectorNPointMutation(cell_selector=lambda vec: [0, 1])
+        mut.batch_mut_val_getter = lambda values, lower, upper: values + 1
+
+        assert not mut.supports_batch(individuals)
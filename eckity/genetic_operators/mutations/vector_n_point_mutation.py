@@ -1,7 +1,14 @@
 import random
 
+import numpy as np
+
 from eckity.genetic_operators.failable_operator import FailableOperator
 from eckity.genetic_encodings.ga.vector_individual import Vector
+from eckity.genetic_encodings.ga.vector_matrix import (
+    bounds_arrays,
+    get_population_matrix,
+    vectors_stackable,
+)
 
 from typing import List, Tuple, Union
 
@@ -34,6 +41,21 @@ class VectorNPointMutation(FailableOperator):
 
     events: list of strings
         Events to publish before/after the mutation operator
+
+    Attributes
+    ----------
+    batch_mut_val_getter: callable
+        Vectorized version of `mut_val_getter`, that returns mutated
+        values of the given cell values and their lower and upper bounds
+        (arrays of the same shape). If set, the mutation can be applied
+        on vectors that are rows of a population matrix at once.
+        None by default, since it depends on the `mut_val_getter`.
+
+    batch_cell_selector: callable
+        Vectorized version of a custom `cell_selector`, that returns the
+        cells to mutate of each vector, given the number of vectors and
+        their length (see `select_batch_cells`). Mutations with a custom
+        `cell_selector` are applied on population matrices only if set.
     """
 
     def __init__(
@@ -66,6 +88,8 @@ class VectorNPointMutation(FailableOperator):
         if mut_val_getter is None:
             mut_val_getter = self.default_mut_val_getter
         self.mut_val_getter = mut_val_getter
+        self.batch_mut_val_getter = None
+        self.batch_cell_selector = None
 
     @staticmethod
     def default_mut_val_getter(vec: Vector, idx: int) -> Union[int, float]:
@@ -124,6 +148,101 @@ class VectorNPointMutation(FailableOperator):
         self.applied_individuals = individuals
         return succeeded, individuals
 
+    def supports_batch(self, individuals: List[Vector]) -> bool:
+        # apply_batch selects the cells and checks the bounds by itself
+        default_cells = (
+            self.cell_selector == self.default_cell_selector
+            or self.batch_cell_selector is not None
+        )
+        return (
+            self.batch_mut_val_getter is not None
+            and default_cells
+            and self.success_checker == self.default_success_checker
+            and vectors_stackable(individuals)
+        )
+
+    def apply_batch(
+        self, individuals: List[Vector], groups: List[List[int]]
+    ) -> None:
+        """
+        Mutate several vectors at once, on the rows of their population
+        matrix. Each vector is mutated (and checked to be in bounds)
+        separately, up to `attempts` times, and `on_fail_batch` handles
+        the vectors that failed all attempts.
+
+        Parameters
+        ----------
+        individuals : List[Vector]
+            individuals with stackable vectors
+        groups : List[List[int]]
+            indices of the individuals to mutate, in groups of `arity`
+        """
+        matrix = get_population_matrix(individuals)
+        lower, upper = bounds_arrays(individuals[0].bounds, matrix.shape[1])
+        pending = np.asarray(groups).ravel()
+        select_cells = self.batch_cell_selector or self.select_batch_cells
+
+        for _ in range(self.attempts):
+            self.n_attempts += len(pending)
+            cells = select_cells(len(pending), matrix.shape[1])
+            rows = pending[:, None]
+            old_vals = matrix[rows, cells]
+            matrix[rows, cells] = self.batch_mut_val_getter(
+                old_vals, lower[cells], upper[cells]
+            )
+
+            vectors = matrix[pending]
+            failed = ~np.all((vectors >= lower) & (vectors <= upper), axis=1)
+            # revert the failed vectors
+            matrix[rows[failed], cells[failed]] = old_vals[failed]
+            pending = pending[failed]
+            if len(pending) == 0:
+                break
+        else:
+            self.n_failures += len(pending)
+            self.on_fail_batch(matrix, pending, lower, upper)
+
+    def select_batch_cells(self, n_vectors: int, length: int) -> np.ndarray:
+        """
+        Randomly select n cells (without repetitions) of each vector,
+        the vectorized version of `default_cell_selector`.
+
+        Parameters
+        ----------
+        n_vectors : int
+            number of vectors
+        length : int
+            vector length
+
+        Returns
+        -------
+        np.ndarray
+            cell indices, of shape (n_vectors, n)
+        """
+        if self.n == 1:
+            return np.random.randint(0, length, size=(n_vectors, 1))
+        return np.argsort(np.random.random((n_vectors, length)), axis=1)[
+            :, : self.n
+        ]
+
+    def on_fail_batch(self, matrix, rows, lower, upper):
+        """
+        The required fix for vectors that failed all attempts of
+        `apply_batch`, does nothing by default (like `on_fail`).
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            population matrix
+        rows : np.ndarray
+            rows of the failed vectors in the matrix
+        lower : np.ndarray
+            lower bounds of the vector cells
+        upper : np.ndarray
+            upper bounds of the vector cells
+        """
+        pass
+
     def on_fail(self, payload):
         """
         The required fix when the operator fails, does nothing by default and can be overridden by subclasses
@@ -1,5 +1,10 @@
 from random import random
 
+import numpy as np
+
+from eckity.genetic_encodings.ga.packed_bit_string_vector import (
+    PackedBitStringVector,
+)
 from eckity.genetic_operators.mutations.vector_n_point_mutation import (
     VectorNPointMutation,
 )
@@ -18,9 +23,64 @@ Standard parameters for the mutation are number of mutation points (n),
 the probability of the operator itself to occur (probability),
 the probability of each point to be mutated (probability_for_each),
 the number of attempts to be made, etc.
+
+Each mutation also sets a vectorized version of its mut_val_getter
+(batch_mut_val_getter), used when the mutated vectors are rows of a
+population matrix.
 """
 
 
+def uniform_float_values(values, lower, upper):
+    return np.random.uniform(lower, upper)
+
+
+def uniform_int_values(values, lower, upper):
+    # upper bound is inclusive, as in random.randint
+    return np.random.randint(lower, upper + 1)
+
+
+def bit_flip_values(values, lower, upper):
+    return np.where(values == lower, upper, lower)
+
+
+def gauss_values(mu, sigma):
+    def batch_mut_val_getter(values, lower, upper):
+        return values + np.random.normal(mu, sigma, size=values.shape)
+
+    return batch_mut_val_getter
+
+
+def each_with_probability(batch_mut_val_getter, get_probability):
+    def each_mut_val_getter(values, lower, upper):
+        mutated = np.random.random(values.shape) <= get_probability()
+        return np.where(
+            mutated, batch_mut_val_getter(values, lower, upper), values
+        )
+
+    return each_mut_val_getter
+
+
+def all_batch_cells(n_vectors, length):
+    # every cell of every vector
+    return np.broadcast_to(np.arange(length), (n_vectors, length))
+
+
+def all_packed(individuals):
+    return all(isinstance(ind, PackedBitStringVector) for ind in individuals)
+
+
+def uniform_on_fail_batch(mutation, matrix, rows, lower, upper):
+    """
+    Handle gauss mutation failure of vectors in a population matrix
+    by performing uniform mutation (with the operator probability).
+    """
+    rows = rows[np.random.random(len(rows)) <= mutation.probability]
+    cells = mutation.select_batch_cells(len(rows), matrix.shape[1])
+    matrix[rows[:, None], cells] = uniform_float_values(
+        None, lower[cells], upper[cells]
+    )
+
+
 class FloatVectorUniformOnePointMutation(VectorNPointMutation):
     """
     Uniform One Point Float Mutation.
@@ -48,6 +108,7 @@ class FloatVectorUniformOnePointMutation(VectorNPointMutation):
             ),
             events=events,
         )
+        self.batch_mut_val_getter = uniform_float_values
 
 
 class FloatVectorUniformNPointMutation(VectorNPointMutation):
@@ -77,6 +138,7 @@ class FloatVectorUniformNPointMutation(VectorNPointMutation):
             ),
             events=events,
         )
+        self.batch_mut_val_getter = uniform_float_values
 
 
 class FloatVectorGaussOnePointMutation(VectorNPointMutation):
@@ -125,6 +187,7 @@ class FloatVectorGaussOnePointMutation(VectorNPointMutation):
             events=events,
             attempts=attempts,
         )
+        self.batch_mut_val_getter = gauss_values(mu, sigma)
 
     def on_fail(self, payload):
         """
@@ -135,6 +198,9 @@ class FloatVectorGaussOnePointMutation(VectorNPointMutation):
         )
         return mut.apply_operator(payload)
 
+    def on_fail_batch(self, matrix, rows, lower, upper):
+        uniform_on_fail_batch(self, matrix, rows, lower, upper)
+
 
 class FloatVectorGaussNPointMutation(VectorNPointMutation):
     """
@@ -183,6 +249,7 @@ class FloatVectorGaussNPointMutation(VectorNPointMutation):
             events=events,
             attempts=attempts,
         )
+        self.batch_mut_val_getter = gauss_values(mu, sigma)
 
     def on_fail(self, payload):
         """
@@ -193,6 +260,9 @@ class FloatVectorGaussNPointMutation(VectorNPointMutation):
         )
         return mut.apply_operator(payload)
 
+    def on_fail_batch(self, matrix, rows, lower, upper):
+        uniform_on_fail_batch(self, matrix, rows, lower, upper)
+
 
 class IntVectorOnePointMutation(VectorNPointMutation):
     """
@@ -218,6 +288,10 @@ class IntVectorOnePointMutation(VectorNPointMutation):
                          mut_val_getter=lambda individual, index: individual.get_random_number_in_bounds(
                              index) if random() <= self.probability_for_each else individual.cell_value(index),
                          events=events, cell_selector=lambda vec: list(range(vec.size())))
+        self.batch_mut_val_getter = each_with_probability(
+            uniform_int_values, lambda: self.probability_for_each
+        )
+        self.batch_cell_selector = all_batch_cells
 
 
 class IntVectorNPointMutation(VectorNPointMutation):
@@ -247,6 +321,7 @@ class IntVectorNPointMutation(VectorNPointMutation):
             events=events,
             n=n,
         )
+        self.batch_mut_val_getter = uniform_int_values
 
 
 class BitStringVectorFlipMutation(VectorNPointMutation):
@@ -274,6 +349,16 @@ class BitStringVectorFlipMutation(VectorNPointMutation):
             n=1,
             events=events,
         )
+        self.batch_mut_val_getter = bit_flip_values
+
+    def apply(self, individuals):
+        if all_packed(individuals):
+            # flip the packed bits word-wise
+            for individual in individuals:
+                individual.flip_bits(self.cell_selector(individual))
+            self.applied_individuals = individuals
+            return individuals
+        return super().apply(individuals)
 
 
 class BitStringVectorNFlipMutation(VectorNPointMutation):
@@ -316,3 +401,19 @@ class BitStringVectorNFlipMutation(VectorNPointMutation):
             events=events,
             n=n
         )
+        self.batch_mut_val_getter = each_with_probability(
+            bit_flip_values, lambda: self.probability_for_each
+        )
+
+    def apply(self, individuals):
+        if all_packed(individuals):
+            # flip the packed bits word-wise
+            for individual in individuals:
+                cells = np.asarray(self.cell_selector(individual))
+                flipped = np.random.random(len(cells))
+                individual.flip_bits(
+                    cells[flipped <= self.probability_for_each]
+                )
+            self.applied_individuals = individuals
+            return individuals
+        return super().apply(individuals)
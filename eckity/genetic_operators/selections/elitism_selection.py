@@ -1,3 +1,4 @@
+from eckity.fitness.fitness_summary import FitnessSummary
 from eckity.genetic_operators import SelectionMethod
 
 
@@ -7,12 +8,16 @@ class ElitismSelection(SelectionMethod):
         self.num_elites = num_elites
         self.higher_is_better = higher_is_better
 
-    def select(self, source_inds, dest_inds):
-        elites = sorted(
-            source_inds,
-            key=lambda ind: ind.get_augmented_fitness(),
-            reverse=self.higher_is_better,
-        )[: self.num_elites]
+    def apply_operator(self, payload):
+        # the payload may include the fitness summary of the source
+        return self.select(*payload)
+
+    def select(self, source_inds, dest_inds, fitness_summary=None):
+        if fitness_summary is None:
+            fitness_summary = FitnessSummary(
+                source_inds, self.higher_is_better
+            )
+        elites = fitness_summary.top(self.num_elites)
         for elite in elites:
             cloned = elite.clone()
             cloned.selected_by.append(type(self).__name__)
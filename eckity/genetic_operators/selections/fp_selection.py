@@ -33,7 +33,23 @@ class FitnessProportionateSelection(SelectionMethod):
     @override
     def select(self, source_inds, dest_inds):
         n_selected = len(source_inds) - len(dest_inds)
+        dest_inds.extend(self._spin(source_inds, n_selected))
 
+        self.selected_individuals = dest_inds
+
+        return dest_inds
+
+    @override
+    def select_n(self, source_inds, n):
+        selected = self._spin(source_inds, n)
+        self.selected_individuals = selected
+        return selected
+
+    def _spin(self, source_inds, n_selected):
+        """
+        Select n_selected clones of source_inds, proportionately to
+        their fitness scores.
+        """
         fitness_scores = np.array(
             [ind.get_augmented_fitness() for ind in source_inds]
         )
@@ -63,11 +79,9 @@ class FitnessProportionateSelection(SelectionMethod):
             source_inds, size=n_selected, replace=True, p=fit_p
         )
 
+        clones = []
         for selected_ind in selected_inds:
             clone = selected_ind.clone()
             clone.selected_by.append(type(self).__name__)
-            dest_inds.append(clone)
-
-        self.selected_individuals = dest_inds
-
-        return dest_inds
+            clones.append(clone)
+        return clones
@@ -18,6 +18,27 @@ class SelectionMethod(Operator):
     def select(self, source_inds, dest_inds):
         pass
 
+    def select_n(self, source_inds, n):
+        """
+        Select n individuals from source_inds.
+        By default, as many individuals as source_inds are selected, and
+        the first n of them are returned. Selection methods that can
+        select a given number of individuals should override this method.
+
+        Parameters
+        ----------
+        source_inds: list of Individuals
+            individuals to select from
+        n: int
+            number of individuals to select
+
+        Returns
+        -------
+        list of Individuals
+            the selected individuals (clones)
+        """
+        return self.select(source_inds, [])[:n]
+
     def event_name_to_data(self, event_name):
         if event_name == "after_selection":
             return {"applied_individuals": self.selected_individuals}
@@ -25,3 +25,14 @@ def test_selection_higher_is_better(higher_is_better):
 
     assert first_selected.selected_by == [type(fp_sel).__name__]
     assert first_selected.cloned_from == [inds[expected_selected_idx].id]
+
+
+def test_select_n():
+    fp_sel = FitnessProportionateSelection(higher_is_better=True)
+    inds = [
+        BitStringVector(SimpleFitness(i, higher_is_better=True), length=4)
+        for i in range(10)
+    ]
+    selected = fp_sel.select_n(inds, 3)
+    assert len(selected) == 3
+    assert all(ind.selected_by == [type(fp_sel).__name__] for ind in selected)
@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 
+from eckity.fitness.gp_fitness import GPFitness
 from eckity.fitness.simple_fitness import SimpleFitness
 from eckity.genetic_operators.selections.tournament_selection import (
     TournamentSelection,
@@ -47,3 +49,65 @@ class TestTournament:
             tournament.select(inds, [])
         
         assert "tournament size" in str(err_info).lower()
+
+    def test_winners_are_tournament_best(self, inds):
+        tournament = TournamentSelection(tournament_size=3, replace=False)
+
+        np.random.seed(0)
+        selected = tournament.select(inds, [])
+        np.random.seed(0)
+        tournaments = tournament._draw_tournaments(len(inds), len(inds))
+
+        # lower fitness is better, and fitness equals index
+        indices = {ind.id: i for i, ind in enumerate(inds)}
+        assert [indices[ind.cloned_from[-1]] for ind in selected] == [
+            min(tour) for tour in tournaments.tolist()
+        ]
+        assert all(len(set(tour)) == 3 for tour in tournaments.tolist())
+
+    def test_reproducible(self, inds):
+        tournament = TournamentSelection(tournament_size=4)
+
+        np.random.seed(1)
+        first = [ind.cloned_from[-1] for ind in tournament.select(inds, [])]
+        np.random.seed(1)
+        second = [ind.cloned_from[-1] for ind in tournament.select(inds, [])]
+
+        assert first == second
+
+    def test_higher_is_better_augmented_fitness(self):
+        inds = [
+            BitStringVector(
+                GPFitness(i, higher_is_better=True, bloat_weight=1.0),
+                length=length,
+                vector=[0] * length,
+            )
+            for i, length in [(5, 0), (6, 3), (4, 0)]
+        ]
+        tournament = TournamentSelection(tournament_size=3, replace=False)
+
+        # augmented fitness scores are 5, 3 and 4
+        selected = tournament.select(inds, [])
+        assert all(ind.cloned_from[-1] == inds[0].id for ind in selected)
+
+    def test_non_scalar_fitness_compared_pairwise(self, inds):
+        tournament = TournamentSelection(tournament_size=2)
+
+        assert tournament._fitness_array(inds) is not None
+        not_evaluated = [BitStringVector(SimpleFitness(), length=0)]
+        assert tournament._fitness_array(inds + not_evaluated) is None
+
+    def test_select_n(self, inds):
+        tournament = TournamentSelection(tournament_size=3)
+
+        np.random.seed(2)
+        selected = tournament.select_n(inds, 3)
+        assert tournament.selected_individuals == selected
+        np.random.seed(2)
+        expected = tournament.select(inds, [])[:3]
+
+        # only the needed tournaments are drawn
+        assert len(selected) == 3
+        assert [ind.cloned_from for ind in selected] == [
+            ind.cloned_from for ind in expected
+        ]
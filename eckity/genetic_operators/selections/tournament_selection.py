@@ -1,9 +1,13 @@
 import random
+
+import numpy as np
 from overrides import override
 
+from eckity.fitness.simple_fitness import SimpleFitness
 from eckity.genetic_operators.selections.selection_method import (
     SelectionMethod,
 )
+from eckity.individual import Individual
 
 
 class TournamentSelection(SelectionMethod):
@@ -20,6 +24,12 @@ class TournamentSelection(SelectionMethod):
         randomly chosen individuals. The individual(s) with the best fitness
         scores are selected to reproduce the next generation.
 
+        When the individuals have scalar fitness scores (SimpleFitness),
+        their augmented fitness is computed once, all tournaments are
+        drawn at once as an index matrix (using NumPy's random generator),
+        and the winners are found with argmin/argmax. Otherwise, the
+        participants are compared one by one with `better_than`.
+
         Parameters
         ----------
         tournament_size : int
@@ -40,14 +50,6 @@ class TournamentSelection(SelectionMethod):
 
     @override
     def select(self, source_inds, dest_inds):
-        if not self.replace and len(source_inds) < self.tournament_size:
-            raise ValueError(
-                f"""Tournament size must be greater or equal to
-                            the number of individuals to be selected from.
-                             Tournament size={self.tournament_size},
-                             number of individuals: {len(source_inds)}"""
-            )
-
         """
         The selection should add len(source_inds) individuals to dest_inds,
         so the required number of tournaments is the size of source
@@ -56,32 +58,147 @@ class TournamentSelection(SelectionMethod):
         """
         n_tournaments = (len(source_inds) - len(dest_inds)) // self.arity
 
+        # add all winners to dest_inds
+        dest_inds.extend(self._run_tournaments(source_inds, n_tournaments))
+
+        self.selected_individuals = dest_inds
+
+        return dest_inds
+
+    @override
+    def select_n(self, source_inds, n):
+        n_tournaments = -(-n // self.arity)
+        winners = self._run_tournaments(source_inds, n_tournaments)[:n]
+        self.selected_individuals = winners
+        return winners
+
+    def _run_tournaments(self, source_inds, n_tournaments):
         """
-        Select the appropriate tournament creation function.
-        `random.choices` selects k elements with replacements,
-        `random.sample` selects k unique elements.
-        """
-        sel_func = random.choices if self.replace else random.sample
+        Run n_tournaments tournaments on source_inds.
 
-        # create all tournaments beforehand
-        tournaments = [
-            sel_func(source_inds, k=self.tournament_size)
-            for _ in range(n_tournaments)
-        ]
+        Returns
+        -------
+        list of Individuals
+            clones of the tournament winners
+        """
+        if not self.replace and len(source_inds) < self.tournament_size:
+            raise ValueError(
+                f"""Tournament size must be greater or equal to
+                            the number of individuals to be selected from.
+                             Tournament size={self.tournament_size},
+                             number of individuals: {len(source_inds)}"""
+            )
 
-        # pick the winner of each tournament and add all winners to dest_inds
-        winners = [self._pick_tournament_winner(tour) for tour in tournaments]
-        dest_inds.extend(winners)
+        scores = (
+            self._fitness_array(source_inds) if n_tournaments > 0 else None
+        )
+        if scores is not None:
+            tournaments = self._draw_tournaments(
+                len(source_inds), n_tournaments
+            )
+            # the first best participant wins, as in better_than comparisons
+            winner_indices = tournaments[
+                np.arange(n_tournaments), scores[tournaments].argmin(axis=1)
+            ]
+            winners = [
+                self._clone_winner(source_inds[i])
+                for i in winner_indices.tolist()
+            ]
+        else:
+            """
+            Select the appropriate tournament creation function.
+            `random.choices` selects k elements with replacements,
+            `random.sample` selects k unique elements.
+            """
+            sel_func = random.choices if self.replace else random.sample
 
-        self.selected_individuals = dest_inds
+            # create all tournaments beforehand
+            tournaments = [
+                sel_func(source_inds, k=self.tournament_size)
+                for _ in range(n_tournaments)
+            ]
 
-        return dest_inds
+            # pick the winner of each tournament
+            winners = [
+                self._pick_tournament_winner(tour) for tour in tournaments
+            ]
+        return winners
 
     def _pick_tournament_winner(self, tournament):
         winner = tournament[0]
         for participant in tournament[1:]:
             if participant.better_than(winner):
                 winner = participant
+        return self._clone_winner(winner)
+
+    def _clone_winner(self, winner):
         result = winner.clone()
         result.selected_by.append(type(self).__name__)
         return result
+
+    def _draw_tournaments(self, n_individuals, n_tournaments):
+        """
+        Draw the participants of all tournaments.
+
+        Returns
+        -------
+        np.ndarray
+            participant indices, of shape
+            (n_tournaments, tournament_size)
+        """
+        k = self.tournament_size
+        if self.replace:
+            return np.random.randint(n_individuals, size=(n_tournaments, k))
+
+        if 2 * k > n_individuals:
+            # most draws would repeat an individual, so permute instead
+            keys = np.random.random_sample((n_tournaments, n_individuals))
+            return keys.argsort(axis=1)[:, :k]
+
+        # redraw the tournaments that contain an individual twice
+        tournaments = np.random.randint(n_individuals, size=(n_tournaments, k))
+        while True:
+            ordered = np.sort(tournaments, axis=1)
+            repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+            n_repeated = np.count_nonzero(repeated)
+            if n_repeated == 0:
+                return tournaments
+            tournaments[repeated] = np.random.randint(
+                n_individuals, size=(n_repeated, k)
+            )
+
+    @staticmethod
+    def _fitness_array(individuals):
+        """
+        Extract the augmented fitness scores of the individuals, negated
+        if higher is better (so the best score is the minimal one).
+
+        Returns
+        -------
+        np.ndarray or None
+            fitness scores, or None if the individuals are not compared
+            by scalar fitness scores in the same direction
+        """
+        if not individuals:
+            return None
+        higher_is_better = individuals[0].fitness.higher_is_better
+        scores = []
+        for ind in individuals:
+            fitness = ind.fitness
+            if (
+                not isinstance(fitness, SimpleFitness)
+                or type(fitness).better_than is not SimpleFitness.better_than
+                or type(ind).better_than is not Individual.better_than
+                or fitness.higher_is_better != higher_is_better
+                or not fitness.is_fitness_evaluated()
+            ):
+                return None
+            scores.append(fitness.get_augmented_fitness(ind))
+
+        try:
+            scores = np.asarray(scores, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        if scores.ndim != 1 or np.isnan(scores).any():
+            return None
+        return -scores if higher_is_better else scores
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy, deepcopy
 
 from eckity.fitness.fitness import Fitness
 
@@ -55,14 +55,74 @@ class Individual:
     def set_fitness_not_evaluated(self):
         self.fitness.set_not_evaluated()
 
+    def invalidate_cache(self):
+        """
+        Discard any data derived from the genome of the individual.
+        Called after the genome is modified in-place (e.g. by a genetic
+        operator). Does nothing by default.
+        """
+        pass
+
+    def genome_key(self):
+        """
+        Return a hashable key that identifies the genome of the individual,
+        such that individuals with equal keys have equal fitness scores.
+        Used by FitnessCache. Returns None by default (not cacheable).
+        """
+        return None
+
+    def get_genome(self):
+        """
+        Return the genome of the individual, as a compact picklable object.
+        Together with `set_genome`, allows sending only the genome
+        of an individual to a worker process.
+        """
+        raise ValueError(
+            f"{type(self).__name__} does not support genome payloads"
+        )
+
+    def set_genome(self, genome):
+        """
+        Replace the genome of the individual with the given genome,
+        as returned by `get_genome`.
+        """
+        raise ValueError(
+            f"{type(self).__name__} does not support genome payloads"
+        )
+
     def clone(self):
-        result = deepcopy(self)
+        result = self._copy()
         result.cloned_from.append(self.id)
         if result.update_parents:
             result.parents = []
         result.update_id()
         return result
 
+    def _copy(self):
+        """
+        Copy the individual for `clone`. Deep copies it by default.
+        Encodings override this to copy only the genome and the state of
+        this individual (see `_shallow_copy`), sharing configuration such
+        as function sets and bounds by reference.
+        """
+        return deepcopy(self)
+
+    def _shallow_copy(self):
+        """
+        Copy the individual, sharing its attributes by reference,
+        except for the fitness and the lineage lists.
+        The caller is responsible for copying the genome.
+        """
+        result = copy(self)
+        # copied as in deepcopy (see Fitness.cache)
+        result.fitness = copy(self.fitness)
+        result.cloned_from = self.cloned_from.copy()
+        result.selected_by = self.selected_by.copy()
+        result.applied_operators = self.applied_operators.copy()
+        if self.update_parents:
+            result.parents = self.parents.copy()
+        return result
+
     def get_pure_fitness(self):
         return self.fitness.get_pure_fitness()
 
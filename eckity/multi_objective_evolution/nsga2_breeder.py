@@ -40,16 +40,47 @@ class NSGA2Breeder(SimpleBreeder):
 			subpopulation.individuals = nextgen_population
 
 	def _create_next_gen(self, subpopulation):
-		# oldgen_population = deepcopy(subpopulation.individuals)  # needed since apply operator changes the values of
-		oldgen_population = [ind.clone() for ind in subpopulation.individuals]
+		"""
+        Create the combined (mu + lambda) pool of the parents and the offspring.
+
+        The parents are cloned with their fitness scores, and the operators are
+        applied in-place on the sub-population individuals. Offspring that an
+        operator changed are reset by the operator, and only they are evaluated
+        by the population evaluator. The fitness scores of the parent clones
+        and of the unchanged offspring are marked as reusable
+        (see `Fitness.reusable`), so they are not evaluated again.
+
+        Parameters
+        ----------
+        subpopulation: Subpopulation
+            the sub-population to breed (evaluated)
+
+        Returns
+        -------
+        list of Individuals
+            the parents, followed by the offspring
+        """
+		oldgen_population = [_clone_evaluated(ind) for ind in subpopulation.individuals]
 
 		nextgen_population = self._apply_operators(subpopulation.get_operators_sequence(),
 												   subpopulation.individuals)  # self.selected_individuals)
 
-		oldgen_population += nextgen_population
-		nextgen_population = oldgen_population
-
 		for ind in nextgen_population:
-			ind.fitness.set_not_evaluated()
+			if ind.fitness.is_fitness_evaluated():
+				ind.fitness.reusable = True
+
+		return oldgen_population + nextgen_population
+
 
-		return nextgen_population
+def _clone_evaluated(individual):
+	"""
+    Clone an individual with its fitness score, marked as reusable.
+    Clones usually drop their fitness scores (unless `Fitness.cache` is set),
+    but the objectives of an unchanged parent are already known.
+    """
+	clone = individual.clone()
+	if individual.fitness.is_fitness_evaluated():
+		if not clone.fitness.is_fitness_evaluated():
+			clone.fitness.set_fitness(individual.fitness.get_pure_fitness())
+		clone.fitness.reusable = True
+	return clone
@@ -123,11 +123,13 @@ class NSGA2Evolution(Algorithm):
         """
         Initialize the evolutionary algorithm
 
-        Register statistics to `after_generation` event
+        Register statistics to `after_generation` and `evolution_finished`
+        events
         """
         super().initialize()
         for stat in self.statistics:
             self.register("after_generation", stat.write_statistics)
+            self.register("evolution_finished", stat.flush_statistics)
 
     def execute(self, **kwargs):
         """
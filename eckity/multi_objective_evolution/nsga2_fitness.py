@@ -44,7 +44,7 @@ class NSGA2Fitness(Fitness):
 
     @overrides
     def set_not_evaluated(self):
-        self._is_evaluated = False
+        super().set_not_evaluated()
         self.fitness = None
         self.crowding = 0
         self.front_rank = float("inf")
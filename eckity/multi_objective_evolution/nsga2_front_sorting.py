@@ -1,6 +1,8 @@
-from collections import defaultdict
+from bisect import bisect_left
 from typing import List
 
+import numpy as np
+
 from eckity.individual import Individual
 from eckity.population import Population
 
@@ -12,6 +14,9 @@ class NSGA2FrontSorting():
     (mening that the are dominated by as littel amount of other Individuals as posible)
 
     this class allso set the values of the "front_rank" and "crowding" of each individual
+
+    the fronts are found at once by sorting the objective matrix of the population
+    (see `non_dominated_sort`), instead of comparing every pair of individuals
     '''
 
 	def select_for_population(self, population: Population, new_pop_size=None):
@@ -36,77 +41,189 @@ class NSGA2FrontSorting():
 		if not pop_size:
 			pop_size = len(source_inds) // 2
 
-		front_rank = 1
-		self._init_domination_dict(source_inds)
-		while len(dest_inds) < pop_size:
-			new_pareto_front = self._pareto_front_finding(source_inds)
-			self._calc_fronts_crowding(new_pareto_front)
+		if not source_inds:
+			return dest_inds
+		objectives = self._objective_matrix(source_inds)
+		fronts = self._front_indices(non_dominated_sort(objectives))
+		for front_rank, indices in enumerate(fronts, start=1):
+			if len(dest_inds) >= pop_size:
+				break
+			new_pareto_front = [source_inds[i] for i in indices]
+			crowding = crowding_distances(objectives[indices])
+			self._calc_fronts_crowding(new_pareto_front, crowding)
 			self._update_new_pareto_front_rank(new_pareto_front, front_rank)
 
 			total_pareto_size = len(new_pareto_front) + len(dest_inds)
 			if total_pareto_size > pop_size:
 				number_solutions_needed = pop_size - len(dest_inds)
-				new_pareto_front.sort(key=lambda x: x.fitness.crowding, reverse=True)
-				new_pareto_front = new_pareto_front[
-								   :int(number_solutions_needed)]  # take the individuals with the largest crowding
+				# take the individuals with the largest crowding (the first ones on ties)
+				largest = np.argsort(-crowding, kind="stable")[:int(number_solutions_needed)]
+				new_pareto_front = [new_pareto_front[i] for i in largest.tolist()]
 			dest_inds += new_pareto_front
-			source_inds = self._remove_pareto_front(source_inds, new_pareto_front)
-			front_rank += 1
 		return dest_inds
 
-	def _remove_pareto_front(self, source_inds, pareto_front):
-		for dominating_ind in pareto_front:
-			for dominated_ind in self.domination_dict[dominating_ind].dominates:
-				self.domination_dict[dominated_ind].domination_counter -= 1
-		return list(set(source_inds) - set(pareto_front))
+	def _sort_fronts(self, source_inds: List[Individual]) -> List[List[Individual]]:
+		'''
+        Split the individuals into non-dominated fronts
+
+        Parameters
+        ----------
+        source_inds : list of individuals
+
+        Returns : list of fronts, best first. each front keeps the order of source_inds
+        -------
+
+        '''
+		if not source_inds:
+			return []
+		ranks = non_dominated_sort(self._objective_matrix(source_inds))
+		return [[source_inds[i] for i in indices] for indices in self._front_indices(ranks)]
+
+	def _front_indices(self, ranks: np.ndarray) -> List[np.ndarray]:
+		# stable, so each front keeps the order of the individuals
+		order = np.argsort(ranks, kind="stable")
+		bounds = np.flatnonzero(np.diff(ranks[order])) + 1
+		return np.split(order, bounds)
+
+	def _objective_matrix(self, individuals: List[Individual]) -> np.ndarray:
+		'''
+        Build the (n, m) objective matrix of the individuals,
+        with every objective negated if higher is better (so all objectives are minimized)
+        '''
+		higher_is_better = individuals[0].fitness.higher_is_better
+		objectives = []
+		for ind in individuals:
+			if not ind.fitness.is_fitness_evaluated():
+				raise ValueError("Fitnesses must be evaluated before comparison")
+			if ind.fitness.higher_is_better != higher_is_better:
+				raise ValueError("Fitnesses must have the same objective directions")
+			objectives.append(ind.fitness.get_augmented_fitness(ind))
+		if len({len(objective) for objective in objectives}) != 1:
+			raise ValueError("Fitnesses must be of the same lngth")
+
+		objectives = np.array(objectives, dtype=np.float64)
+		if isinstance(higher_is_better, bool):
+			higher_is_better = [higher_is_better] * objectives.shape[1]
+		return np.where(higher_is_better, -objectives, objectives)
 
 	def _update_new_pareto_front_rank(self, new_pareto_front: List[Individual], front_rank: int):
 		for ind in new_pareto_front:
 			ind.fitness.front_rank = front_rank
 
-	def _calc_fronts_crowding(self, front: List[Individual]):
-		for ind in front:
-			ind.fitness.crowding = 0
-
-		objectiv_indexes = range(len(front[0].get_pure_fitness()))
-		for objective_index in objectiv_indexes:
-			front.sort(key=lambda x: x.get_pure_fitness()[objective_index])  # sort for each objectiv
-			front[0].fitness.crowding = float("inf")
-			front[-1].fitness.crowding = float("inf")
-			for i in range(1, len(front) - 1):
-				curr_crowding = front[i + 1].get_pure_fitness()[objective_index] - front[i - 1].get_pure_fitness()[
-					objective_index]
-				d = front[-1].get_pure_fitness()[objective_index] - front[0].get_pure_fitness()[objective_index]
-				if d:
-					curr_crowding /= d
-					front[i].fitness.crowding += curr_crowding
-
-	def _init_domination_dict(self, source_inds: List[Individual]):
-		self.domination_dict = defaultdict(lambda: DominationCounter())
-		for i, ind1 in enumerate(source_inds):
-			for ind2 in source_inds[i + 1:]:
-				self._habdle_domination(ind1, ind2)
-
-	def _habdle_domination(self, ind1, ind2):
-		if ind2.fitness.dominate(ind2, ind1.fitness, ind1):
-			self._increase_domination_counter(ind2, ind1)
-		elif ind1.fitness.dominate(ind1, ind2.fitness, ind2):
-			self._increase_domination_counter(ind1, ind2)
-
-	def _increase_domination_counter(self, dominating, dominated):
-		self.domination_dict[dominating].dominates.append(dominated)
-		self.domination_dict[dominated].domination_counter += 1
-
-	def _pareto_front_finding(self, source_inds: List[Individual]):
-		pareto_front = [ind for ind in source_inds if self.domination_dict[ind].domination_counter == 0]
-		return pareto_front
-
-
-class DominationCounter:
-	def __init__(self):
-		'''
-        self.dominates : a list of all the individuals this individual dominates
-        self.domination_counter : a counter of how many other individuals dominates this one
-        '''
-		self.dominates = []
-		self.domination_counter = 0
+	def _calc_fronts_crowding(self, front: List[Individual], crowding: np.ndarray):
+		for ind, distance in zip(front, crowding.tolist()):
+			ind.fitness.crowding = distance
+
+
+def non_dominated_sort(objectives: np.ndarray) -> np.ndarray:
+	'''
+    Find the non-dominated front of every row of an objective matrix (all objectives minimized)
+
+    the rows are processed in lexicographic order, so a row can only be dominated by previous rows,
+    and the front of each row is found by binary search over the fronts found so far
+    (Efficient Non-dominated Sort, O(n log n) comparisons).
+    with two objectives, each front is represented by its last row, so a comparison takes O(1)
+    (O(n log n) in total), otherwise the rows of a front are compared at once with NumPy.
+
+    Parameters
+    ----------
+    objectives : (n, m) array of objective values
+
+    Returns : (n,) array of front ranks, starting from 0 (the non-dominated front)
+    -------
+
+    '''
+	n, m = objectives.shape
+	ranks = np.zeros(n, dtype=np.int64)
+	if n == 0:
+		return ranks
+	order = np.lexsort(objectives.T[::-1])
+	if m == 1:
+		# the rows with the best value are on the first front, and so on
+		_, ranks[order] = np.unique(objectives[order, 0], return_inverse=True)
+		return ranks
+	if m == 2:
+		_two_objectives_sort(objectives, order, ranks)
+		return ranks
+
+	# rows of every front, in buffers that double their size when full
+	buffers, sizes = [], []
+	for i in order.tolist():
+		row = objectives[i]
+		low, high = 0, len(buffers)
+		while low < high:
+			middle = (low + high) // 2
+			front = buffers[middle][:sizes[middle]]
+			if _dominated_by_any(row, front):
+				low = middle + 1
+			else:
+				high = middle
+		if low == len(buffers):
+			buffers.append(np.empty((4, m), dtype=objectives.dtype))
+			sizes.append(0)
+		if sizes[low] == len(buffers[low]):
+			buffers[low] = np.concatenate([buffers[low], np.empty_like(buffers[low])])
+		buffers[low][sizes[low]] = row
+		sizes[low] += 1
+		ranks[i] = low
+	return ranks
+
+
+def _two_objectives_sort(objectives: np.ndarray, order: np.ndarray, ranks: np.ndarray):
+	'''
+    Non-dominated sort of two objectives.
+    the rows of a front are in decreasing order of the second objective, so a row is dominated
+    by a front if and only if it is dominated by the last row of the front, that is,
+    if (f2, f1) of the last row is lexicographically smaller than (f2, f1) of the row.
+    the keys of the last rows increase with the front rank, so the front is found with bisect.
+    '''
+	# (f2, f1) of the last row of every front
+	last_keys = []
+	for i, f1, f2 in zip(order.tolist(), objectives[order, 0].tolist(), objectives[order, 1].tolist()):
+		key = (f2, f1)
+		rank = bisect_left(last_keys, key)
+		if rank == len(last_keys):
+			last_keys.append(key)
+		else:
+			last_keys[rank] = key
+		ranks[i] = rank
+
+
+def _dominated_by_any(row: np.ndarray, front: np.ndarray) -> bool:
+	not_worse = (front <= row).all(axis=1)
+	better = (front < row).any(axis=1)
+	return bool((not_worse & better).any())
+
+
+def crowding_distances(objectives: np.ndarray) -> np.ndarray:
+	'''
+    Compute the crowding distance of every row of the objective matrix of a front
+
+    for every objective, the rows are sorted once, the two extreme rows get an infinite distance,
+    and every other row adds the normalized difference between its two neighbours.
+    duplicate rows get the same distance (that of their unique row), and ties of an objective
+    are sorted by the following objectives, so the result does not depend on the order of the rows.
+
+    Parameters
+    ----------
+    objectives : (n, m) array of objective values
+
+    Returns : (n,) array of crowding distances
+    -------
+
+    '''
+	n, m = objectives.shape
+	if n == 0:
+		return np.zeros(0)
+	unique, inverse = np.unique(objectives, axis=0, return_inverse=True)
+	distances = np.zeros(len(unique))
+	for objective_index in range(m):
+		# sort by this objective, then by the following objectives
+		keys = np.roll(unique, -objective_index, axis=1).T[::-1]
+		order = np.lexsort(keys)
+		values = unique[order, objective_index]
+		distances[order[[0, -1]]] = np.inf
+		d = values[-1] - values[0]
+		if d and len(unique) > 2:
+			distances[order[1:-1]] += (values[2:] - values[:-2]) / d
+	return distances[inverse.reshape(-1)]
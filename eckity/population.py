@@ -16,6 +16,11 @@ class Population:
         for sub_pop in self.sub_populations:
             sub_pop.create_subpopulation_individuals()
 
+    def set_fitness_not_evaluated(self):
+        for sub_pop in self.sub_populations:
+            for ind in sub_pop.individuals:
+                ind.set_fitness_not_evaluated()
+
     def find_individual_subpopulation(self, individual):
         for sub_pop in self.sub_populations:
             if sub_pop.contains_individual(individual):
@@ -1,6 +1,7 @@
 from .classification_evaluator import ClassificationEvaluator
 from .regression_evaluator import RegressionEvaluator
 
+from .shared_array import SharedArray
 from .sklearn_wrapper import SklearnWrapper
 from .sk_classifier import SKClassifier
 from .sk_regressor import SKRegressor
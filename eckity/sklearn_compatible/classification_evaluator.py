@@ -18,6 +18,13 @@ class ClassificationEvaluator(SimpleIndividualEvaluator):
     """
     Class to compute the fitness of an individual in classification problems.
     All simple classes assume only one sub-population.
+
+    Set `compile_trees` to compile each tree into a flat program
+    before executing it. The compiled program is cached on the tree
+    until it is modified.
+
+    If `subtree_cache` is set (by TreePopulationEvaluator), the trees
+    are executed through this shared cache of subtree results.
     """
 
     def __init__(
@@ -27,12 +34,15 @@ class ClassificationEvaluator(SimpleIndividualEvaluator):
         metric=accuracy_score,
         n_classes=2,
         clf_method=CLF_METHODS[0],
+        compile_trees=False,
     ):
         super().__init__()
         self.X = X
         self.y = y
         self.metric = metric
         self.n_classes = n_classes
+        self.compile_trees = compile_trees
+        self.subtree_cache = None
 
         if clf_method not in CLF_METHODS:
             raise ValueError(
@@ -86,9 +96,29 @@ class ClassificationEvaluator(SimpleIndividualEvaluator):
         selected_func = clf_method_to_function[self.clf_method]
         return selected_func(individual)
 
+    def execute_individual(self, individual):
+        """
+        Execute the program tree on X, using the subtree cache if it is set.
+
+        Parameters
+        ----------
+        individual : Tree
+            An individual program tree in the GP population.
+
+        Returns
+        ----------
+        array-like of shape (n_samples,)
+            Execution result of the tree on X.
+        """
+        if self.subtree_cache is not None:
+            return self.subtree_cache.execute(individual, self.X)
+        if self.compile_trees:
+            individual.compile()
+        return individual.execute(self.X)
+
     def _clf_sigmoid(self, individual):
         # normalize execute results between 0 and 1
-        probs = sigmoid(individual.execute(self.X))
+        probs = sigmoid(self.execute_individual(individual))
         # Create thresholds: 1/N, 2/N, ..., (N-1)/N
         thresholds = np.linspace(0, 1, self.n_classes + 1)[1:-1]
         return np.digitize(probs, thresholds)
@@ -105,4 +135,4 @@ class ClassificationEvaluator(SimpleIndividualEvaluator):
             raise ValueError(
                 f"Individual must have {method} function in depth 0 to classify."
             )
-        return individual.execute(self.X)
+        return self.execute_individual(individual)
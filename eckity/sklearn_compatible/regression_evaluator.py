@@ -25,13 +25,27 @@ class RegressionEvaluator(SimpleIndividualEvaluator):
     metric: callable (optional, default=mean_absolute_error)
     A function which receives two array-like of shapes (n_samples,) or (n_samples, 1) and returns a float or
     ndarray of floats
+
+    compile_trees: bool, default=False
+    Compile each tree into a flat program before executing it.
+    The compiled program is cached on the tree until it is modified.
+
+    Attributes
+    ----------
+    subtree_cache: SubtreeCache, default=None
+    Shared cache of subtree results, used to execute the trees if set.
+    Assigned by TreePopulationEvaluator during population evaluation.
     """
 
-    def __init__(self, X=None, y=None, metric=mean_absolute_error):
+    def __init__(
+        self, X=None, y=None, metric=mean_absolute_error, compile_trees=False
+    ):
         super().__init__()
         self.X = X
         self.y = y
         self.metric = metric
+        self.compile_trees = compile_trees
+        self.subtree_cache = None
 
     def set_context(self, context):
         """
@@ -75,4 +89,24 @@ class RegressionEvaluator(SimpleIndividualEvaluator):
             Computed fitness value - evaluated using the provided scoring function between the execution result of X and
             the vector y.
         """
-        return self.metric(self.y, individual.execute(self.X))
+        return self.metric(self.y, self.execute_individual(individual))
+
+    def execute_individual(self, individual):
+        """
+        Execute the program tree on X, using the subtree cache if it is set.
+
+        Parameters
+        ----------
+        individual : Tree
+            An individual program tree in the GP population.
+
+        Returns
+        ----------
+        array-like of shape (n_samples,)
+            Execution result of the tree on X.
+        """
+        if self.subtree_cache is not None:
+            return self.subtree_cache.execute(individual, self.X)
+        if self.compile_trees:
+            individual.compile()
+        return individual.execute(self.X)
@@ -0,0 +1,109 @@
+"""
+This module implements the SharedArray class.
+"""
+
+import logging
+import os
+import tempfile
+from weakref import WeakValueDictionary
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# arrays attached by the current (worker) process, by file path
+_attached = WeakValueDictionary()
+
+
+class SharedArray(np.memmap):
+    """
+    NumPy array backed by a memory-mapped file, shared between processes.
+
+    A SharedArray is pickled by reference: only the file path, shape and
+    dtype are sent to a worker process, which maps the same file as a
+    read-only, zero-copy view (once per worker process, as long as the
+    view is in use). On Linux, the file is created in /dev/shm, so its
+    contents stay in (shared) memory.
+    Slices and results of operations are pickled as regular arrays.
+
+    Create shared arrays with `SharedArray.from_array`, and call
+    `release` in the creating process when they are no longer used.
+    """
+
+    def __array_finalize__(self, obj):
+        super().__array_finalize__(obj)
+        # views and copies are not shared by reference
+        self._shared_path = None
+
+    @classmethod
+    def from_array(cls, array, dir=None) -> "SharedArray":
+        """
+        Copy an array into a new memory-mapped file.
+
+        Parameters
+        ----------
+        array: array-like
+            Array to copy.
+
+        dir: str, default=None
+            Directory of the file.
+            By default, /dev/shm if it exists, the temporary directory
+            otherwise.
+
+        Returns
+        -------
+        SharedArray
+            A C-contiguous copy of the array in the memory-mapped file.
+        """
+        array = np.ascontiguousarray(array)
+        if array.dtype.hasobject:
+            raise ValueError("Arrays of Python objects cannot be shared")
+        if array.size == 0:
+            raise ValueError("Empty arrays cannot be shared")
+
+        if dir is None and os.path.isdir("/dev/shm"):
+            dir = "/dev/shm"
+        fd, path = tempfile.mkstemp(prefix="eckity_", suffix=".npy", dir=dir)
+        os.close(fd)
+
+        shared = cls(path, dtype=array.dtype, mode="w+", shape=array.shape)
+        shared[...] = array
+        shared.flush()
+        shared._shared_path = path
+        return shared
+
+    def release(self) -> None:
+        """
+        Delete the file of the array.
+        Must be called once, by the process that created the array.
+        Existing views of the array remain valid (except on Windows,
+        where the file cannot be deleted while it is mapped), but the
+        array must not be sent to other processes afterwards.
+        """
+        if self._shared_path is None:
+            raise ValueError("Only the array that owns a file can release it")
+        try:
+            os.remove(self._shared_path)
+        except OSError as e:
+            logger.warning(
+                "Could not delete shared array file %s: %s",
+                self._shared_path,
+                e,
+            )
+        self._shared_path = None
+
+    def __reduce__(self):
+        if self._shared_path is None:
+            return np.asarray(self).__reduce__()
+        return _attach, (self._shared_path, self.shape, self.dtype.str)
+
+
+def _attach(path, shape, dtype) -> SharedArray:
+    shared = _attached.get(path)
+    if shared is None or shared.shape != shape:
+        shared = SharedArray(
+            path, dtype=np.dtype(dtype), mode="r", shape=shape
+        )
+        shared._shared_path = path
+        _attached[path] = shared
+    return shared
@@ -1,5 +1,7 @@
 from sklearn.utils.validation import check_is_fitted, check_X_y
 
+from eckity.sklearn_compatible.shared_array import SharedArray
+
 
 class SklearnWrapper:
     """
@@ -22,7 +24,7 @@ class SklearnWrapper:
                  algorithm):
         self.algorithm = algorithm
 
-    def fit(self, X, y=None):
+    def fit(self, X, y=None, shared_memory=False):
         """
        Run evolutionary algorithm.
        Use `fit` in a sklearn setting.
@@ -32,6 +34,11 @@ class SklearnWrapper:
             The training input samples.
         y : array-like of shape (n_samples,) or (n_samples, n_outputs)
             The target values (real numbers).
+        shared_memory : bool, default=False
+            Place X and y in shared memory (see SharedArray) during the
+            evolution, so the worker processes of a process executor
+            use zero-copy views instead of their own copies of the data.
+            The evaluators are given back the original X and y afterwards.
         Returns
         -------
         self : SklearnWrapper
@@ -40,13 +47,27 @@ class SklearnWrapper:
         # Check that X and y have correct shape
         X, y = check_X_y(X, y)
 
-        for sub_pop in self.algorithm.population.sub_populations:
-            sub_pop.evaluator.set_context((X, y))
+        if not shared_memory:
+            self._set_context((X, y))
+            self.algorithm.evolve()
+        else:
+            X_shared = SharedArray.from_array(X)
+            y_shared = SharedArray.from_array(y)
+            try:
+                self._set_context((X_shared, y_shared))
+                self.algorithm.evolve()
+            finally:
+                self._set_context((X, y))
+                X_shared.release()
+                y_shared.release()
 
-        self.algorithm.evolve()
         self.is_fitted_ = True
         return self
 
+    def _set_context(self, context):
+        for sub_pop in self.algorithm.population.sub_populations:
+            sub_pop.evaluator.set_context(context)
+
     def predict(self, X):
         """
         Compute output using best evolved individual.
@@ -0,0 +1,88 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from eckity.algorithms import SimpleEvolution
+from eckity.base.untyped_functions import f_add, f_mul, f_sub
+from eckity.creators import FullCreator
+from eckity.genetic_operators import SubtreeCrossover, SubtreeMutation
+from eckity.sklearn_compatible import (
+    RegressionEvaluator,
+    SharedArray,
+    SKRegressor,
+)
+from eckity.subpopulation import Subpopulation
+
+
+def column_sums(array):
+    return array.sum(axis=0), array.flags.writeable
+
+
+class TestSharedArray:
+    def test_pickle_by_reference(self):
+        array = np.arange(300, dtype=float).reshape(100, 3)
+        shared = SharedArray.from_array(array)
+        try:
+            # the pickled array only holds the file path
+            assert len(pickle.dumps(shared)) < array.nbytes
+            attached = pickle.loads(pickle.dumps(shared))
+            assert np.array_equal(attached, array)
+            assert not attached.flags.writeable
+
+            # slices are pickled by value
+            column = pickle.loads(pickle.dumps(shared[:, 1]))
+            assert np.array_equal(column, array[:, 1])
+        finally:
+            shared.release()
+
+    def test_worker_process(self):
+        array = np.arange(12, dtype=float).reshape(4, 3)
+        shared = SharedArray.from_array(array)
+        try:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(column_sums, shared)
+                sums, writeable = future.result()
+        finally:
+            shared.release()
+        assert np.array_equal(sums, array.sum(axis=0))
+        assert not writeable
+
+    def test_release(self):
+        shared = SharedArray.from_array(np.ones(3))
+        path = shared._shared_path
+        assert os.path.exists(path)
+        shared.release()
+        assert not os.path.exists(path)
+        # existing views stay valid
+        assert shared.sum() == 3
+        with pytest.raises(ValueError):
+            shared.release()
+
+    def test_fit_shared_memory(self):
+        X = np.random.RandomState(0).rand(50, 2)
+        y = X[:, 0] * X[:, 1]
+        evaluator = RegressionEvaluator()
+        algo = SimpleEvolution(
+            Subpopulation(
+                evaluator,
+                creators=FullCreator(
+                    init_depth=(2, 3),
+                    function_set=[f_add, f_mul, f_sub],
+                    terminal_set=["x0", "x1"],
+                ),
+                operators_sequence=[SubtreeCrossover(), SubtreeMutation()],
+                population_size=10,
+                higher_is_better=False,
+            ),
+            executor="process",
+            max_workers=2,
+            max_generation=2,
+            random_seed=0,
+        )
+        SKRegressor(algo).fit(X, y, shared_memory=True)
+        # the evaluator is given back the original (regular) arrays
+        assert type(evaluator.X) is np.ndarray
+        assert algo.best_of_run_.fitness.is_fitness_evaluated()
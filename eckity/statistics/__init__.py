@@ -3,3 +3,4 @@ from .best_average_worst_statistics import BestAverageWorstStatistics
 from .minimal_print_statistics import MinimalPrintStatistics
 from .best_avg_worst_size_tree_statistics import \
     BestAverageWorstSizeTreeStatistics
+from .columnar_statistics import ColumnarStatistics
@@ -0,0 +1,325 @@
+"""
+This module implements the ColumnarStatistics class.
+"""
+
+import os
+from time import perf_counter
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from eckity.background_writer import BackgroundWriter, atomic_write
+from eckity.statistics.statistics import Statistics
+
+FORMATS = ["csv", "npz", "parquet"]
+
+
+class ColumnarStatistics(Statistics):
+    """
+    Concrete Statistics class.
+    Records numeric statistics of every sub-population in columns,
+    instead of formatting and logging them every generation.
+
+    Every sampled generation adds a row per sub-population, with the
+    columns:
+
+    - generation, sub_population
+    - time: seconds since the first generation of the run was recorded,
+      and generation_time: seconds since the previous generation
+    - evaluated: number of individuals evaluated in the generation
+    - best, worst, mean, std, min, max of the pure fitness scores
+      (best_<i>, worst_<i>, mean_<i>, std_<i>, min_<i>, max_<i> of every
+      objective, n_fronts and first_front_size in multi-objective
+      evolution)
+    - size_mean, size_std, size_min, size_max, depth_mean, depth_max
+      (of tree individuals)
+
+    The rows are written into preallocated NumPy arrays, which are
+    flushed to `path` every `buffer_size` rows (and when the evolution
+    finishes) by a background thread, so the evolution does not wait
+    for the file system. CSV files are appended to, while NPZ and
+    Parquet files are rewritten with all the rows of the run.
+    Parquet files require pyarrow (or fastparquet).
+
+    Parameters
+    ----------
+    path: str, default=None
+        output file. None to keep the statistics in memory only
+        (see `as_dict` and `to_dataframe`).
+
+    file_format: str, default=None
+        "csv", "npz" or "parquet". By default, the format is taken from
+        the extension of `path`.
+
+    interval: int, default=1
+        number of generations between recorded generations
+        (the last generation of the run is always recorded)
+
+    buffer_size: int, default=100
+        number of rows written to the file at once
+
+    asynchronous: bool, default=True
+        write the rows in a background thread
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        file_format: Optional[str] = None,
+        interval: int = 1,
+        buffer_size: int = 100,
+        asynchronous: bool = True,
+    ):
+        super().__init__(format_string=None)
+        if file_format is None and path is not None:
+            file_format = os.path.splitext(path)[1].lstrip(".").lower()
+        if path is not None and file_format not in FORMATS:
+            raise ValueError(
+                f"file_format must be one of {FORMATS}, got {file_format}"
+            )
+        if interval < 1:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if buffer_size < 1:
+            raise ValueError(
+                f"buffer_size must be positive, got {buffer_size}"
+            )
+
+        self.path = path
+        self.file_format = file_format
+        self.interval = interval
+        self.buffer_size = buffer_size
+
+        self._columns: List[str] = []
+        self._buffer: Dict[str, np.ndarray] = {}
+        self._n_rows = 0
+        # flushed rows of the run (every row is kept for `as_dict`)
+        self._batches: List[Dict[str, np.ndarray]] = []
+        self._start_time = None
+        self._last_time = None
+        self._last_recorded = None
+        self._finished = True
+        self._writer = BackgroundWriter(asynchronous)
+
+    def write_statistics(self, sender, data_dict):
+        """
+        Record the statistics of the generation if it is sampled.
+        Registered to the `after_generation` event of the algorithm.
+        """
+        if self._finished:
+            self._reset()
+
+        now = perf_counter()
+        generation_time = (
+            now - self._last_time if self._last_time is not None else np.nan
+        )
+        self._last_time = now
+        if self._start_time is None:
+            self._start_time = now
+
+        gen = sender.generation_num
+        if gen % self.interval != 0:
+            return
+        self._record(sender, gen, now - self._start_time, generation_time)
+
+    def flush_statistics(self, sender=None, data_dict=None):
+        """
+        Record the last generation (if it was not sampled), and write the
+        remaining rows. Registered to the `evolution_finished` event of
+        the algorithm.
+
+        Raises
+        ------
+        OSError
+            if writing the rows failed
+        """
+        if not self._finished:
+            gen = getattr(sender, "generation_num", None)
+            if (
+                sender is not None
+                and self._last_recorded != gen
+                and self._last_time is not None
+            ):
+                self._record(
+                    sender, gen, self._last_time - self._start_time, np.nan
+                )
+            self._flush_buffer()
+            self._finished = True
+        self._writer.join()
+
+    def columns(self) -> List[str]:
+        """
+        Return the column names, in order.
+        """
+        return list(self._columns)
+
+    def as_dict(self) -> Dict[str, np.ndarray]:
+        """
+        Return the recorded rows of the run (including rows not written
+        yet) as a column array per column name.
+        """
+        batches = self._batches + [self._buffered()]
+        return {
+            column: np.concatenate([batch[column] for batch in batches])
+            for column in self._columns
+        }
+
+    def to_dataframe(self):
+        """
+        Return the recorded rows of the run as a pandas DataFrame.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.as_dict(), columns=self._columns)
+
+    def _reset(self) -> None:
+        self._writer.join()
+        self._columns = []
+        self._buffer = {}
+        self._n_rows = 0
+        self._batches = []
+        self._start_time = None
+        self._last_time = None
+        self._last_recorded = None
+        self._finished = False
+
+    def _record(self, sender, gen, time, generation_time) -> None:
+        evaluated = getattr(
+            getattr(sender, "population_evaluator", None),
+            "n_evaluated",
+            np.nan,
+        )
+        rows = []
+        for index, sub_pop in enumerate(sender.population.sub_populations):
+            row = {
+                "generation": gen,
+                "sub_population": index,
+                "time": time,
+                "generation_time": generation_time,
+                "evaluated": evaluated,
+            }
+            row.update(_fitness_statistics(sub_pop))
+            if sub_pop.individuals and hasattr(
+                sub_pop.individuals[0], "depth"
+            ):
+                row.update(_tree_statistics(sub_pop.individuals))
+            rows.append(row)
+
+        if not self._columns:
+            # the columns of the first recorded generation
+            columns = {}
+            for row in rows:
+                columns.update(dict.fromkeys(row))
+            self._columns = list(columns)
+            self._buffer = {
+                column: np.empty(self.buffer_size) for column in self._columns
+            }
+
+        for row in rows:
+            if self._n_rows == self.buffer_size:
+                self._flush_buffer()
+            for column in self._columns:
+                self._buffer[column][self._n_rows] = row.get(column, np.nan)
+            self._n_rows += 1
+        self._last_recorded = gen
+
+    def _buffered(self) -> Dict[str, np.ndarray]:
+        return {
+            column: self._buffer[column][: self._n_rows].copy()
+            for column in self._columns
+        }
+
+    def _flush_buffer(self) -> None:
+        if not self._columns:
+            return
+        batch = self._buffered()
+        first = not self._batches
+        self._batches.append(batch)
+        self._n_rows = 0
+        if self.path is None:
+            return
+
+        if self.file_format == "csv":
+            args = (batch, first)
+        else:
+            # the whole run is rewritten
+            args = (self.as_dict(), True)
+        self._writer.submit(self._write, *args)
+
+    def _write(self, columns: Dict[str, np.ndarray], first: bool) -> None:
+        if self.file_format == "csv":
+            with open(self.path, "w" if first else "a") as f:
+                if first:
+                    f.write(",".join(self._columns) + "\n")
+                np.savetxt(
+                    f,
+                    np.column_stack(
+                        [columns[column] for column in self._columns]
+                    ),
+                    delimiter=",",
+                    fmt="%.17g",
+                )
+        elif self.file_format == "npz":
+            atomic_write(self.path, lambda f: np.savez(f, **columns))
+        else:
+            import pandas as pd
+
+            frame = pd.DataFrame(columns, columns=self._columns)
+            atomic_write(self.path, frame.to_parquet)
+
+
+def _fitness_statistics(sub_pop) -> Dict[str, float]:
+    individuals = sub_pop.individuals
+    if not individuals:
+        return {}
+    pure = [ind.get_pure_fitness() for ind in individuals]
+
+    if not isinstance(pure[0], (list, tuple, np.ndarray)):
+        scores = np.asarray(pure, dtype=float)
+        # best and worst by the augmented fitness, as in the breeder
+        summary = sub_pop.get_fitness_summary()
+        return {
+            "best": summary.best.get_pure_fitness(),
+            "worst": summary.worst.get_pure_fitness(),
+            "mean": scores.mean(),
+            "std": scores.std(),
+            "min": scores.min(),
+            "max": scores.max(),
+        }
+
+    # multi-objective fitness: a column per objective
+    objectives = np.asarray(pure, dtype=float)
+    higher_is_better = individuals[0].fitness.higher_is_better
+    if isinstance(higher_is_better, bool):
+        higher_is_better = [higher_is_better] * objectives.shape[1]
+    mins, maxs = objectives.min(axis=0), objectives.max(axis=0)
+    means, stds = objectives.mean(axis=0), objectives.std(axis=0)
+    row = {}
+    for i, hib in enumerate(higher_is_better):
+        row[f"best_{i}"] = maxs[i] if hib else mins[i]
+        row[f"worst_{i}"] = mins[i] if hib else maxs[i]
+        row[f"mean_{i}"] = means[i]
+        row[f"std_{i}"] = stds[i]
+        row[f"min_{i}"] = mins[i]
+        row[f"max_{i}"] = maxs[i]
+
+    ranks = np.array(
+        [getattr(ind.fitness, "front_rank", np.inf) for ind in individuals],
+        dtype=float,
+    )
+    ranked = ranks[np.isfinite(ranks)]
+    row["n_fronts"] = ranked.max() if ranked.size else np.nan
+    row["first_front_size"] = np.count_nonzero(ranks == 1)
+    return row
+
+
+def _tree_statistics(individuals) -> Dict[str, float]:
+    sizes = np.array([ind.size() for ind in individuals], dtype=float)
+    depths = np.array([ind.depth() for ind in individuals], dtype=float)
+    return {
+        "size_mean": sizes.mean(),
+        "size_std": sizes.std(),
+        "size_min": sizes.min(),
+        "size_max": sizes.max(),
+        "depth_mean": depths.mean(),
+        "depth_max": depths.max(),
+    }
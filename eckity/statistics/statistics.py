@@ -40,3 +40,23 @@ class Statistics(ABC):
         None.
         """
         pass
+
+    def flush_statistics(self, sender, data_dict):
+        """
+        Write any statistics information that was not written yet.
+        Called when the evolution finishes.
+        Does nothing by default.
+
+        Parameters
+        ----------
+        sender: object
+            The object that this statistics provides information about.
+
+        data_dict: dict(str, object)
+            Relevant data to the statistics.
+
+        Returns
+        -------
+        None.
+        """
+        pass
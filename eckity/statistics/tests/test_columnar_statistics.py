@@ -0,0 +1,122 @@
+import csv
+
+import numpy as np
+import pytest
+
+from eckity.algorithms import SimpleEvolution
+from eckity.base.untyped_functions import f_add, f_mul
+from eckity.creators import FullCreator, GABitStringVectorCreator
+from eckity.evaluators import SimpleIndividualEvaluator
+from eckity.genetic_operators import (
+    BitStringVectorFlipMutation,
+    SubtreeMutation,
+    TournamentSelection,
+    VectorKPointsCrossover,
+)
+from eckity.subpopulation import Subpopulation
+
+from ..columnar_statistics import ColumnarStatistics
+
+
+class OneMaxEvaluator(SimpleIndividualEvaluator):
+    def evaluate_individual(self, individual):
+        return sum(individual.vector)
+
+
+class TreeSizeEvaluator(SimpleIndividualEvaluator):
+    def evaluate_individual(self, individual):
+        return individual.size()
+
+
+def make_algorithm(statistics, max_generation=7):
+    return SimpleEvolution(
+        Subpopulation(
+            OneMaxEvaluator(),
+            creators=GABitStringVectorCreator(length=20),
+            operators_sequence=[
+                VectorKPointsCrossover(probability=0.7, k=1),
+                BitStringVectorFlipMutation(probability=0.2),
+            ],
+            selection_methods=[
+                (
+                    TournamentSelection(
+                        tournament_size=3, higher_is_better=True
+                    ),
+                    1,
+                )
+            ],
+            population_size=20,
+            higher_is_better=True,
+        ),
+        max_generation=max_generation,
+        random_seed=0,
+        statistics=statistics,
+    )
+
+
+@pytest.mark.parametrize("extension", ["csv", "npz"])
+def test_write_columns(tmp_path, extension):
+    path = str(tmp_path / f"statistics.{extension}")
+    statistics = ColumnarStatistics(path, buffer_size=3)
+    algo = make_algorithm(statistics)
+    algo.evolve()
+
+    data = statistics.as_dict()
+    assert data["generation"].tolist() == list(range(1, 8))
+    assert (data["best"] >= data["mean"]).all()
+    assert (data["mean"] >= data["worst"]).all()
+    assert data["best"][-1] == algo.best_of_run_.get_pure_fitness()
+    assert (data["evaluated"] > 0).all()
+
+    if extension == "csv":
+        with open(path) as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == statistics.columns()
+        written = np.array(rows[1:], dtype=float)
+        assert np.array_equal(written[:, 0], data["generation"])
+    else:
+        with np.load(path) as written:
+            assert np.array_equal(written["best"], data["best"])
+
+
+def test_sampling_interval():
+    statistics = ColumnarStatistics(interval=3)
+    make_algorithm(statistics).evolve()
+    # the last generation is always recorded
+    assert statistics.as_dict()["generation"].tolist() == [3, 6, 7]
+
+    # a new run starts new columns
+    make_algorithm(statistics, max_generation=3).evolve()
+    assert statistics.as_dict()["generation"].tolist() == [3]
+
+
+def test_tree_columns():
+    statistics = ColumnarStatistics()
+    SimpleEvolution(
+        Subpopulation(
+            TreeSizeEvaluator(),
+            creators=FullCreator(
+                init_depth=(2, 3),
+                function_set=[f_add, f_mul],
+                terminal_set=["x", "y"],
+            ),
+            operators_sequence=[SubtreeMutation(probability=0.5)],
+            population_size=10,
+        ),
+        max_generation=2,
+        random_seed=1,
+        statistics=statistics,
+    ).evolve()
+
+    data = statistics.as_dict()
+    # the fitness is the tree size (minimized)
+    assert np.array_equal(data["size_min"], data["best"])
+    assert np.array_equal(data["size_max"], data["worst"])
+    assert (data["depth_max"] >= 2).all()
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        ColumnarStatistics("statistics.txt")
+    with pytest.raises(ValueError):
+        ColumnarStatistics(interval=0)
@@ -1,9 +1,8 @@
 import logging
 import random
 
-import numpy as np
-
 from eckity.creators.creator import Creator
+from eckity.fitness.fitness_summary import FitnessSummary
 from eckity.genetic_operators import TournamentSelection
 
 logger = logging.getLogger(__name__)
@@ -135,8 +134,18 @@ class Subpopulation:
                 "Try increasing elitism_rate."
             )
 
+        self._fitness_summary = None
         self.individuals = individuals
 
+    @property
+    def individuals(self):
+        return self._individuals
+
+    @individuals.setter
+    def individuals(self, individuals):
+        self._individuals = individuals
+        self.invalidate_fitness_summary()
+
     def create_subpopulation_individuals(self):
         if self.individuals is None:
             # Select one creator to generate individuals,
@@ -156,26 +165,38 @@ class Subpopulation:
     def get_selection_methods(self):
         return self._selection_methods
 
+    def get_fitness_summary(self):
+        """
+        Return the fitness summary of the individuals (best, worst and
+        average fitness), computed once per generation.
+
+        Returns
+        -------
+        FitnessSummary
+            fitness summary of the current individuals
+        """
+        if self._fitness_summary is None:
+            self._fitness_summary = FitnessSummary(
+                self.individuals, self.higher_is_better
+            )
+        return self._fitness_summary
+
+    def invalidate_fitness_summary(self):
+        """
+        Discard the fitness summary. Must be called when the individuals
+        or their fitness scores change (replacing the individuals list
+        calls it automatically).
+        """
+        self._fitness_summary = None
+
     def get_best_individual(self):
-        sorted_inds = sorted(
-            self.individuals,
-            key=lambda ind: ind.get_augmented_fitness(),
-            reverse=self.higher_is_better,
-        )
-        return sorted_inds[0]
+        return self.get_fitness_summary().best
 
     def get_worst_individual(self):
-        sorted_inds = sorted(
-            self.individuals,
-            key=lambda ind: ind.get_augmented_fitness(),
-            reverse=not self.higher_is_better,
-        )
-        return sorted_inds[0]
+        return self.get_fitness_summary().worst
 
     def get_average_fitness(self):
-        return np.mean(
-            [indiv.get_pure_fitness() for indiv in self.individuals]
-        )
+        return self.get_fitness_summary().mean
 
     def contains_individual(self, individual):
         return individual in self.individuals
@@ -0,0 +1,64 @@
+from eckity.creators.ga_creators.simple_vector_creator import GAVectorCreator
+from eckity.evaluators.simple_individual_evaluator import SimpleIndividualEvaluator
+from eckity.genetic_encodings.ga.float_vector import FloatVector
+from eckity.genetic_operators.mutations.vector_random_mutation import (
+    FloatVectorUniformNPointMutation,
+)
+from eckity.genetic_operators.selections.tournament_selection import TournamentSelection
+from eckity.multi_objective_evolution.crowding_termination_checker import (
+    CrowdingTerminationChecker,
+)
+from eckity.multi_objective_evolution.nsga2_breeder import NSGA2Breeder
+from eckity.multi_objective_evolution.nsga2_evolution import NSGA2Evolution
+from eckity.multi_objective_evolution.nsga2_fitness import NSGA2Fitness
+from eckity.population import Population
+from eckity.statistics import ColumnarStatistics
+from eckity.subpopulation import Subpopulation
+
+
+class SquaresEvaluator(SimpleIndividualEvaluator):
+    def evaluate_individual(self, individual):
+        return [sum(x ** 2 for x in individual.vector),
+                sum((x - 2) ** 2 for x in individual.vector)]
+
+
+def test_objective_columns():
+    statistics = ColumnarStatistics()
+    algo = NSGA2Evolution(
+        Population([
+            Subpopulation(
+                creators=GAVectorCreator(
+                    length=2,
+                    bounds=(-4, 4),
+                    fitness_type=NSGA2Fitness,
+                    vector_type=FloatVector,
+                ),
+                population_size=20,
+                evaluator=SquaresEvaluator(),
+                higher_is_better=False,
+                operators_sequence=[
+                    FloatVectorUniformNPointMutation(probability=0.5, n=1)
+                ],
+                selection_methods=[
+                    (TournamentSelection(tournament_size=2, higher_is_better=True), 1)
+                ],
+            )
+        ]),
+        breeder=NSGA2Breeder(),
+        termination_checker=CrowdingTerminationChecker(0.01),
+        executor="thread",
+        max_workers=1,
+        max_generation=3,
+        random_seed=0,
+        statistics=statistics,
+    )
+    algo.evolve()
+
+    data = statistics.as_dict()
+    assert data["generation"].tolist() == [1, 2, 3]
+    for i in range(2):
+        # both objectives are minimized
+        assert (data[f"best_{i}"] == data[f"min_{i}"]).all()
+        assert (data[f"worst_{i}"] == data[f"max_{i}"]).all()
+    assert (data["first_front_size"] >= 1).all()
+    assert (data["n_fronts"] >= 1).all()
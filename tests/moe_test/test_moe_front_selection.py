@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from eckity.creators.ga_creators.simple_vector_creator import GAVectorCreator
@@ -7,7 +8,11 @@ from eckity.genetic_encodings.ga.float_vector import FloatVector
 
 from eckity.genetic_operators.selections.tournament_selection import TournamentSelection
 from eckity.multi_objective_evolution.nsga2_fitness import NSGA2Fitness
-from eckity.multi_objective_evolution.nsga2_front_sorting import NSGA2FrontSorting
+from eckity.multi_objective_evolution.nsga2_front_sorting import (
+    NSGA2FrontSorting,
+    crowding_distances,
+    non_dominated_sort,
+)
 
 from eckity.population import Population
 from eckity.subpopulation import Subpopulation
@@ -77,21 +82,18 @@ class TestNSGA2FrontSelection:
 
     def test_pareto_front_finding_pop_is_1(self):
         self._init_pop([[1, 1]])
-        self.selection._init_domination_dict(self.sub_pop.individuals)
-        pareto_front = self.selection._pareto_front_finding(self.sub_pop.individuals)
+        pareto_front = self.selection._sort_fronts(self.sub_pop.individuals)[0]
         assert pareto_front[0].fitness.fitness == [1, 1]
 
     def test_pareto_front_finding_pop_is_2(self):
         self._init_pop([[1, 1], [2, 2]])
-        self.selection._init_domination_dict(self.sub_pop.individuals)
-        pareto_front = self.selection._pareto_front_finding(self.sub_pop.individuals)
+        pareto_front = self.selection._sort_fronts(self.sub_pop.individuals)[0]
         assert len(pareto_front) == 1
         assert pareto_front[0].fitness.fitness == [2, 2]
 
     def test_pareto_front_finding_pop_is_151(self):
         self._init_pop([[k, k] for k in range(151)])
-        self.selection._init_domination_dict(self.sub_pop.individuals)
-        pareto_front = self.selection._pareto_front_finding(self.sub_pop.individuals)
+        pareto_front = self.selection._sort_fronts(self.sub_pop.individuals)[0]
         assert len(pareto_front) == 1
         assert pareto_front[0].fitness.fitness == [150, 150]
 
@@ -99,10 +101,7 @@ class TestNSGA2FrontSelection:
         pop = [[4, 1], [3, 2], [3, 3], [2, 3], [2, 4]]
         expected_front = [[4, 1], [3, 3], [2, 4]]
         self._init_pop(pop)
-        self.selection._init_domination_dict(self.sub_pop.individuals)
-        actual_pareto_front = self.selection._pareto_front_finding(
-            self.sub_pop.individuals
-        )
+        actual_pareto_front = self.selection._sort_fronts(self.sub_pop.individuals)[0]
         self.check_same_front(actual_pareto_front, expected_front)
 
     def check_same_front(self, actual, expected):
@@ -117,10 +116,7 @@ class TestNSGA2FrontSelection:
         pop = [[4.1, 1.1], [3.3, 2.5], [3.3, 3.3], [2, 3], [2, 4.5]]
         expected_front = [[4.1, 1.1], [3.3, 3.3], [2, 4.5]]
         self._init_pop(pop)
-        self.selection._init_domination_dict(self.sub_pop.individuals)
-        actual_pareto_front = self.selection._pareto_front_finding(
-            self.sub_pop.individuals
-        )
+        actual_pareto_front = self.selection._sort_fronts(self.sub_pop.individuals)[0]
         self.check_same_front(actual_pareto_front, expected_front)
 
     def test_select_two_fronts(self):
@@ -147,3 +143,56 @@ class TestNSGA2FrontSelection:
         self._init_pop(pop)
         self.selection.select_for_population(self.pop, size)
         self.check_same_front(self.sub_pop.individuals, [[1, 5]])
+
+    def test_select_three_objectives(self):
+        pop = [[1, 2, 3], [3, 2, 1], [1, 1, 1], [0, 0, 0], [2, 2, 2]]
+        self._init_pop(pop)
+        fronts = self.selection._sort_fronts(self.sub_pop.individuals)
+        self.check_same_front(fronts[0], [[1, 2, 3], [3, 2, 1], [2, 2, 2]])
+        self.check_same_front(fronts[1], [[1, 1, 1]])
+        self.check_same_front(fronts[2], [[0, 0, 0]])
+
+
+def _pairwise_ranks(objectives):
+    """front ranks by comparing every pair of rows (minimization)"""
+    remaining = set(range(len(objectives)))
+    ranks = np.zeros(len(objectives), dtype=int)
+    rank = 0
+    while remaining:
+        front = [
+            i
+            for i in remaining
+            if not any(
+                (objectives[j] <= objectives[i]).all()
+                and (objectives[j] < objectives[i]).any()
+                for j in remaining
+            )
+        ]
+        ranks[front] = rank
+        remaining -= set(front)
+        rank += 1
+    return ranks
+
+
+@pytest.mark.parametrize("n_objectives", [1, 2, 3, 4])
+def test_non_dominated_sort(n_objectives):
+    rng = np.random.default_rng(n_objectives)
+    # few distinct values, to have many ties and duplicates
+    objectives = rng.integers(0, 4, size=(80, n_objectives)).astype(float)
+    assert (
+        non_dominated_sort(objectives) == _pairwise_ranks(objectives)
+    ).all()
+
+
+def test_crowding_distances_duplicates():
+    objectives = np.array(
+        [[0, 4], [1, 2], [1, 2], [2, 1], [4, 0], [0, 4]], dtype=float
+    )
+    expected = [np.inf, 1.25, 1.25, 1.25, np.inf, np.inf]
+    assert crowding_distances(objectives).tolist() == expected
+
+    # the distances do not depend on the order of the rows
+    order = [3, 5, 0, 2, 4, 1]
+    assert crowding_distances(objectives[order]).tolist() == [
+        expected[i] for i in order
+    ]
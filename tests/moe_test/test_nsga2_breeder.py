@@ -0,0 +1,93 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from eckity.creators.ga_creators.simple_vector_creator import GAVectorCreator
+from eckity.evaluators import SimplePopulationEvaluator
+from eckity.evaluators.simple_individual_evaluator import SimpleIndividualEvaluator
+from eckity.genetic_encodings.ga.float_vector import FloatVector
+from eckity.genetic_operators.mutations.vector_random_mutation import (
+    FloatVectorUniformNPointMutation,
+)
+from eckity.genetic_operators.selections.tournament_selection import TournamentSelection
+from eckity.multi_objective_evolution.nsga2_breeder import NSGA2Breeder
+from eckity.multi_objective_evolution.nsga2_fitness import NSGA2Fitness
+from eckity.population import Population
+from eckity.subpopulation import Subpopulation
+
+
+class CountingEval(SimpleIndividualEvaluator):
+    def __init__(self):
+        super().__init__()
+        self.evaluated = []
+
+    def evaluate_individual(self, individual):
+        self.evaluated.append(individual)
+        return list(individual.vector)
+
+
+class TestNSGA2Breeder:
+    def _init_pop(self, n):
+        evaluator = CountingEval()
+        sub_pop = Subpopulation(
+            creators=GAVectorCreator(
+                length=2,
+                bounds=(-4, 4),
+                fitness_type=NSGA2Fitness,
+                vector_type=FloatVector,
+            ),
+            population_size=n,
+            evaluator=evaluator,
+            higher_is_better=False,
+            operators_sequence=[
+                FloatVectorUniformNPointMutation(probability=0.5, n=1)
+            ],
+            selection_methods=[
+                (TournamentSelection(tournament_size=2, higher_is_better=True), 1)
+            ],
+        )
+        pop = Population([sub_pop])
+        pop.create_population_individuals()
+        return pop, evaluator
+
+    def test_parents_keep_fitness(self):
+        random.seed(0)
+        pop, evaluator = self._init_pop(20)
+        population_evaluator = SimplePopulationEvaluator()
+        executor = ThreadPoolExecutor(max_workers=1)
+        population_evaluator.set_executor(executor)
+        population_evaluator.act(pop)
+        parents = {
+            ind.id: list(ind.get_pure_fitness())
+            for ind in pop.sub_populations[0].individuals
+        }
+
+        NSGA2Breeder().breed(pop)
+        pool = pop.sub_populations[0].individuals
+        clones = pool[:20]
+        offspring = pool[20:40]
+
+        # parents are carried into the pool with their objectives
+        for ind in clones:
+            assert ind.get_pure_fitness() == parents[ind.cloned_from[-1]]
+            assert ind.fitness.reusable
+        changed = [
+            ind for ind in offspring if not ind.fitness.is_fitness_evaluated()
+        ]
+        assert 0 < len(changed) < len(offspring)
+        assert not any(ind.fitness.reusable for ind in changed)
+        assert all(
+            ind.fitness.reusable for ind in offspring if ind not in changed
+        )
+
+        # only the changed offspring (and the selected clones, which do
+        # not carry a fitness score) are evaluated
+        evaluator.evaluated.clear()
+        population_evaluator.act(pop)
+        executor.shutdown()
+        evaluated_ids = {ind.id for ind in evaluator.evaluated}
+        assert {ind.id for ind in changed} <= evaluated_ids
+        assert not evaluated_ids & {ind.id for ind in clones}
+        assert all(ind.fitness.is_fitness_evaluated() for ind in pool)
+        assert all(
+            ind.get_pure_fitness() == list(ind.vector) for ind in pool
+        )
@@ -0,0 +1,49 @@
+import os
+import pickle
+
+import pytest
+
+from eckity.background_writer import BackgroundWriter, atomic_write
+
+
+def test_writes_in_order():
+    written = []
+    writer = BackgroundWriter()
+    for i in range(5):
+        writer.submit(written.append, i)
+    writer.join()
+    assert written == list(range(5))
+
+
+@pytest.mark.parametrize("asynchronous", [True, False])
+def test_error_is_raised(asynchronous):
+    def fail():
+        raise OSError("disk full")
+
+    writer = BackgroundWriter(asynchronous)
+    with pytest.raises(OSError):
+        writer.submit(fail)
+        writer.join()
+    # the error is raised once
+    writer.join()
+
+
+def test_pickle():
+    writer = BackgroundWriter()
+    writer.submit(lambda: None)
+    assert pickle.loads(pickle.dumps(writer)).asynchronous
+
+
+def test_atomic_write_keeps_previous_file(tmp_path):
+    path = str(tmp_path / "data.bin")
+    atomic_write(path, lambda f: f.write(b"first"))
+
+    def fail(f):
+        f.write(b"partial")
+        raise OSError("interrupted")
+
+    with pytest.raises(OSError):
+        atomic_write(path, fail)
+    with open(path, "rb") as f:
+        assert f.read() == b"first"
+    assert os.listdir(tmp_path) == ["data.bin"]
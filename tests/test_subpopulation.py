@@ -1,4 +1,6 @@
 import logging
+from eckity.fitness import SimpleFitness
+from eckity.genetic_encodings.ga import BitStringVector
 from eckity.subpopulation import Subpopulation
 from eckity.creators import FullCreator
 from eckity.genetic_operators import IdentityTransformation
@@ -21,3 +23,32 @@ def test_zero_elites_warnning(caplog):
         )
     assert len(caplog.records) == 1
     assert "elitism_rate" in caplog.text
+
+
+def test_fitness_summary():
+    sub_pop = Subpopulation(
+        SymbolicRegressionEvaluator(),
+        creators=FullCreator(
+            function_set=[lambda x: x],
+            terminal_set=['x'],
+        ),
+        operators_sequence=[IdentityTransformation()],
+        population_size=4,
+        higher_is_better=True,
+    )
+    individuals = [
+        BitStringVector(SimpleFitness(score, higher_is_better=True), length=0)
+        for score in [2, 5, 1, 5]
+    ]
+    sub_pop.individuals = individuals
+
+    summary = sub_pop.get_fitness_summary()
+    assert sub_pop.get_fitness_summary() is summary
+    assert sub_pop.get_best_individual() is individuals[1]
+    assert sub_pop.get_worst_individual() is individuals[2]
+    assert sub_pop.get_average_fitness() == 3.25
+    assert summary.top(3) == [individuals[1], individuals[3], individuals[0]]
+
+    # replacing the individuals discards the summary
+    sub_pop.individuals = individuals[:1]
+    assert sub_pop.get_best_individual() is individuals[0]